@@ -4,12 +4,22 @@ and playing board games.
 """
 
 from cynmeith import utils
+from cynmeith.core.attacks import (
+    AttackPattern,
+    BlockedLeaper,
+    Leaper,
+    ScreenedSlider,
+    Slider,
+)
+from cynmeith.core.bitboards import BitboardOccupancy
 from cynmeith.core.board import Board, BoardSimulation
+from cynmeith.core.board_storage import BoardStorage, FlatStorage, GridStorage
 from cynmeith.core.config import Config
 from cynmeith.core.game import FreeTurnPolicy, Game, QuotaTurnPolicy, TurnPolicy
 from cynmeith.core.game_systems import (
     ActionPointSystem,
     EliminatePieceCondition,
+    EvaluationContext,
     GameOutcome,
     MaterialScoreSystem,
     MoveLimitDrawCondition,
@@ -24,6 +34,8 @@ from cynmeith.core.game_systems import (
     TwoStagePhaseSystem,
     WinCondition,
 )
+from cynmeith.core.geometry import BoardGeometry
+from cynmeith.core.move_codec import MoveCodec, MoveList
 from cynmeith.core.move_effects import (
     EffectPresets,
     MoveEffect,
@@ -42,6 +54,7 @@ from cynmeith.core.royal_rules import (
     RoyalSafetyMoveManager,
     RoyalStalemateCondition,
 )
+from cynmeith.core.zobrist import ZobristTable
 from cynmeith.utils.aliases import ConfigError
 
 __author__ = "Tran Van Duy"
@@ -51,11 +64,20 @@ __all__ = [
     "ConfigError",
     "EffectPresets",
     "ActionPointSystem",
+    "AttackPattern",
+    "BlockedLeaper",
+    "BitboardOccupancy",
+    "BoardGeometry",
     "BoardSimulation",
+    "BoardStorage",
     "EliminatePieceCondition",
+    "EvaluationContext",
+    "FlatStorage",
     "FreeTurnPolicy",
     "Game",
     "GameOutcome",
+    "GridStorage",
+    "Leaper",
     "MaterialScoreSystem",
     "MoveEffect",
     "MovePieceEffect",
@@ -69,10 +91,14 @@ __all__ = [
     "ReachSquareCondition",
     "RemovePieceEffect",
     "ResourceSystem",
+    "MoveCodec",
     "MoveHistory",
+    "MoveList",
     "MoveManager",
     "QuotaTurnPolicy",
     "ScoringSystem",
+    "ScreenedSlider",
+    "Slider",
     "PieceFactory",
     "RoyalCheckmateCondition",
     "RoyalRuleset",
@@ -83,6 +109,7 @@ __all__ = [
     "TurnPolicy",
     "TwoStagePhaseSystem",
     "WinCondition",
+    "ZobristTable",
     "utils",
 ]
 __version__ = "1.0.0"
@@ -3,12 +3,22 @@ The core module contains the core classes and functions
 of the CynMeith package.
 """
 
+from cynmeith.core.attacks import (
+    AttackPattern,
+    BlockedLeaper,
+    Leaper,
+    ScreenedSlider,
+    Slider,
+)
+from cynmeith.core.bitboards import BitboardOccupancy
 from cynmeith.core.board import Board, BoardSimulation
+from cynmeith.core.board_storage import BoardStorage, FlatStorage, GridStorage
 from cynmeith.core.config import Config
 from cynmeith.core.game import FreeTurnPolicy, Game, QuotaTurnPolicy, TurnPolicy
 from cynmeith.core.game_systems import (
     ActionPointSystem,
     EliminatePieceCondition,
+    EvaluationContext,
     GameOutcome,
     MaterialScoreSystem,
     MoveLimitDrawCondition,
@@ -23,6 +33,8 @@ from cynmeith.core.game_systems import (
     TwoStagePhaseSystem,
     WinCondition,
 )
+from cynmeith.core.geometry import BoardGeometry
+from cynmeith.core.move_codec import MoveCodec, MoveList
 from cynmeith.core.move_effects import PlacePieceEffect
 from cynmeith.core.move_history import MoveHistory
 from cynmeith.core.move_manager import MoveManager
@@ -34,18 +46,30 @@ from cynmeith.core.royal_rules import (
     RoyalSafetyMoveManager,
     RoyalStalemateCondition,
 )
+from cynmeith.core.zobrist import ZobristTable
 
 __all__ = [
     "Board",
+    "BitboardOccupancy",
+    "BoardGeometry",
     "BoardSimulation",
+    "BoardStorage",
     "Config",
     "ActionPointSystem",
+    "AttackPattern",
+    "BlockedLeaper",
     "EliminatePieceCondition",
+    "EvaluationContext",
+    "FlatStorage",
     "FreeTurnPolicy",
     "Game",
     "GameOutcome",
+    "GridStorage",
+    "Leaper",
     "MaterialScoreSystem",
+    "MoveCodec",
     "MoveHistory",
+    "MoveList",
     "MoveLimitDrawCondition",
     "MoveManager",
     "NoLegalMovesCondition",
@@ -62,9 +86,12 @@ __all__ = [
     "RoyalSafetyMoveManager",
     "RoyalStalemateCondition",
     "ScoringSystem",
+    "ScreenedSlider",
+    "Slider",
     "StaticPhaseSystem",
     "TurnCountPhaseSystem",
     "TurnPolicy",
     "TwoStagePhaseSystem",
     "WinCondition",
+    "ZobristTable",
 ]
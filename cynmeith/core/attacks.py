@@ -0,0 +1,267 @@
+"""
+Declarative attack patterns for reverse attack detection.
+
+A piece class lists how it attacks in `Piece.attack_patterns`. To decide
+whether a square is attacked, `RoyalRuleset.is_square_attacked` asks each
+pattern to scan *outward from the target* for a matching attacker, so the
+cost grows with the number of rays rather than with the number of enemy
+pieces times their path lengths.
+
+Offsets and directions are written from the attacker's point of view (the
+step the attacker takes to reach the target); the patterns reverse them
+when scanning.
+
+Patterns also report their *dependencies*: the squares where a single move
+by the defending side (vacating one square, occupying another) could
+change whether the target is attacked. Royal-safety checks use them to
+skip simulating moves that cannot affect the royal piece.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Mapping
+
+from cynmeith.utils.aliases import PieceSymbol, Side2
+from cynmeith.utils.coord import Coord
+
+if TYPE_CHECKING:
+    from cynmeith.core.board import BoardLike
+    from cynmeith.core.piece import Piece
+
+
+AttackFilter = Callable[["Piece", Coord], bool]
+"""Extra condition on an attacker, given the attacker and the target."""
+
+
+def _reversed(deltas: Iterable[Coord]) -> tuple[Coord, ...]:
+    return tuple(Coord(-delta.r, -delta.c) for delta in deltas)
+
+
+def _iter_ray_pieces(
+    board: BoardLike, start: Coord, step: Coord, limit: int
+) -> Iterator[tuple[list[Coord], Piece]]:
+    """
+    Walk from `start` along `step`, yielding each of the first `limit`
+    pieces together with every square walked so far (the piece's included).
+    """
+    walked: list[Coord] = []
+    for position in board.ray(start, step):
+        walked.append(position)
+        piece = board._get_raw(position)
+        if piece is not None:
+            yield walked, piece
+            limit -= 1
+            if not limit:
+                return
+
+
+class AttackPattern(ABC):
+    """
+    One way a piece attacks a square.
+
+    `when`, if given, is checked against each candidate attacker and the
+    target, for rules that depend on where the attacker stands (e.g. a
+    soldier that has crossed the river) or where it lands (e.g. a palace).
+    """
+
+    def __init__(self, when: AttackFilter | None = None) -> None:
+        self.when = when
+
+    @abstractmethod
+    def attacks(
+        self, board: BoardLike, target: Coord, by_side: Side2, symbol: PieceSymbol
+    ) -> bool:
+        """
+        Whether a `symbol` piece of `by_side` attacks `target` this way.
+        """
+
+    @abstractmethod
+    def iter_dependencies(
+        self, board: BoardLike, target: Coord, by_side: Side2, symbol: PieceSymbol
+    ) -> Iterator[Coord]:
+        """
+        Yield the squares a defending move must touch to change `attacks`.
+
+        A move by the other side that neither leaves nor lands on any of
+        these squares cannot create or remove an attack of this kind.
+        """
+
+    def _is_attacker(
+        self,
+        piece: Piece | None,
+        target: Coord,
+        by_side: Side2,
+        symbol: PieceSymbol,
+    ) -> bool:
+        return (
+            piece is not None
+            and piece.side == by_side
+            and piece.symbol.upper() == symbol
+            and (self.when is None or self.when(piece, target))
+        )
+
+
+class Leaper(AttackPattern):
+    """
+    Attacks the squares a fixed offset away, regardless of what lies between.
+
+    `offsets` is either one set of offsets for both sides or a mapping from
+    side to offsets (e.g. pawn captures).
+    """
+
+    def __init__(
+        self,
+        offsets: Iterable[Coord] | Mapping[Side2, Iterable[Coord]],
+        when: AttackFilter | None = None,
+    ) -> None:
+        super().__init__(when)
+        if isinstance(offsets, Mapping):
+            self._sources = {side: _reversed(offsets[side]) for side in (True, False)}
+        else:
+            sources = _reversed(offsets)
+            self._sources = {True: sources, False: sources}
+
+    def attacks(
+        self, board: BoardLike, target: Coord, by_side: Side2, symbol: PieceSymbol
+    ) -> bool:
+        for source in board.leaps(target, self._sources[by_side]):
+            if self._is_attacker(board._get_raw(source), target, by_side, symbol):
+                return True
+        return False
+
+    def iter_dependencies(
+        self, board: BoardLike, target: Coord, by_side: Side2, symbol: PieceSymbol
+    ) -> Iterator[Coord]:
+        # The defender can only remove a leaper by capturing it; landing on
+        # an empty source square never creates one.
+        for source in board.leaps(target, self._sources[by_side]):
+            if self._is_attacker(board._get_raw(source), target, by_side, symbol):
+                yield source
+
+
+class Slider(AttackPattern):
+    """
+    Attacks along each direction up to and including the first piece.
+    """
+
+    def __init__(
+        self, directions: Iterable[Coord], when: AttackFilter | None = None
+    ) -> None:
+        super().__init__(when)
+        self._steps = _reversed(directions)
+
+    def attacks(
+        self, board: BoardLike, target: Coord, by_side: Side2, symbol: PieceSymbol
+    ) -> bool:
+        for step in self._steps:
+            for position in board.ray(target, step):
+                piece = board._get_raw(position)
+                if piece is not None:
+                    if self._is_attacker(piece, target, by_side, symbol):
+                        return True
+                    break
+        return False
+
+    def iter_dependencies(
+        self, board: BoardLike, target: Coord, by_side: Side2, symbol: PieceSymbol
+    ) -> Iterator[Coord]:
+        # An attacker first on the ray is a check: every square up to it can
+        # block or capture. An attacker second on the ray pins the first
+        # piece, whose departure would expose the target.
+        for step in self._steps:
+            pinned: Coord | None = None
+            for walked, piece in _iter_ray_pieces(board, target, step, 2):
+                if self._is_attacker(piece, target, by_side, symbol):
+                    if pinned is None:
+                        yield from walked
+                    else:
+                        yield pinned
+                    break
+                pinned = walked[-1]
+
+
+class ScreenedSlider(AttackPattern):
+    """
+    Attacks along each direction by jumping exactly one screen piece, like
+    the xiangqi Cannon.
+    """
+
+    def __init__(
+        self, directions: Iterable[Coord], when: AttackFilter | None = None
+    ) -> None:
+        super().__init__(when)
+        self._steps = _reversed(directions)
+
+    def attacks(
+        self, board: BoardLike, target: Coord, by_side: Side2, symbol: PieceSymbol
+    ) -> bool:
+        for step in self._steps:
+            screened = False
+            for position in board.ray(target, step):
+                piece = board._get_raw(position)
+                if piece is not None:
+                    if screened:
+                        if self._is_attacker(piece, target, by_side, symbol):
+                            return True
+                        break
+                    screened = True
+        return False
+
+    def iter_dependencies(
+        self, board: BoardLike, target: Coord, by_side: Side2, symbol: PieceSymbol
+    ) -> Iterator[Coord]:
+        # One move shifts the attacker by at most one place in the ray's
+        # piece order, so only attackers among the first three pieces
+        # matter; every square up to such an attacker is a dependency.
+        for step in self._steps:
+            for walked, piece in _iter_ray_pieces(board, target, step, 3):
+                if self._is_attacker(piece, target, by_side, symbol):
+                    yield from walked
+                    break
+
+
+class BlockedLeaper(AttackPattern):
+    """
+    Leaper whose jump is blocked by a piece on a "leg" square, like the
+    xiangqi Horse and Elephant.
+
+    `moves` holds `(offset, leg)` pairs, both relative to the attacker.
+    """
+
+    def __init__(
+        self,
+        moves: Iterable[tuple[Coord, Coord]],
+        when: AttackFilter | None = None,
+    ) -> None:
+        super().__init__(when)
+        self._moves = tuple((Coord(-offset.r, -offset.c), leg) for offset, leg in moves)
+
+    def attacks(
+        self, board: BoardLike, target: Coord, by_side: Side2, symbol: PieceSymbol
+    ) -> bool:
+        for delta, leg in self._moves:
+            source = board.offset(target, delta)
+            if source is None or not self._is_attacker(
+                board._get_raw(source), target, by_side, symbol
+            ):
+                continue
+            leg_position = board.offset(source, leg)
+            if leg_position is not None and board._get_raw(leg_position) is None:
+                return True
+        return False
+
+    def iter_dependencies(
+        self, board: BoardLike, target: Coord, by_side: Side2, symbol: PieceSymbol
+    ) -> Iterator[Coord]:
+        # Capturing the attacker or filling / vacating its leg square.
+        for delta, leg in self._moves:
+            source = board.offset(target, delta)
+            if source is None or not self._is_attacker(
+                board._get_raw(source), target, by_side, symbol
+            ):
+                continue
+            yield source
+            leg_position = board.offset(source, leg)
+            if leg_position is not None:
+                yield leg_position
@@ -0,0 +1,57 @@
+"""
+Integer bitboards mirroring a board's occupancy.
+
+Bit `r * width + c` stands for cell `(r, c)`. Python integers are unbounded,
+so any board size works, but the masks stay a handful of machine words
+(and the operations cheapest) on small boards such as 8x8 or 9x10.
+`Board(config, bitboards=True)` keeps a `BitboardOccupancy` current from its
+single write path, so history undo/redo updates it too.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cynmeith.utils.aliases import PieceSymbol, Side2
+
+if TYPE_CHECKING:
+    from cynmeith.core.piece import Piece
+
+
+class BitboardOccupancy:
+    """
+    Occupancy masks for all pieces, per side, and per (upper-case symbol,
+    side) type.
+    """
+
+    def __init__(self) -> None:
+        self.occupied = 0
+        self.sides: dict[Side2, int] = {True: 0, False: 0}
+        self.types: dict[tuple[PieceSymbol, Side2], int] = {}
+
+    def update(self, index: int, previous: Piece | None, piece: Piece | None) -> None:
+        """
+        Replace `previous` with `piece` on the cell at row-major `index`.
+        """
+        bit = 1 << index
+        if previous is not None:
+            self.occupied &= ~bit
+            self.sides[previous.side] &= ~bit
+            key = (previous.symbol.upper(), previous.side)
+            self.types[key] &= ~bit
+        if piece is not None:
+            self.occupied |= bit
+            self.sides[piece.side] |= bit
+            key = (piece.symbol.upper(), piece.side)
+            self.types[key] = self.types.get(key, 0) | bit
+
+    def clear(self) -> None:
+        self.occupied = 0
+        self.sides = {True: 0, False: 0}
+        self.types = {}
+
+    def type_mask(self, piece_symbol: PieceSymbol, side: Side2 | None = None) -> int:
+        symbol = piece_symbol.upper()
+        if side is not None:
+            return self.types.get((symbol, side), 0)
+        return self.types.get((symbol, True), 0) | self.types.get((symbol, False), 0)
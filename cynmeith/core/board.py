@@ -1,12 +1,17 @@
 from collections.abc import Iterable
+from contextlib import contextmanager
 from copy import copy
-from typing import Callable, Iterable, Protocol
+from typing import Callable, Iterable, Iterator, Protocol
 
+from cynmeith.core.bitboards import BitboardOccupancy
+from cynmeith.core.board_storage import BoardStorage, Grid, GridStorage
 from cynmeith.core.config import Config
+from cynmeith.core.geometry import BoardGeometry
 from cynmeith.core.move_history import MoveHistory
 from cynmeith.core.move_manager import MoveManager
 from cynmeith.core.piece import Piece
 from cynmeith.core.piece_factory import PieceFactory, PieceFactoryLike
+from cynmeith.core.zobrist import DEFAULT_ZOBRIST_TABLE, ZobristTable
 from cynmeith.utils.aliases import (
     InvalidMoveError,
     Move,
@@ -21,6 +26,67 @@ from cynmeith.utils.aliases import (
 from cynmeith.utils.coord import Coord
 from cynmeith.utils.fen import fen_parser
 
+# Line kinds indexing `Board._line_counts`.
+_ROW, _COLUMN, _DIAGONAL1, _DIAGONAL2 = range(4)
+
+
+def _row_major(position: Coord) -> tuple[int, int]:
+    """
+    Sort key putting positions in the order `Board.iter_enumerate` visits
+    them.
+    """
+    return position.r, position.c
+
+
+def _line_slot(position: Coord, direction: Coord, width: int) -> tuple[int, int]:
+    """
+    Map the maximal line through `position` along `direction` to its
+    (line kind, line index) counter slot.
+
+    Rows are indexed by `r`, columns by `c`, main diagonals by
+    `r - c + width - 1` and anti-diagonals by `r + c`.
+    """
+    dr, dc = direction.r, direction.c
+    if dr == 0 and dc != 0:
+        return _ROW, position.r
+    if dc == 0 and dr != 0:
+        return _COLUMN, position.c
+    if dr == dc and dr != 0:
+        return _DIAGONAL1, position.r - position.c + width - 1
+    if dr == -dc and dr != 0:
+        return _DIAGONAL2, position.r + position.c
+    raise ValueError(f"direction must be a row, column or diagonal step: {direction}")
+
+
+def _is_maximal_line(
+    board: "Board | BoardSimulation", start: Coord, end: Coord, direction: Coord
+) -> bool:
+    """
+    True if `start`..`end` runs from board edge to board edge.
+    """
+    if start == end or not (board.is_in_bounds(start) and board.is_in_bounds(end)):
+        return False
+    before = Coord(-direction.r, -direction.c)
+    return board.offset(start, before) is None and board.offset(end, direction) is None
+
+
+def _line_mask(
+    board: "Board | BoardSimulation", start: Coord, end: Coord, inclusive: bool
+) -> int | None:
+    """
+    Bitmask of the cells strictly between two aligned in-bounds cells (plus
+    both ends if `inclusive`), or None when the cells are not aligned or
+    out of bounds. A zero-length line is empty either way, matching
+    `iter_positions_line`.
+    """
+    if not (board.is_in_bounds(start) and board.is_in_bounds(end)):
+        return None
+    mask = board.geometry.between_mask(start, end)
+    if mask is not None and inclusive and start != end:
+        width = board.width
+        mask |= 1 << (start.r * width + start.c) | 1 << (end.r * width + end.c)
+    return mask
+
 
 class Board:
     """
@@ -28,6 +94,14 @@ class Board:
     interface for managing game state.
 
     It provides methods for placing, removing, and moving pieces.
+
+    Cells are held by a `BoardStorage` backend chosen at construction:
+    `GridStorage` (nested lists, the default) or `FlatStorage` (one flat
+    list indexed by `r * width + c`).
+
+    With `bitboards=True` the board also keeps a `BitboardOccupancy`
+    mirror, and occupancy predicates (`is_empty`, `is_empty_line`,
+    `is_enemy`, `count_pieces_line`, ...) become mask operations.
     """
 
     def __init__(
@@ -35,13 +109,31 @@ class Board:
         config: Config,
         move_manager: type[MoveManager] = MoveManager,
         move_history: type[MoveHistory] = MoveHistory,
+        storage: type[BoardStorage] = GridStorage,
+        bitboards: bool = False,
     ) -> None:
         self.config = config
         self.width = config.width
         self.height = config.height
-        self.board: list[list[Piece | None]] = [
-            [None for _ in range(self.width)] for _ in range(self.height)
-        ]
+        self.storage = storage(self.width, self.height)
+        # Shared per-size tables; coords[r * width + c] is Coord(r, c).
+        self.geometry = BoardGeometry.for_size(self.width, self.height)
+        self.coords: tuple[Coord, ...] = self.geometry.coords
+        # Occupied positions, kept current by `_write_cell`. The type index
+        # is keyed by (upper-case symbol, side).
+        self._side_index: dict[Side2, set[Coord]] = {True: set(), False: set()}
+        self._type_index: dict[tuple[PieceSymbol, Side2], set[Coord]] = {}
+        # Occupancy per row, column, main diagonal and anti-diagonal, also
+        # kept current by `_write_cell`. See `_line_slot` for the indexing.
+        self._line_counts = self._empty_line_counts()
+        # Zobrist hash of the cells, with each cell's current contribution
+        # kept so a write can XOR it back out.
+        self.zobrist: ZobristTable = DEFAULT_ZOBRIST_TABLE
+        self.position_hash = 0
+        self._cell_hashes = [0] * (self.width * self.height)
+        self.bitboards: BitboardOccupancy | None = (
+            BitboardOccupancy() if bitboards else None
+        )
 
         self.factory = PieceFactory()
         self.factory.register_pieces(config)
@@ -49,10 +141,21 @@ class Board:
         self.manager = move_manager(self)
         self.history = move_history(self)
         self._state_listener: Callable[[], None] | None = None
+        # Idle simulations handed out by `simulate()`.
+        self._simulations: list[BoardSimulation] = []
 
         self._init_pieces()
         self.history.seed_current_state()
 
+    def _empty_line_counts(self) -> tuple[list[int], ...]:
+        diagonals = self.width + self.height - 1
+        return (
+            [0] * self.height,
+            [0] * self.width,
+            [0] * diagonals,
+            [0] * diagonals,
+        )
+
     def _init_pieces(self) -> None:
         grid = fen_parser(self.config.fen, self.config.width, self.config.height)
         for r, row in enumerate(grid):
@@ -61,6 +164,16 @@ class Board:
                     position = Coord(r, c)
                     self._set_at(position, self.factory.create_piece(piece, position))
 
+    @property
+    def board(self) -> Grid:
+        """
+        The cells as a `board[r][c]` grid.
+
+        With `GridStorage` these are the live rows; other backends return a
+        freshly built grid. Either way, mutate cells through `set_at`.
+        """
+        return self.storage.rows()
+
     def __str__(self) -> str:
         return "\n".join(
             " ".join(piece.symbol if piece else "□" for piece in row)
@@ -96,36 +209,119 @@ class Board:
 
         If none_piece is True, the iteration will also include empty positions.
         """
-        for row in self.board:
-            for piece in row:
-                if piece is not None or none_piece:
-                    yield piece
+        for piece in self.storage.values():
+            if piece is not None or none_piece:
+                yield piece
+
+    def iter_positions_by_side(self, side: Side2) -> Iterable[Coord]:
+        """
+        Iterate over the positions occupied by a side's pieces.
+
+        Served from the piece index, so the cost is proportional to the
+        number of matching pieces rather than the board area. Order is
+        unspecified.
+        """
+        return iter(tuple(self._side_index.get(side, ())))
+
+    def iter_positions_by_type(
+        self, piece_symbol: PieceSymbol, side: Side2 | None = None
+    ) -> Iterable[Coord]:
+        """
+        Iterate over the positions occupied by pieces of a type, optionally
+        restricted to one side. The symbol is matched case-insensitively.
+        Order is unspecified.
+        """
+        symbol = piece_symbol.upper()
+        sides: tuple[Side2, ...] = (True, False) if side is None else (side,)
+        positions: list[Coord] = []
+        for piece_side in sides:
+            positions.extend(self._type_index.get((symbol, piece_side), ()))
+        return iter(positions)
 
-    def iter_pieces_by_side(self, side: Side2) -> Iterable[Piece | None]:
+    def iter_pieces_by_side(self, side: Side2) -> Iterable[Piece]:
         """
-        Iterate over all pieces by side.
+        Iterate over all pieces by side, in row-major order.
         """
-        for piece in self.iter_pieces():
+        for position in sorted(self.iter_positions_by_side(side), key=_row_major):
+            piece = self.storage.get(position)
             assert piece is not None
-            if piece.side == side:
-                yield piece
+            yield piece
 
-    def iter_pieces_by_type(self, piece_symbol: PieceSymbol) -> Iterable[Piece | None]:
+    def iter_pieces_by_type(
+        self, piece_symbol: PieceSymbol, side: Side2 | None = None
+    ) -> Iterable[Piece]:
         """
-        Iterate over all pieces by type.
+        Iterate over all pieces by type, optionally restricted to one side,
+        in row-major order. Unlike `iter_positions_by_type`, the symbol must
+        match `piece.symbol` exactly.
         """
-        for piece in self.iter_pieces():
+        positions = self.iter_positions_by_type(piece_symbol, side)
+        for position in sorted(positions, key=_row_major):
+            piece = self.storage.get(position)
             assert piece is not None
             if piece.symbol == piece_symbol:
                 yield piece
 
+    def count_pieces(
+        self, side: Side2 | None = None, piece_symbol: PieceSymbol | None = None
+    ) -> int:
+        """
+        Count the pieces on the board, optionally filtered by side and/or type.
+
+        Constant time: the answer comes straight from the piece index.
+        """
+        sides: tuple[Side2, ...] = (True, False) if side is None else (side,)
+        if piece_symbol is None:
+            return sum(len(self._side_index[piece_side]) for piece_side in sides)
+        symbol = piece_symbol.upper()
+        return sum(
+            len(self._type_index.get((symbol, piece_side), ())) for piece_side in sides
+        )
+
     def iter_positions(self) -> Iterable[Coord]:
         """
         Iterate over all coordinates on the board.
         """
-        for r in range(self.height):
-            for c in range(self.width):
-                yield Coord(r, c)
+        return iter(self.coords)
+
+    def coord(self, r: int, c: int) -> Coord:
+        """
+        Get the interned coordinate for an in-bounds cell.
+        """
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            raise PositionError(f"Position out of bounds {Coord(r, c)}")
+        return self.coords[r * self.width + c]
+
+    def offset(self, position: Coord, delta: Coord) -> Coord | None:
+        """
+        Get the interned coordinate at `position + delta`, or None if it
+        falls off the board. Prefer this over `position + delta` followed
+        by `is_in_bounds` in candidate generation.
+        """
+        r = position.r + delta.r
+        c = position.c + delta.c
+        if 0 <= r < self.height and 0 <= c < self.width:
+            return self.coords[r * self.width + c]
+        return None
+
+    def _coord_at(self, r: int, c: int) -> Coord:
+        if 0 <= r < self.height and 0 <= c < self.width:
+            return self.coords[r * self.width + c]
+        return Coord(r, c)
+
+    def ray(self, position: Coord, direction: Coord) -> tuple[Coord, ...]:
+        """
+        Get the cells from `position` (exclusive) to the edge in `direction`,
+        nearest first, from the precomputed geometry tables.
+        """
+        return self.geometry.ray(position, direction)
+
+    def leaps(self, position: Coord, offsets: tuple[Coord, ...]) -> tuple[Coord, ...]:
+        """
+        Get the in-bounds cells at `position + offset` for each offset, from
+        the precomputed geometry tables. Pass a shared offsets tuple.
+        """
+        return self.geometry.leaps(position, offsets)
 
     def iter_enumerate(
         self, none_piece: bool = False
@@ -133,10 +329,9 @@ class Board:
         """
         Iterate over all pieces on the board with their positions.
         """
-        for r, row in enumerate(self.board):
-            for c, piece in enumerate(row):
-                if piece is not None or none_piece:
-                    yield Coord(r, c), piece
+        for position, piece in zip(self.iter_positions(), self.storage.values()):
+            if piece is not None or none_piece:
+                yield position, piece
 
     def iter_positions_line(
         self,
@@ -150,9 +345,13 @@ class Board:
         if not criteria(start, end):
             raise StopIteration
         direction = start.direction_unit(end)
-        while start != end + direction:
-            yield start
-            start += direction
+        dr, dc = direction.r, direction.c
+        r, c = start.r, start.c
+        stop_r, stop_c = end.r + dr, end.c + dc
+        while r != stop_r or c != stop_c:
+            yield self._coord_at(r, c)
+            r += dr
+            c += dc
 
     def iter_pieces_line(
         self,
@@ -192,9 +391,13 @@ class Board:
         """
         Iterate over all positions in a direction from a starting position.
         """
-        while self.is_in_bounds(start):
-            yield start
-            start += direction
+        width, height, coords = self.width, self.height, self.coords
+        dr, dc = direction.r, direction.c
+        r, c = start.r, start.c
+        while 0 <= r < height and 0 <= c < width:
+            yield coords[r * width + c]
+            r += dr
+            c += dc
 
     def iter_pieces_towards(
         self, start: Coord, direction: Coord
@@ -240,8 +443,28 @@ class Board:
         if not criteria(start, end):
             raise ValueError(f"Invalid line criteria between {start} and {end}")
 
+        if self.bitboards is not None:
+            line = _line_mask(self, start, end, inclusive=True)
+            if line is not None:
+                return (self.bitboards.occupied & line).bit_count()
+
+        direction = start.direction_unit(end)
+        if _is_maximal_line(self, start, end, direction):
+            return self.count_pieces_through(start, direction)
         return len(list(self.iter_pieces_line(start, end, criteria)))
 
+    def count_pieces_through(self, position: Coord, direction: Coord) -> int:
+        """
+        Count the pieces on the maximal line through `position` along
+        `direction` (row, column or either diagonal), in constant time.
+
+        Uses the same direction convention as `iter_enumerate_through`.
+        """
+        if not self.is_in_bounds(position):
+            raise PositionError(f"Position out of bounds {position}")
+        kind, index = _line_slot(position, direction, self.width)
+        return self._line_counts[kind][index]
+
     def iter_enumerate_through(
         self,
         position: Coord,
@@ -268,16 +491,16 @@ class Board:
             raise ValueError("direction must be non-zero")
 
         # Walk backwards to the line's start at the board edge.
-        start = position
-        while self.is_in_bounds(start - direction):
-            start = start - direction
-
-        cursor = start
-        while self.is_in_bounds(cursor):
-            piece = self.at(cursor)
+        dr, dc = direction.r, direction.c
+        r, c = position.r, position.c
+        while 0 <= r - dr < self.height and 0 <= c - dc < self.width:
+            r -= dr
+            c -= dc
+
+        for cursor in self.iter_positions_towards(self.coord(r, c), direction):
+            piece = self.storage.get(cursor)
             if piece is not None or none_piece:
                 yield cursor, piece
-            cursor = cursor + direction
 
     def iter_pieces_through(
         self,
@@ -306,41 +529,14 @@ class Board:
         if not self.is_in_bounds(position):
             raise PositionError(f"Position out of bounds {position}")
 
-        counts = {"row": 0, "column": 0, "diagonal1": 0, "diagonal2": 0}
-
-        # Count pieces in the row
-        counts["row"] = self.count_pieces_line(
-            Coord(position.r, 0), Coord(position.r, self.width - 1), Coord.is_orthogonal
-        )
-
-        # Count pieces in the column
-        counts["column"] = self.count_pieces_line(
-            Coord(0, position.c),
-            Coord(self.height - 1, position.c),
-            Coord.is_orthogonal,
-        )
-
-        # Count pieces in the first diagonal (top-left to bottom-right)
-        start_diag1 = Coord(
-            max(position.r - position.c, 0), max(position.c - position.r, 0)
-        )
-        end_diag1 = Coord(
-            min(position.r + (self.width - position.c - 1), self.height - 1),
-            min(position.c + (self.height - position.r - 1), self.width - 1),
-        )
-        counts["diagonal1"] = self.count_pieces_line(
-            start_diag1, end_diag1, Coord.is_diagonal
-        )
-
-        # Count pieces in the second diagonal (top-right to bottom-left)
-        s = position.r + position.c
-        start_diag2 = Coord(max(0, s - self.width + 1), min(s, self.width - 1))
-        end_diag2 = Coord(min(s, self.height - 1), max(0, s - self.height + 1))
-        counts["diagonal2"] = self.count_pieces_line(
-            start_diag2, end_diag2, Coord.is_diagonal
-        )
-
-        return counts
+        r, c = position.r, position.c
+        rows, columns, diagonals1, diagonals2 = self._line_counts
+        return {
+            "row": rows[r],
+            "column": columns[c],
+            "diagonal1": diagonals1[r - c + self.width - 1],
+            "diagonal2": diagonals2[r + c],
+        }
 
     def reset(self) -> None:
         """
@@ -355,10 +551,35 @@ class Board:
         """
         Clear the board.
         """
-        self.board = [[None for _ in range(self.width)] for _ in range(self.height)]
+        self.storage.clear()
+        self._side_index = {True: set(), False: set()}
+        self._type_index = {}
+        self._line_counts = self._empty_line_counts()
+        self.position_hash = 0
+        self._cell_hashes = [0] * (self.width * self.height)
+        if self.bitboards is not None:
+            self.bitboards.clear()
         self.history.clear()
         self._notify_state_listener()
 
+    @contextmanager
+    def simulate(self) -> Iterator["BoardSimulation"]:
+        """
+        Borrow a blank `BoardSimulation` of this board for the `with` block.
+
+        Simulations are pooled: on exit the overlay is cleared in place and
+        the simulation returns to the pool, so move-generation loops do not
+        allocate one per candidate. Neither the simulation nor any piece
+        read from it may be kept after the block.
+        """
+        pool = self._simulations
+        simulation = pool.pop() if pool else BoardSimulation(self)
+        try:
+            yield simulation
+        finally:
+            simulation.reset()
+            pool.append(simulation)
+
     def set_state_listener(self, listener: Callable[[], None] | None) -> None:
         """
         Register a callback invoked when public board reseeding operations occur.
@@ -375,7 +596,13 @@ class Board:
         """
         if not self.is_in_bounds(position):
             raise PositionError(f"Position out of bounds {position}")
-        return self.board[position.r][position.c]
+        return self.storage.get(position)
+
+    def _get_raw(self, position: Coord) -> Piece | None:
+        """
+        Read a cell without the bounds check, for in-bounds positions only.
+        """
+        return self.storage.get(position)
 
     def set_at(self, position: Coord, piece: Piece | None) -> None:
         """
@@ -395,8 +622,65 @@ class Board:
         """
         if not self.is_in_bounds(position):
             raise PositionError(f"Position out of bounds {position}")
-        self.history.record_cell_change(position, self.board[position.r][position.c])
-        self.board[position.r][position.c] = piece
+        self.history.record_cell_change(position, self.storage.get(position))
+        self._write_cell(position, piece)
+
+    def _write_cell(self, position: Coord, piece: Piece | None) -> None:
+        """
+        Store `piece` in an in-bounds cell without recording history.
+
+        This is the single write path into storage: `_set_at` and history
+        undo/redo both go through it, which keeps the piece index, the line
+        occupancy counters and `position_hash` current.
+        """
+        index = position.r * self.width + position.c
+        position = self.coords[index]
+        previous = self.storage.get(position)
+        if previous is not None:
+            self._side_index[previous.side].discard(position)
+            self._type_index[(previous.symbol.upper(), previous.side)].discard(position)
+        if piece is not None:
+            self._side_index[piece.side].add(position)
+            self._type_index.setdefault((piece.symbol.upper(), piece.side), set()).add(
+                position
+            )
+        if (previous is None) != (piece is None):
+            step = 1 if previous is None else -1
+            r, c = position.r, position.c
+            rows, columns, diagonals1, diagonals2 = self._line_counts
+            rows[r] += step
+            columns[c] += step
+            diagonals1[r - c + self.width - 1] += step
+            diagonals2[r + c] += step
+        cell_hash = self.cell_hash(index, piece)
+        self.position_hash ^= self._cell_hashes[index] ^ cell_hash
+        self._cell_hashes[index] = cell_hash
+        if self.bitboards is not None:
+            self.bitboards.update(index, previous, piece)
+        self.storage.set(position, piece)
+
+    def cell_hash(self, index: int, piece: Piece | None) -> int:
+        """
+        Zobrist key for `piece` standing on the cell at row-major `index`
+        (0 for an empty cell). Covers the symbol, side and `hash_state()`.
+        """
+        if piece is None:
+            return 0
+        return self.zobrist.key(index, piece.symbol, piece.side, piece.hash_state())
+
+    def rehash_cell(self, position: Coord) -> None:
+        """
+        Refresh the hash contribution of a cell whose piece changed in place.
+
+        Writes keep `position_hash` current on their own, but a piece that
+        mutates after being placed (e.g. `piece.move()` flipping
+        `has_moved`) needs its key recomputed. History calls this for every
+        cell a move touched.
+        """
+        index = position.r * self.width + position.c
+        cell_hash = self.cell_hash(index, self.storage.get(position))
+        self.position_hash ^= self._cell_hashes[index] ^ cell_hash
+        self._cell_hashes[index] = cell_hash
 
     def type_at(self, position: Coord) -> PieceClass | None:
         """
@@ -409,6 +693,15 @@ class Board:
         """
         Get the side of the piece at a given position, returns None if the position is empty.
         """
+        if self.bitboards is not None:
+            if not self.is_in_bounds(position):
+                raise PositionError(f"Position out of bounds {position}")
+            bit = 1 << (position.r * self.width + position.c)
+            if self.bitboards.sides[True] & bit:
+                return True
+            if self.bitboards.sides[False] & bit:
+                return False
+            return None
         piece = self.at(position)
         return piece.side if piece is not None else None
 
@@ -435,6 +728,10 @@ class Board:
         """
         Apply a move that has already been validated.
         """
+        if piece.immutable:
+            self._set_at(move.start, None)
+            self._set_at(move.end, piece.moved(move.end))
+            return
         self._set_at(move.start, None)
         self._set_at(move.end, piece)
         piece.move(move.end)
@@ -462,6 +759,11 @@ class Board:
         """
         Check if a position is empty.
         """
+        if self.bitboards is not None:
+            if not self.is_in_bounds(position):
+                raise PositionError(f"Position out of bounds {position}")
+            index = position.r * self.width + position.c
+            return not self.bitboards.occupied >> index & 1
         return self.at(position) is None
 
     def is_empty_line(
@@ -496,6 +798,10 @@ class Board:
         """
         if not (criteria(start, end)):
             return False
+        if self.bitboards is not None:
+            between = _line_mask(self, start, end, inclusive=False)
+            if between is not None:
+                return not self.bitboards.occupied & between
         for position in self.iter_positions_line(start, end, criteria):
             if position == start or position == end:
                 continue
@@ -525,12 +831,30 @@ class BoardLike(Protocol):
 
     def at(self, position: Coord) -> Piece | None: ...
 
+    def _get_raw(self, position: Coord) -> Piece | None: ...
+
     def _set_at(self, position: Coord, piece: Piece | None) -> None: ...
 
+    def offset(self, position: Coord, delta: Coord) -> Coord | None: ...
+
+    def ray(self, position: Coord, direction: Coord) -> tuple[Coord, ...]: ...
+
+    def leaps(
+        self, position: Coord, offsets: tuple[Coord, ...]
+    ) -> tuple[Coord, ...]: ...
+
     def iter_positions(self) -> Iterable[Coord]: ...
 
     def iter_enumerate(self) -> Iterable[tuple[Coord, Piece | None]]: ...
 
+    def iter_positions_by_side(self, side: Side2) -> Iterable[Coord]: ...
+
+    def iter_pieces_by_side(self, side: Side2) -> Iterable[Piece]: ...
+
+    def iter_positions_by_type(
+        self, piece_symbol: PieceSymbol, side: Side2 | None = None
+    ) -> Iterable[Coord]: ...
+
 
 class BoardSimulation:
     """
@@ -541,19 +865,65 @@ class BoardSimulation:
     cell. The first read of a non-empty cell promotes that cell into a
     sparse overlay holding a shallow copy of the piece, so subsequent
     mutations (e.g. `piece.move()`) cannot leak back to the real board.
-    Writes go straight into the overlay.
+    Writes go straight into the overlay. Pieces of an `immutable` type
+    are never copied: reads return the board's own piece.
 
     For workloads that touch only a handful of cells (royal safety),
     this avoids the O(board) deepcopy that the eager version paid on
     every move attempt.
+
+    `reset()` discards the overlay so the simulation can be reused; the
+    piece copies it made are then recycled for later copies of the same
+    class. Prefer `Board.simulate()`, which pools simulations this way.
     """
 
     def __init__(self, board: "Board") -> None:
         self.width = board.width
         self.height = board.height
+        self.geometry = board.geometry
+        self.coords = board.coords
         self.factory = board.factory
         self._underlying = board
         self._overlay: dict[Coord, Piece | None] = {}
+        # Occupancy bitmask with the overlay applied, rebuilt lazily after a
+        # write; only used when the underlying board keeps bitboards.
+        self._occupied: int | None = None
+        # Occupancy change per (line kind, line index) relative to the
+        # underlying board's counters.
+        self._line_deltas: dict[tuple[int, int], int] = {}
+        # Piece copies made since the last reset, and spare copies from
+        # earlier uses by piece class.
+        self._copies: list[Piece] = []
+        self._spare_copies: dict[type[Piece], list[Piece]] = {}
+
+    def reset(self) -> None:
+        """
+        Drop every simulated change, making the view match the underlying
+        board again. Pieces previously read from the simulation must no
+        longer be used.
+        """
+        self._overlay.clear()
+        self._line_deltas.clear()
+        self._occupied = None
+        spares = self._spare_copies
+        for piece in self._copies:
+            spares.setdefault(type(piece), []).append(piece)
+        self._copies.clear()
+
+    def _copy(self, piece: Piece) -> Piece:
+        """
+        Shallow-copy `piece`, recycling a spare copy of the same class.
+        """
+        spares = self._spare_copies.get(type(piece))
+        if spares:
+            piece_copy = spares.pop()
+            state = piece_copy.__dict__
+            state.clear()
+            state.update(piece.__dict__)
+        else:
+            piece_copy = copy(piece)
+        self._copies.append(piece_copy)
+        return piece_copy
 
     def _get_raw(self, position: Coord) -> Piece | None:
         """
@@ -564,26 +934,38 @@ class BoardSimulation:
         """
         if position in self._overlay:
             return self._overlay[position]
-        return self._underlying.board[position.r][position.c]
+        return self._underlying.storage.get(position)
 
     def at(self, position: Coord) -> Piece | None:
         if not self.is_in_bounds(position):
             raise ValueError(f"Position out of bounds {position}")
         if position in self._overlay:
             return self._overlay[position]
-        underlying = self._underlying.board[position.r][position.c]
-        if underlying is None:
-            return None
+        underlying = self._underlying.storage.get(position)
+        if underlying is None or underlying.immutable:
+            return underlying
         # Lazy copy: any access materialises a writable copy so callers
         # that mutate the returned piece (e.g. `piece.move()`) cannot
         # affect the real board.
-        piece_copy = copy(underlying)
+        piece_copy = self._copy(underlying)
         self._overlay[position] = piece_copy
         return piece_copy
 
     def _set_at(self, position: Coord, piece: Piece | None) -> None:
         if not self.is_in_bounds(position):
             raise ValueError(f"Position out of bounds {position}")
+        if (self._get_raw(position) is None) != (piece is None):
+            step = 1 if piece is not None else -1
+            r, c = position.r, position.c
+            deltas = self._line_deltas
+            for slot in (
+                (_ROW, r),
+                (_COLUMN, c),
+                (_DIAGONAL1, r - c + self.width - 1),
+                (_DIAGONAL2, r + c),
+            ):
+                deltas[slot] = deltas.get(slot, 0) + step
+            self._occupied = None
         self._overlay[position] = piece
 
     def set_at(self, position: Coord, piece: Piece | None) -> None:
@@ -592,7 +974,11 @@ class BoardSimulation:
     def _apply_move(self, move: Move, piece: Piece) -> None:
         # Always work on a copy so callers that hand us a piece sourced
         # from the real board don't have its state mutated by `move()`.
-        piece_copy = copy(piece)
+        if piece.immutable:
+            self._set_at(move.start, None)
+            self._set_at(move.end, piece.moved(move.end))
+            return
+        piece_copy = self._copy(piece)
         self._set_at(move.start, None)
         self._set_at(move.end, piece_copy)
         piece_copy.move(move.end)
@@ -626,9 +1012,25 @@ class BoardSimulation:
         return self.side_at(position) == side
 
     def iter_positions(self) -> Iterable[Coord]:
-        for r in range(self.height):
-            for c in range(self.width):
-                yield Coord(r, c)
+        return iter(self.coords)
+
+    def offset(self, position: Coord, delta: Coord) -> Coord | None:
+        r = position.r + delta.r
+        c = position.c + delta.c
+        if 0 <= r < self.height and 0 <= c < self.width:
+            return self.coords[r * self.width + c]
+        return None
+
+    def _coord_at(self, r: int, c: int) -> Coord:
+        if 0 <= r < self.height and 0 <= c < self.width:
+            return self.coords[r * self.width + c]
+        return Coord(r, c)
+
+    def ray(self, position: Coord, direction: Coord) -> tuple[Coord, ...]:
+        return self.geometry.ray(position, direction)
+
+    def leaps(self, position: Coord, offsets: tuple[Coord, ...]) -> tuple[Coord, ...]:
+        return self.geometry.leaps(position, offsets)
 
     def iter_enumerate(self) -> Iterable[tuple[Coord, Piece | None]]:
         # Read-only iteration: use raw refs to avoid lazy-copy overhead.
@@ -637,6 +1039,68 @@ class BoardSimulation:
             if piece is not None:
                 yield position, piece
 
+    @property
+    def position_hash(self) -> int:
+        """
+        Zobrist hash of the simulated cells: the underlying board's hash
+        with every overlay cell's contribution swapped for its own.
+        """
+        board = self._underlying
+        width = self.width
+        position_hash = board.position_hash
+        for position, piece in self._overlay.items():
+            index = position.r * width + position.c
+            position_hash ^= board._cell_hashes[index] ^ board.cell_hash(index, piece)
+        return position_hash
+
+    def _overlay_positions(
+        self, underlying: Iterable[Coord], matches: Callable[[Piece], bool]
+    ) -> Iterable[Coord]:
+        # The underlying index minus the cells the overlay shadows, plus
+        # the overlay cells holding a matching piece.
+        overlay = self._overlay
+        for position in underlying:
+            if position not in overlay:
+                yield position
+        for position, piece in list(overlay.items()):
+            if piece is not None and matches(piece):
+                yield position
+
+    def iter_positions_by_side(self, side: Side2) -> Iterable[Coord]:
+        return self._overlay_positions(
+            self._underlying.iter_positions_by_side(side),
+            lambda piece: piece.side == side,
+        )
+
+    def iter_positions_by_type(
+        self, piece_symbol: PieceSymbol, side: Side2 | None = None
+    ) -> Iterable[Coord]:
+        symbol = piece_symbol.upper()
+        return self._overlay_positions(
+            self._underlying.iter_positions_by_type(symbol, side),
+            lambda piece: piece.symbol.upper() == symbol
+            and (side is None or piece.side == side),
+        )
+
+    def iter_pieces_by_side(self, side: Side2) -> Iterable[Piece]:
+        for position in sorted(self.iter_positions_by_side(side), key=_row_major):
+            piece = self._get_raw(position)
+            assert piece is not None
+            yield piece
+
+    def count_pieces(
+        self, side: Side2 | None = None, piece_symbol: PieceSymbol | None = None
+    ) -> int:
+        if piece_symbol is not None:
+            return sum(1 for _ in self.iter_positions_by_type(piece_symbol, side))
+        if side is not None:
+            return sum(1 for _ in self.iter_positions_by_side(side))
+        return sum(
+            1
+            for piece_side in (True, False)
+            for _ in self.iter_positions_by_side(piece_side)
+        )
+
     def iter_positions_line(
         self,
         start: Coord,
@@ -646,14 +1110,22 @@ class BoardSimulation:
         if not criteria(start, end):
             raise StopIteration
         direction = start.direction_unit(end)
-        while start != end + direction:
-            yield start
-            start += direction
+        dr, dc = direction.r, direction.c
+        r, c = start.r, start.c
+        stop_r, stop_c = end.r + dr, end.c + dc
+        while r != stop_r or c != stop_c:
+            yield self._coord_at(r, c)
+            r += dr
+            c += dc
 
     def iter_positions_towards(self, start: Coord, direction: Coord) -> Iterable[Coord]:
-        while self.is_in_bounds(start):
-            yield start
-            start += direction
+        width, height, coords = self.width, self.height, self.coords
+        dr, dc = direction.r, direction.c
+        r, c = start.r, start.c
+        while 0 <= r < height and 0 <= c < width:
+            yield coords[r * width + c]
+            r += dr
+            c += dc
 
     def iter_pieces_line(
         self,
@@ -696,16 +1168,17 @@ class BoardSimulation:
         if direction.r == 0 and direction.c == 0:
             raise ValueError("direction must be non-zero")
 
-        start = position
-        while self.is_in_bounds(start - direction):
-            start = start - direction
+        dr, dc = direction.r, direction.c
+        r, c = position.r, position.c
+        while 0 <= r - dr < self.height and 0 <= c - dc < self.width:
+            r -= dr
+            c -= dc
 
-        cursor = start
-        while self.is_in_bounds(cursor):
+        start = self.coords[r * self.width + c]
+        for cursor in self.iter_positions_towards(start, direction):
             piece = self._get_raw(cursor)
             if piece is not None or none_piece:
                 yield cursor, piece
-            cursor = cursor + direction
 
     def iter_pieces_through(
         self,
@@ -716,6 +1189,20 @@ class BoardSimulation:
         for _, piece in self.iter_enumerate_through(position, direction, none_piece):
             yield piece
 
+    def _occupied_mask(self) -> int | None:
+        bitboards = self._underlying.bitboards
+        if bitboards is None:
+            return None
+        mask = self._occupied
+        if mask is None:
+            mask = bitboards.occupied
+            width = self.width
+            for position, piece in self._overlay.items():
+                bit = 1 << (position.r * width + position.c)
+                mask = mask | bit if piece is not None else mask & ~bit
+            self._occupied = mask
+        return mask
+
     def is_empty_line(
         self,
         start: Coord,
@@ -724,6 +1211,11 @@ class BoardSimulation:
     ) -> bool:
         if not criteria(start, end):
             return False
+        occupied = self._occupied_mask()
+        if occupied is not None:
+            between = _line_mask(self, start, end, inclusive=False)
+            if between is not None:
+                return not occupied & between
         for position in self.iter_positions_line(start, end, criteria):
             if position == start or position == end:
                 continue
@@ -739,39 +1231,31 @@ class BoardSimulation:
     ) -> int:
         if not criteria(start, end):
             raise ValueError(f"Invalid line criteria between {start} and {end}")
+        occupied = self._occupied_mask()
+        if occupied is not None:
+            line = _line_mask(self, start, end, inclusive=True)
+            if line is not None:
+                return (occupied & line).bit_count()
+        direction = start.direction_unit(end)
+        if _is_maximal_line(self, start, end, direction):
+            return self.count_pieces_through(start, direction)
         return len(list(self.iter_pieces_line(start, end, criteria)))
 
+    def count_pieces_through(self, position: Coord, direction: Coord) -> int:
+        slot = _line_slot(position, direction, self.width)
+        return self._underlying.count_pieces_through(
+            position, direction
+        ) + self._line_deltas.get(slot, 0)
+
     def count_pieces_from(self, position: Coord) -> dict[str, int]:
         if not self.is_in_bounds(position):
             raise ValueError(f"Position out of bounds {position}")
 
-        counts = {"row": 0, "column": 0, "diagonal1": 0, "diagonal2": 0}
-
-        counts["row"] = self.count_pieces_line(
-            Coord(position.r, 0), Coord(position.r, self.width - 1), Coord.is_orthogonal
-        )
-        counts["column"] = self.count_pieces_line(
-            Coord(0, position.c),
-            Coord(self.height - 1, position.c),
-            Coord.is_orthogonal,
-        )
-
-        start_diag1 = Coord(
-            max(position.r - position.c, 0), max(position.c - position.r, 0)
-        )
-        end_diag1 = Coord(
-            min(position.r + (self.width - position.c - 1), self.height - 1),
-            min(position.c + (self.height - position.r - 1), self.width - 1),
-        )
-        counts["diagonal1"] = self.count_pieces_line(
-            start_diag1, end_diag1, Coord.is_diagonal
-        )
-
-        s = position.r + position.c
-        start_diag2 = Coord(max(0, s - self.width + 1), min(s, self.width - 1))
-        end_diag2 = Coord(min(s, self.height - 1), max(0, s - self.height + 1))
-        counts["diagonal2"] = self.count_pieces_line(
-            start_diag2, end_diag2, Coord.is_diagonal
-        )
-
+        counts = self._underlying.count_pieces_from(position)
+        r, c = position.r, position.c
+        deltas = self._line_deltas
+        counts["row"] += deltas.get((_ROW, r), 0)
+        counts["column"] += deltas.get((_COLUMN, c), 0)
+        counts["diagonal1"] += deltas.get((_DIAGONAL1, r - c + self.width - 1), 0)
+        counts["diagonal2"] += deltas.get((_DIAGONAL2, r + c), 0)
         return counts
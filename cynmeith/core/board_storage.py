@@ -0,0 +1,123 @@
+"""
+Cell storage backends used by `Board`.
+
+A backend only knows how to read and write the piece held by each cell;
+bounds checks, history recording, and every higher-level query stay on
+`Board`. Pick a backend with `Board(config, storage=...)`.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from cynmeith.core.piece import Piece
+    from cynmeith.utils.coord import Coord
+
+
+Grid = list[list["Piece | None"]]
+
+
+class BoardStorage(ABC):
+    """
+    Holds the piece occupying each cell of a `width` x `height` board.
+
+    Positions handed to a backend are assumed to be in bounds.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+
+    @abstractmethod
+    def get(self, position: Coord) -> Piece | None:
+        pass
+
+    @abstractmethod
+    def set(self, position: Coord, piece: Piece | None) -> None:
+        pass
+
+    @abstractmethod
+    def values(self) -> Iterable[Piece | None]:
+        """
+        Iterate every cell in row-major order, including empty ones.
+        """
+
+    @abstractmethod
+    def rows(self) -> Grid:
+        """
+        Return the cells as a `grid[r][c]` nested list.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class GridStorage(BoardStorage):
+    """
+    Nested-list storage (`cells[r][c]`). This is the default backend.
+
+    `rows()` returns the live rows, so `Board.board` keeps behaving like
+    the plain nested list it used to be.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        super().__init__(width, height)
+        self.cells: Grid = []
+        self.clear()
+
+    def get(self, position: Coord) -> Piece | None:
+        return self.cells[position.r][position.c]
+
+    def set(self, position: Coord, piece: Piece | None) -> None:
+        self.cells[position.r][position.c] = piece
+
+    def values(self) -> Iterable[Piece | None]:
+        return chain.from_iterable(self.cells)
+
+    def rows(self) -> Grid:
+        return self.cells
+
+    def clear(self) -> None:
+        self.cells = [[None for _ in range(self.width)] for _ in range(self.height)]
+
+
+class FlatStorage(BoardStorage):
+    """
+    Single-list storage addressed by `index = r * width + c`.
+
+    Every read and write is one multiplication and one list index, which
+    is noticeably cheaper than the nested-list double lookup on the hot
+    paths (`at`, `_set_at`, `iter_enumerate`). `rows()` builds a fresh
+    grid on each call, so treat it as a read-only snapshot.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        super().__init__(width, height)
+        self.cells: list[Piece | None] = []
+        self.clear()
+
+    def index(self, position: Coord) -> int:
+        return position.r * self.width + position.c
+
+    def get(self, position: Coord) -> Piece | None:
+        return self.cells[position.r * self.width + position.c]
+
+    def set(self, position: Coord, piece: Piece | None) -> None:
+        self.cells[position.r * self.width + position.c] = piece
+
+    def values(self) -> Iterable[Piece | None]:
+        return iter(self.cells)
+
+    def rows(self) -> Grid:
+        width = self.width
+        return [
+            self.cells[start : start + width]
+            for start in range(0, width * self.height, width)
+        ]
+
+    def clear(self) -> None:
+        self.cells = [None] * (self.width * self.height)
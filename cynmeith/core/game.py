@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import random
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Hashable
 
 from cynmeith.core.board import Board
+from cynmeith.core.board_storage import BoardStorage, GridStorage
 from cynmeith.core.config import Config
 from cynmeith.core.game_systems import (
+    EvaluationContext,
     GameOutcome,
     PhaseSystem,
     ResourceSystem,
     ScoringSystem,
     WinCondition,
 )
+from cynmeith.core.move_codec import MoveCodec, MoveList
 from cynmeith.core.move_history import MoveHistory
 from cynmeith.core.move_manager import MoveManager
 from cynmeith.core.piece import Piece
@@ -29,7 +34,7 @@ from cynmeith.utils.aliases import (
 from cynmeith.utils.coord import Coord
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Iterable, Iterator, Mapping
 
 
 class TurnPolicy(ABC):
@@ -65,6 +70,16 @@ class TurnPolicy(ABC):
     def current_side(self) -> Side2 | None:
         pass
 
+    def hash_state(self) -> Hashable:
+        """
+        Turn state folded into `Game.position_hash`.
+
+        Defaults to the side to move. Policies with more state that decides
+        who may move next should include it, but leave out ever-increasing
+        counters so repeated positions still hash equal.
+        """
+        return self.current_side
+
 
 class FreeTurnPolicy(TurnPolicy):
     """
@@ -138,6 +153,9 @@ class QuotaTurnPolicy(TurnPolicy):
     def current_side(self) -> Side2:
         return self._state.side
 
+    def hash_state(self) -> Hashable:
+        return (self._state.side, self._state.moves_left)
+
 
 @dataclass(frozen=True)
 class GameStateSnapshot:
@@ -148,6 +166,12 @@ class GameStateSnapshot:
     outcome: GameOutcome | None
 
 
+# Undo token for `Game.push`: the same fields as `GameStateSnapshot`, kept as
+# a plain tuple to stay cheap on the search path. Subclasses with extra state
+# may extend it (see `Game._capture_push_token`).
+PushToken = tuple[Any, ...]
+
+
 class Game:
     """
     High-level game orchestration.
@@ -167,17 +191,22 @@ class Game:
         scoring_system: ScoringSystem | None = None,
         win_conditions: Iterable[WinCondition] | None = None,
         max_history: int | None = None,
+        storage: type[BoardStorage] = GridStorage,
+        bitboards: bool = False,
     ) -> None:
         self.config = config if isinstance(config, Config) else Config(config)
-        self.board = Board(self.config, move_manager, move_history)
+        self.board = Board(self.config, move_manager, move_history, storage, bitboards)
+        self.move_codec = MoveCodec(self.board.width, self.board.height)
         self.turn_policy = turn_policy or FreeTurnPolicy()
         self.phase_system = phase_system
         self.resource_system = resource_system
         self.scoring_system = scoring_system
         self.win_conditions = list(win_conditions or [])
         self._outcome: GameOutcome | None = None
-        self._state_snapshots: list[GameStateSnapshot] = []
+        self._state_snapshots: deque[GameStateSnapshot] = deque()
         self._redo_state_snapshots: list[GameStateSnapshot] = []
+        self._push_tokens: list[PushToken] = []
+        self._evaluation_context: EvaluationContext | None = None
         self._suspend_board_sync = False
         self._max_history = max_history
         self.board.history.set_max_history(max_history)
@@ -192,19 +221,43 @@ class Game:
         """
         Keep `_state_snapshots` aligned with the bounded board history.
 
-        The first entry is always the seed state, so the cap is
-        `max_history + 1` total entries.
+        Entry 0 pairs with the history's baseline, so the cap is
+        `max_history + 1` total entries. When the history folds its oldest
+        move into the baseline, the oldest snapshot goes with it.
         """
         if self._max_history is None:
             return
-        excess = len(self._state_snapshots) - (self._max_history + 1)
-        if excess > 0:
-            del self._state_snapshots[1 : 1 + excess]
+        while len(self._state_snapshots) > self._max_history + 1:
+            self._state_snapshots.popleft()
 
     @property
     def current_side(self) -> Side2 | None:
         return self.turn_policy.current_side
 
+    @property
+    def position_hash(self) -> int:
+        """
+        64-bit Zobrist key for the full game position: the board's
+        `position_hash` combined with the turn policy's `hash_state()`.
+        """
+        turn_key = self.board.zobrist.key("turn", self.turn_policy.hash_state())
+        return self.board.position_hash ^ turn_key
+
+    @property
+    def state_hash(self) -> int:
+        """
+        `position_hash` extended with the phase and resource systems'
+        `hash_state()`: a key for search tables, where positions whose
+        allowed moves differ through those systems must not share entries.
+        """
+        key = self.position_hash
+        zobrist = self.board.zobrist
+        if self.phase_system is not None:
+            key ^= zobrist.key("phase", self.phase_system.hash_state())
+        if self.resource_system is not None:
+            key ^= zobrist.key("resources", self.resource_system.hash_state())
+        return key
+
     @property
     def current_phase(self) -> str | None:
         if self.phase_system is None:
@@ -248,17 +301,43 @@ class Game:
         piece = self.board.manager.get_actor_piece(resolved_move)
         if piece is None:
             raise PieceError("No actor piece found for this move")
-        if not self.turn_policy.can_move(self, piece, resolved_move):
-            raise InvalidMoveError("Move is not allowed by the active turn policy.")
+        reason = self._rejection_reason(piece, resolved_move)
+        if reason is not None:
+            raise InvalidMoveError(reason)
+        return resolved_move, piece
+
+    def _rejection_reason(self, piece: Piece, move: Move) -> str | None:
+        """
+        Ask the turn, phase and resource systems about a resolved move.
+
+        Returns why the move is refused, or None if every system allows it.
+        """
+        if not self.turn_policy.can_move(self, piece, move):
+            return "Move is not allowed by the active turn policy."
         if self.phase_system is not None and not self.phase_system.can_move(
-            self, piece, resolved_move
+            self, piece, move
         ):
-            raise InvalidMoveError("Move is not allowed in the current phase.")
+            return "Move is not allowed in the current phase."
         if self.resource_system is not None and not self.resource_system.can_move(
-            self, piece, resolved_move
+            self, piece, move
         ):
-            raise InvalidMoveError("Move is not allowed by the active resource system.")
-        return resolved_move, piece
+            return "Move is not allowed by the active resource system."
+        return None
+
+    def _resolve_legal(self, move: Move) -> Move | None:
+        """
+        Resolve a move request once and run it past the game systems.
+
+        The non-raising counterpart of `_validate_move` (minus the game-over
+        check), used by bulk move generation.
+        """
+        resolved_move = self.board.manager.resolve_move(move)
+        if resolved_move is None:
+            return None
+        piece = self.board.manager.get_actor_piece(resolved_move)
+        if piece is None or self._rejection_reason(piece, resolved_move) is not None:
+            return None
+        return resolved_move
 
     def can_move(
         self,
@@ -280,30 +359,218 @@ class Game:
         move_type: MoveType = "",
         extra_info: MoveExtraInfo | None = None,
     ) -> None:
+        self._ensure_no_pushed_moves()
         resolved_move, piece = self._validate_move(start, end, move_type, extra_info)
 
         self.board.manager.apply_move(resolved_move, piece)
-        self.turn_policy.after_move(self, piece, resolved_move)
-        if self.phase_system is not None:
-            self.phase_system.after_move(self, piece, resolved_move)
-        if self.resource_system is not None:
-            self.resource_system.after_move(self, piece, resolved_move)
+        self._advance_game_systems(piece, resolved_move)
+        self.board.history.stamp_position(self.position_hash)
         self._outcome = self._evaluate_outcome()
         self._state_snapshots.append(self._capture_state_snapshot())
         self._redo_state_snapshots.clear()
         self._trim_state_snapshots()
 
+    def push(self, move: Move, validate: bool = True, evaluate: bool = False) -> None:
+        """
+        Make a move for search, to be taken back with `pop()`.
+
+        Unlike `move`, a push keeps only what `pop` needs: the touched cells
+        and the game systems' snapshots. It leaves the redo stack alone,
+        takes no outcome snapshot and skips `max_history` trimming. Win
+        conditions only run when `evaluate` is set; otherwise `outcome` is
+        None until the push is popped.
+
+        With `validate=False` the move must already be resolved by the
+        board's move manager, e.g. one returned by
+        `board.manager.resolve_move`; this skips resolving it again.
+
+        Pop every push before calling `move`, `undo_move` or `redo_move`.
+        """
+        if validate:
+            resolved_move, piece = self._validate_move(
+                move.start, move.end, move.move_type, move.extra_info
+            )
+        else:
+            actor = self.board.manager.get_actor_piece(move)
+            if actor is None:
+                raise PieceError("No actor piece found for this move")
+            resolved_move, piece = move, actor
+
+        token = self._capture_push_token()
+        self.board.history.begin_push()
+        try:
+            self.board.manager.apply_move(resolved_move, piece)
+        except BaseException:
+            self.board.history.abort_push()
+            raise
+        self._push_tokens.append(token)
+        self._advance_game_systems(piece, resolved_move)
+        self.board.history.stamp_position(self.position_hash)
+        self._outcome = self._evaluate_outcome() if evaluate else None
+
+    def pop(self) -> Move:
+        """
+        Take back the most recent `push` and return the move it applied.
+        """
+        if not self._push_tokens:
+            raise MoveHistoryError("No pushed move to pop.")
+        move = self.board.history.pop_move()
+        self._restore_push_token(self._push_tokens.pop())
+        return move
+
+    def evaluate_outcome(self) -> GameOutcome | None:
+        """
+        Run the win conditions now and store the result as `outcome`, as
+        `push(..., evaluate=True)` would have. Lets a push made with
+        `evaluate=False` be evaluated later, e.g. after `random_legal_move`
+        has settled whether the side to move can move.
+        """
+        self._outcome = self._evaluate_outcome()
+        return self._outcome
+
+    @property
+    def num_pushed(self) -> int:
+        return len(self._push_tokens)
+
     def get_valid_moves(self, piece: Piece | None) -> list[Coord] | None:
         if piece is None:
             return None
         if self.is_over:
             return []
-        moves = self.board.get_valid_moves(piece)
-        if moves is None:
-            return None
         if self.current_side is not None and piece.side != self.current_side:
             return []
-        return [coord for coord in moves if self.can_move(piece.position, coord)]
+        start = piece.position
+        return [
+            end
+            for end in piece.iter_move_candidates(self.board)
+            if self._resolve_legal(Move(start, end)) is not None
+        ]
+
+    def legal_moves(self, side: Side2 | None = None) -> list[Move]:
+        """
+        Every legal move for `side` as fully resolved `Move` objects.
+
+        `side` defaults to the side to move; with no turn order (and no
+        `side` given) both sides are included. Each candidate is resolved
+        exactly once, and the returned moves carry their effects, so they
+        can be passed straight to `push(move, validate=False)`.
+        """
+        return list(self.iter_legal_moves(side))
+
+    def legal_move_list(self, side: Side2 | None = None) -> MoveList:
+        """
+        `legal_moves` packed into a `MoveList` with the game's `move_codec`.
+        """
+        return MoveList(self.move_codec, self.iter_legal_moves(side))
+
+    def iter_legal_moves(self, side: Side2 | None = None) -> Iterator[Move]:
+        """
+        Lazily yield the moves `legal_moves` would return.
+
+        Candidates are resolved only as the stream is consumed, so a caller
+        that stops early pays only for the moves it looked at.
+        """
+        if self.is_over:
+            return
+        if side is None:
+            side = self.current_side
+        sides: tuple[Side2, ...] = (True, False) if side is None else (side,)
+
+        for request_side in sides:
+            for request in self._iter_move_requests(request_side):
+                resolved_move = self._resolve_legal(request)
+                if resolved_move is not None:
+                    yield resolved_move
+
+    def random_legal_move(
+        self, rng: random.Random | None = None, side: Side2 | None = None
+    ) -> Move | None:
+        """
+        A legal move for `side` (default: the side to move) drawn uniformly
+        at random from those `legal_moves` would return, or None when there
+        is none.
+
+        Requests are resolved in random order until one is legal, so when
+        most candidates are legal only a few get resolved. The answer also
+        settles `has_any_legal_move` for this position.
+        """
+        if self.is_over:
+            return None
+        current_side = self.current_side
+        if side is None:
+            side = current_side
+        sides: tuple[Side2, ...] = (True, False) if side is None else (side,)
+        requests = [
+            request
+            for request_side in sides
+            for request in self._iter_move_requests(request_side)
+        ]
+        randrange = (rng or random).randrange
+        found = None
+        # Draw without replacement: the first legal request is equally
+        # likely to be any of the legal ones.
+        while requests:
+            index = randrange(len(requests))
+            request = requests[index]
+            requests[index] = requests[-1]
+            requests.pop()
+            found = self._resolve_legal(request)
+            if found is not None:
+                break
+        context = self.evaluation_context
+        has_move = found is not None
+        context.cached(("has_legal_move", side), lambda: has_move)
+        if side == current_side:
+            context.cached(("has_legal_move", None), lambda: has_move)
+        return found
+
+    def has_any_legal_move(self, side: Side2 | None = None) -> bool:
+        """
+        Whether `side` has at least one legal move, stopping at the first.
+
+        The answer is memoized for the current position (`position_hash` and
+        ply), so terminal conditions evaluated after the same move, such as
+        checkmate and stalemate, share a single search.
+        """
+        if self.is_over:
+            return False
+        return self.evaluation_context.cached(
+            ("has_legal_move", side),
+            lambda: next(self.iter_legal_moves(side), None) is not None,
+        )
+
+    @property
+    def evaluation_context(self) -> EvaluationContext:
+        """
+        The shared `EvaluationContext` for the current position and ply.
+
+        A fresh context is built whenever `state_hash` or the ply changes,
+        so win conditions evaluated after one move share it, while answers
+        that depend on phase or resource state (such as `has_legal_move`)
+        never outlive that state.
+        """
+        key = (self.state_hash, self.board.history.num_moves)
+        context = self._evaluation_context
+        if context is None or context.key != key:
+            context = EvaluationContext(self, key)
+            self._evaluation_context = context
+        return context
+
+    def _iter_move_requests(self, side: Side2) -> Iterator[Move]:
+        """
+        Yield the unresolved move requests `legal_moves` tries for a side.
+
+        Defaults to every piece's `iter_move_candidates`, each spelled out by
+        the move manager's `expand_request`, so every request that resolves
+        can also be applied. Games with actions that are not piece moves
+        (drops, passes) extend this.
+        """
+        board = self.board
+        expand = board.manager.expand_request
+        for piece in board.iter_pieces_by_side(side):
+            start = piece.position
+            for end in piece.iter_move_candidates(board):
+                yield from expand(Move(start, end))
 
     def reset(self) -> None:
         self._suspend_board_sync = True
@@ -314,6 +581,7 @@ class Game:
         self._reseed_state()
 
     def undo_move(self) -> None:
+        self._ensure_no_pushed_moves()
         if len(self._state_snapshots) < 2:
             raise MoveHistoryError("No game state to undo.")
         self.board.history.undo_move()
@@ -322,6 +590,7 @@ class Game:
         self._restore_state_snapshot(self._state_snapshots[-1])
 
     def redo_move(self) -> None:
+        self._ensure_no_pushed_moves()
         if not self._redo_state_snapshots:
             raise MoveHistoryError("No game state to redo.")
         self.board.history.redo_move()
@@ -329,6 +598,48 @@ class Game:
         self._state_snapshots.append(snapshot)
         self._restore_state_snapshot(snapshot)
 
+    def _ensure_no_pushed_moves(self) -> None:
+        if self._push_tokens:
+            raise MoveHistoryError("Pop all pushed moves first.")
+
+    def _advance_game_systems(self, piece: Piece, move: Move) -> None:
+        """
+        Let the turn, phase and resource systems react to an applied move.
+        """
+        self.turn_policy.after_move(self, piece, move)
+        if self.phase_system is not None:
+            self.phase_system.after_move(self, piece, move)
+        if self.resource_system is not None:
+            self.resource_system.after_move(self, piece, move)
+
+    def _capture_push_token(self) -> PushToken:
+        return (
+            self.turn_policy.snapshot(),
+            self.phase_system.snapshot() if self.phase_system is not None else None,
+            (
+                self.resource_system.snapshot()
+                if self.resource_system is not None
+                else None
+            ),
+            (
+                self.scoring_system.snapshot()
+                if self.scoring_system is not None
+                else None
+            ),
+            self._outcome,
+        )
+
+    def _restore_push_token(self, token: PushToken) -> None:
+        turn_policy, phase_system, resource_system, scoring_system, outcome = token
+        self.turn_policy.restore(turn_policy)
+        if self.phase_system is not None:
+            self.phase_system.restore(phase_system)
+        if self.resource_system is not None:
+            self.resource_system.restore(resource_system)
+        if self.scoring_system is not None:
+            self.scoring_system.restore(scoring_system)
+        self._outcome = outcome
+
     def _capture_state_snapshot(self) -> GameStateSnapshot:
         return GameStateSnapshot(
             turn_policy=self.turn_policy.snapshot(),
@@ -375,9 +686,15 @@ class Game:
             self.scoring_system.reset()
 
     def _reseed_state(self) -> None:
+        self._push_tokens.clear()
+        self._evaluation_context = None
         self._reset_game_systems()
+        self.board.history.stamp_position(self.position_hash)
+        # Clear the old outcome first: conditions asking for legal moves
+        # would otherwise see a finished game and find none.
+        self._outcome = None
         self._outcome = self._evaluate_outcome()
-        self._state_snapshots = [self._capture_state_snapshot()]
+        self._state_snapshots = deque([self._capture_state_snapshot()])
         self._redo_state_snapshots.clear()
 
     def _handle_external_board_change(self) -> None:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Hashable, TypeVar
 
 from cynmeith.core.piece import Piece
 from cynmeith.utils.aliases import Move, Side2
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
     from collections.abc import Mapping
 
     from cynmeith.core.game import Game
+    from cynmeith.core.royal_rules import RoyalRuleset
+
+T = TypeVar("T")
 
 
 @dataclass(frozen=True)
@@ -42,6 +45,16 @@ class GameSystem(ABC):
     def restore(self, snapshot: Any) -> None:
         pass
 
+    def hash_state(self) -> Hashable:
+        """
+        System state folded into `Game.state_hash`.
+
+        Defaults to None (stateless). Override with the state that decides
+        which moves are allowed, leaving out ever-increasing counters. Return
+        a value with a stable `repr`, as for `Piece.hash_state()`.
+        """
+        return None
+
 
 class WinCondition(ABC):
     """
@@ -53,6 +66,57 @@ class WinCondition(ABC):
         pass
 
 
+class EvaluationContext:
+    """
+    Per-ply facts shared by the win conditions evaluated after a move.
+
+    `Game.evaluation_context` hands out one context per position
+    (`position_hash` and ply). Every value is computed on first request and
+    reused, so conditions that ask the same question share the work.
+    Custom conditions opt in through `cached(key, factory)`.
+    """
+
+    def __init__(self, game: "Game", key: Hashable) -> None:
+        self.game = game
+        self.key = key
+        self._values: dict[Hashable, Any] = {}
+
+    @property
+    def position_key(self) -> int:
+        return self.game.position_hash
+
+    def cached(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Return the value stored under `key`, computing it with `factory` once.
+
+        Pick keys that cannot collide with other conditions, e.g. a tuple
+        starting with the condition's class.
+        """
+        values = self._values
+        if key in values:
+            return values[key]
+        value = factory()
+        values[key] = value
+        return value
+
+    def piece_count(self, side: Side2 | None = None, symbol: str | None = None) -> int:
+        if symbol is not None:
+            symbol = symbol.upper()
+        return self.cached(
+            ("piece_count", side, symbol),
+            lambda: self.game.board.count_pieces(side, symbol),
+        )
+
+    def has_legal_move(self, side: Side2 | None = None) -> bool:
+        return self.game.has_any_legal_move(side)
+
+    def in_check(self, royal_rules: RoyalRuleset, side: Side2) -> bool:
+        return self.cached(
+            ("in_check", royal_rules, side),
+            lambda: royal_rules.is_royal_in_check(self.game.board, side),
+        )
+
+
 class PhaseSystem(GameSystem):
     """
     Controls phase-specific move restrictions and phase progression.
@@ -71,6 +135,9 @@ class PhaseSystem(GameSystem):
     def current_phase(self) -> str | None:
         pass
 
+    def hash_state(self) -> Hashable:
+        return self.current_phase
+
 
 class ResourceSystem(GameSystem):
     """
@@ -116,13 +183,7 @@ class EliminatePieceCondition(WinCondition):
         self.reason = reason
 
     def evaluate(self, game: "Game") -> GameOutcome | None:
-        for piece in game.board.iter_pieces():
-            if piece is None:
-                continue
-            if piece.symbol.upper() != self.piece_symbol:
-                continue
-            if self.side is not None and piece.side != self.side:
-                continue
+        if game.evaluation_context.piece_count(self.side, self.piece_symbol):
             return None
 
         winner = self.winner
@@ -196,12 +257,8 @@ class NoLegalMovesCondition(WinCondition):
         if game.current_side is not None and side != game.current_side:
             return None
 
-        for piece in game.board.iter_pieces():
-            if piece is None or piece.side != side:
-                continue
-            for coord in game.board.get_valid_moves(piece) or []:
-                if game.can_move(piece.position, coord):
-                    return None
+        if game.evaluation_context.has_legal_move(side):
+            return None
 
         winner = self.winner
         if winner is None:
@@ -364,6 +421,9 @@ class ActionPointSystem(ResourceSystem):
         self.points_left = dict(points_left)
         self._active_side = active_side
 
+    def hash_state(self) -> Hashable:
+        return tuple(sorted(self.points_left.items())), self._active_side
+
     def _sync_active_side(self, game: "Game", moving_side: Side2 | None = None) -> None:
         current_side = game.current_side
         if current_side is None:
@@ -393,16 +453,8 @@ class PieceCountScoringSystem(ScoringSystem):
 
     def get_scores(self, game: "Game") -> Mapping[Side2, int]:
         return {
-            True: sum(
-                1
-                for piece in game.board.iter_pieces()
-                if piece is not None and piece.side is True
-            ),
-            False: sum(
-                1
-                for piece in game.board.iter_pieces()
-                if piece is not None and piece.side is False
-            ),
+            True: game.board.count_pieces(True),
+            False: game.board.count_pieces(False),
         }
 
 
@@ -428,10 +480,9 @@ class MaterialScoreSystem(ScoringSystem):
 
     def get_scores(self, game: "Game") -> Mapping[Side2, int]:
         scores: dict[Side2, int] = {True: 0, False: 0}
-        for piece in game.board.iter_pieces():
-            if piece is None:
-                continue
-            scores[piece.side] += self.piece_values.get(
-                piece.symbol.upper(), self.default_value
-            )
+        for side in (True, False):
+            for piece in game.board.iter_pieces_by_side(side):
+                scores[side] += self.piece_values.get(
+                    piece.symbol.upper(), self.default_value
+                )
         return scores
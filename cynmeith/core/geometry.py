@@ -0,0 +1,155 @@
+"""
+Precomputed coordinate tables for a board size.
+
+Every `Board` (and `BoardSimulation`) of a given width and height shares one
+`BoardGeometry`, so move generation can read rays and leaper targets from
+tables instead of creating and bounds-checking coordinates step by step.
+"""
+
+from __future__ import annotations
+
+from cynmeith.utils.coord import Coord
+
+Table = tuple[tuple[Coord, ...], ...]
+
+_MAX_LEAP_IDS = 256
+
+
+class BoardGeometry:
+    """
+    Interned coordinates plus per-cell ray and leaper tables for one
+    `width` x `height` board.
+
+    Tables are indexed by `r * width + c`. Rays for the eight unit
+    directions are built up front; other directions and every leaper
+    offset set are built on first use and then kept. Get instances through
+    `for_size` so boards of the same size share them.
+    """
+
+    _instances: dict[tuple[int, int], BoardGeometry] = {}
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        # Interned row-major coordinates: coords[r * width + c] is Coord(r, c).
+        self.coords: tuple[Coord, ...] = tuple(
+            Coord(r, c) for r in range(height) for c in range(width)
+        )
+        self._rays: dict[Coord, Table] = {}
+        self._leaps: dict[tuple[Coord, ...], Table] = {}
+        # Identity fast path over `_leaps`: hashing an offsets tuple hashes
+        # every Coord in it. The tuple is kept in the entry so its id cannot
+        # be reused while cached; the map is bounded in case callers pass
+        # fresh tuples.
+        self._leaps_by_id: dict[int, tuple[tuple[Coord, ...], Table]] = {}
+        # Bitmasks of the cells strictly between two aligned cells, keyed by
+        # `start_index * cells + end_index`.
+        self._between: dict[int, int | None] = {}
+        for direction in Coord.omnidirectionals():
+            self.rays(direction)
+
+    @classmethod
+    def for_size(cls, width: int, height: int) -> BoardGeometry:
+        """
+        Return the shared geometry for a board size, building it once.
+        """
+        geometry = cls._instances.get((width, height))
+        if geometry is None:
+            geometry = cls(width, height)
+            cls._instances[(width, height)] = geometry
+        return geometry
+
+    def _offset(self, r: int, c: int) -> Coord | None:
+        if 0 <= r < self.height and 0 <= c < self.width:
+            return self.coords[r * self.width + c]
+        return None
+
+    def rays(self, direction: Coord) -> Table:
+        """
+        The ray table for `direction`: for each cell, the cells reached by
+        stepping repeatedly in `direction` (the cell itself excluded),
+        nearest first.
+        """
+        table = self._rays.get(direction)
+        if table is None:
+            if direction.r == 0 and direction.c == 0:
+                raise ValueError("A ray needs a non-zero direction.")
+            dr, dc = direction.r, direction.c
+            rows = []
+            for start in self.coords:
+                ray = []
+                position = self._offset(start.r + dr, start.c + dc)
+                while position is not None:
+                    ray.append(position)
+                    position = self._offset(position.r + dr, position.c + dc)
+                rows.append(tuple(ray))
+            table = tuple(rows)
+            self._rays[direction] = table
+        return table
+
+    def ray(self, position: Coord, direction: Coord) -> tuple[Coord, ...]:
+        """
+        Cells from `position` (exclusive) towards the edge in `direction`.
+        """
+        return self.rays(direction)[position.r * self.width + position.c]
+
+    def leap_table(self, offsets: tuple[Coord, ...]) -> Table:
+        """
+        The leaper table for an offset set: for each cell, the in-bounds
+        cells at `cell + offset`, in `offsets` order.
+
+        Lookups are fastest with a shared module-level tuple (e.g.
+        `Coord.lshapes()`) rather than a fresh one per call.
+        """
+        entry = self._leaps_by_id.get(id(offsets))
+        if entry is not None and entry[0] is offsets:
+            return entry[1]
+        table = self._leaps.get(offsets)
+        if table is None:
+            table = tuple(
+                tuple(
+                    target
+                    for offset in offsets
+                    if (target := self._offset(start.r + offset.r, start.c + offset.c))
+                    is not None
+                )
+                for start in self.coords
+            )
+            self._leaps[offsets] = table
+        if len(self._leaps_by_id) >= _MAX_LEAP_IDS:
+            self._leaps_by_id.clear()
+        self._leaps_by_id[id(offsets)] = (offsets, table)
+        return table
+
+    def leaps(self, position: Coord, offsets: tuple[Coord, ...]) -> tuple[Coord, ...]:
+        """
+        In-bounds cells at `position + offset` for each of `offsets`.
+        """
+        return self.leap_table(offsets)[position.r * self.width + position.c]
+
+    def between_mask(self, start: Coord, end: Coord) -> int | None:
+        """
+        Bitmask (bit `r * width + c`) of the cells strictly between two
+        in-bounds cells on a shared row, column or diagonal, or None when
+        the cells are not aligned.
+        """
+        width = self.width
+        start_index = start.r * width + start.c
+        end_index = end.r * width + end.c
+        key = start_index * len(self.coords) + end_index
+        if key in self._between:
+            return self._between[key]
+        dr = end.r - start.r
+        dc = end.c - start.c
+        mask: int | None = None
+        if dr == 0 or dc == 0 or abs(dr) == abs(dc):
+            step_r = (dr > 0) - (dr < 0)
+            step_c = (dc > 0) - (dc < 0)
+            mask = 0
+            r, c = start.r + step_r, start.c + step_c
+            while (r, c) != (end.r, end.c):
+                mask |= 1 << (r * width + c)
+                r += step_r
+                c += step_c
+        self._between[key] = mask
+        return mask
@@ -0,0 +1,223 @@
+"""
+Packed integer move encoding.
+
+A `MoveCodec` turns a `Move` into one int laid out (low bits first) as
+start cell, end cell, move-type id, choice id and flags. Cells are
+row-major indices `r * width + c`, with one extra value for `Coord.null()`,
+so drops and passes encode too. Move types are interned per codec.
+
+A move's choice is the scalar part of its `extra_info` (see
+`move_choice`), such as a promotion piece; choices are interned like move
+types, so moves that differ only in them get different codes. The rest of
+`extra_info` (effects, actor pieces) cannot be packed; an encoded move only
+records that it had some. `MoveList` keeps those dicts in a sparse side
+table next to an `array` of codes, so a list of mostly plain moves costs a
+few bytes per move instead of a `Move` object each.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
+from cynmeith.core.geometry import BoardGeometry
+from cynmeith.utils.aliases import Move, MoveExtraInfo, MoveType
+from cynmeith.utils.coord import Coord
+
+TYPE_BITS = 8
+CHOICE_BITS = 8
+EXTRA_INFO_FLAG = 1
+"""Flag set on codes whose move carried `extra_info`."""
+
+_FLAG_BITS = 1
+
+MoveChoice = tuple[tuple[str, object], ...]
+
+
+def move_choice(extra_info: MoveExtraInfo | None) -> MoveChoice:
+    """
+    The scalar (None, str, int or bool) entries of `extra_info`, sorted by
+    key: the part of a move's metadata that tells apart moves with the same
+    cells and type, such as a promotion choice.
+    """
+    if not extra_info:
+        return ()
+    return tuple(
+        sorted(
+            (key, value)
+            for key, value in extra_info.items()
+            if value is None or isinstance(value, (str, int))
+        )
+    )
+
+
+class MoveCodec:
+    """
+    Encodes moves on a `width` x `height` board as ints.
+
+    Move type `""` always has id 0; other types get ids in first-seen order,
+    up to `2 ** TYPE_BITS` per codec. Choices work the same way, with the
+    empty choice as id 0, up to `2 ** CHOICE_BITS`. `bits` is the width of
+    a code.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.coords = BoardGeometry.for_size(width, height).coords
+        self._null_index = len(self.coords)
+        self.cell_bits = self._null_index.bit_length()
+        self._cell_mask = (1 << self.cell_bits) - 1
+        self._type_shift = 2 * self.cell_bits
+        self._choice_shift = self._type_shift + TYPE_BITS
+        self._flag_shift = self._choice_shift + CHOICE_BITS
+        self.bits = self._flag_shift + _FLAG_BITS
+        self._type_ids: dict[MoveType, int] = {"": 0}
+        self._types: list[MoveType] = [""]
+        self._choice_ids: dict[MoveChoice, int] = {(): 0}
+        self._choices: list[MoveChoice] = [()]
+
+    def move_type_id(self, move_type: MoveType) -> int:
+        """
+        Return the id of `move_type`, interning it on first use.
+        """
+        type_id = self._type_ids.get(move_type)
+        if type_id is None:
+            type_id = len(self._types)
+            if type_id >> TYPE_BITS:
+                raise ValueError(
+                    f"Too many move types for one codec (max {1 << TYPE_BITS})."
+                )
+            self._type_ids[move_type] = type_id
+            self._types.append(move_type)
+        return type_id
+
+    def choice_id(self, choice: MoveChoice) -> int:
+        """
+        Return the id of `choice` (a `move_choice` result), interning it on
+        first use.
+        """
+        choice_id = self._choice_ids.get(choice)
+        if choice_id is None:
+            choice_id = len(self._choices)
+            if choice_id >> CHOICE_BITS:
+                raise ValueError(
+                    f"Too many move choices for one codec (max {1 << CHOICE_BITS})."
+                )
+            self._choice_ids[choice] = choice_id
+            self._choices.append(choice)
+        return choice_id
+
+    def _index(self, position: Coord) -> int:
+        r, c = position.r, position.c
+        if 0 <= r < self.height and 0 <= c < self.width:
+            return r * self.width + c
+        if not position:
+            return self._null_index
+        raise ValueError(f"Cannot encode off-board position {position}")
+
+    def _coord(self, index: int) -> Coord:
+        if index == self._null_index:
+            return Coord.null()
+        return self.coords[index]
+
+    def encode(self, move: Move) -> int:
+        """
+        Pack `move` into an int. Of its `extra_info`, only the `move_choice`
+        is kept; any `extra_info` sets `EXTRA_INFO_FLAG`.
+        """
+        code = (
+            self._index(move.start)
+            | self._index(move.end) << self.cell_bits
+            | self.move_type_id(move.move_type) << self._type_shift
+        )
+        if move.extra_info is not None:
+            code |= EXTRA_INFO_FLAG << self._flag_shift
+            choice = move_choice(move.extra_info)
+            if choice:
+                code |= self.choice_id(choice) << self._choice_shift
+        return code
+
+    def decode(self, code: int, extra_info: MoveExtraInfo | None = None) -> Move:
+        """
+        Rebuild the `Move` for `code`, attaching `extra_info` if given.
+        Otherwise a code with a choice gets an `extra_info` dict holding just
+        that choice.
+        """
+        mask = self._cell_mask
+        if extra_info is None:
+            choice = self._choices[self.choice_index(code)]
+            if choice:
+                extra_info = dict(choice)
+        return Move(
+            self._coord(code & mask),
+            self._coord(code >> self.cell_bits & mask),
+            self._types[code >> self._type_shift & ((1 << TYPE_BITS) - 1)],
+            extra_info,
+        )
+
+    def start_index(self, code: int) -> int:
+        return code & self._cell_mask
+
+    def end_index(self, code: int) -> int:
+        return code >> self.cell_bits & self._cell_mask
+
+    def choice_index(self, code: int) -> int:
+        return code >> self._choice_shift & ((1 << CHOICE_BITS) - 1)
+
+    def flags(self, code: int) -> int:
+        return code >> self._flag_shift
+
+
+class MoveList(Sequence[Move]):
+    """
+    Compact list of moves: packed codes in an `array('I')` (`'Q'` when the
+    codec's codes are wider than 32 bits) plus a sparse table of the moves'
+    `extra_info` dicts.
+
+    Indexing and iteration decode `Move` objects on demand; read `codes`
+    directly to avoid building them.
+    """
+
+    def __init__(self, codec: MoveCodec, moves: Iterable[Move] = ()) -> None:
+        self.codec = codec
+        self.codes = array("I" if codec.bits <= 32 else "Q")
+        self._extras: dict[int, MoveExtraInfo] = {}
+        self.extend(moves)
+
+    def append(self, move: Move) -> None:
+        if move.extra_info is not None:
+            self._extras[len(self.codes)] = move.extra_info
+        self.codes.append(self.codec.encode(move))
+
+    def extend(self, moves: Iterable[Move]) -> None:
+        for move in moves:
+            self.append(move)
+
+    def clear(self) -> None:
+        del self.codes[:]
+        self._extras.clear()
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @overload
+    def __getitem__(self, index: int) -> Move: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> MoveList: ...
+
+    def __getitem__(self, index: int | slice) -> Move | MoveList:
+        if isinstance(index, slice):
+            return MoveList(
+                self.codec, (self[i] for i in range(*index.indices(len(self))))
+            )
+        if index < 0:
+            index += len(self.codes)
+        return self.codec.decode(self.codes[index], self._extras.get(index))
+
+    def __iter__(self) -> Iterator[Move]:
+        decode, extras = self.codec.decode, self._extras
+        for index, code in enumerate(self.codes):
+            yield decode(code, extras.get(index))
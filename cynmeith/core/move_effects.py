@@ -61,6 +61,9 @@ class MovePieceEffect(MoveEffect):
         if moving_piece is None:
             return
         board._set_at(self.start, None)
+        if moving_piece.immutable:
+            board._set_at(self.end, moving_piece.moved(self.end))
+            return
         board._set_at(self.end, moving_piece)
         moving_piece.move(self.end)
 
@@ -121,26 +124,28 @@ class PlacePieceEffect(MoveEffect):
 class EffectPresets:
     """
     Reusable effect builders for game-specific move managers.
+
+    Builders return tuples, which `Move.effects` uses without copying.
     """
 
     @staticmethod
-    def capture(position: Coord) -> list[MoveEffect]:
-        return [RemovePieceEffect(position)]
+    def capture(position: Coord) -> tuple[MoveEffect, ...]:
+        return (RemovePieceEffect(position),)
 
     @staticmethod
-    def captures(*positions: Coord) -> list[MoveEffect]:
-        return [RemovePieceEffect(position) for position in positions]
+    def captures(*positions: Coord) -> tuple[MoveEffect, ...]:
+        return tuple(RemovePieceEffect(position) for position in positions)
 
     @staticmethod
-    def relocate(start: Coord, end: Coord) -> list[MoveEffect]:
-        return [MovePieceEffect(start, end)]
+    def relocate(start: Coord, end: Coord) -> tuple[MoveEffect, ...]:
+        return (MovePieceEffect(start, end),)
 
     @staticmethod
-    def promote(symbol: str, position: Coord | None = None) -> list[MoveEffect]:
-        return [PromotePieceEffect(symbol, position)]
+    def promote(symbol: str, position: Coord | None = None) -> tuple[MoveEffect, ...]:
+        return (PromotePieceEffect(symbol, position),)
 
     @staticmethod
     def drop(
         symbol: str, side: bool | None = None, position: Coord | None = None
-    ) -> list[MoveEffect]:
-        return [PlacePieceEffect(symbol=symbol, side=side, position=position)]
+    ) -> tuple[MoveEffect, ...]:
+        return (PlacePieceEffect(symbol=symbol, side=side, position=position),)
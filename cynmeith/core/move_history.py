@@ -1,5 +1,7 @@
+from collections import Counter, deque
 from copy import copy
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import TYPE_CHECKING, Iterator
 
 from cynmeith.core.piece import Piece
@@ -13,6 +15,16 @@ if TYPE_CHECKING:
 Grid = list[list[Piece | None]]
 
 
+def _detach(piece: Piece | None) -> Piece | None:
+    """
+    A copy of `piece` that later mutations of the original cannot reach;
+    pieces of an `immutable` type are shared as they are.
+    """
+    if piece is None or piece.immutable:
+        return piece
+    return copy(piece)
+
+
 @dataclass(frozen=True)
 class MoveDelta:
     """
@@ -21,7 +33,10 @@ class MoveDelta:
     `before` maps each touched cell to its piece value (shallow copy)
     immediately before the move applied; `after` maps the same cells to
     their values immediately after. Pieces are shallow-copied so their
-    attribute state at that moment is preserved across future mutations.
+    attribute state at that moment is preserved across future mutations;
+    `immutable` pieces are stored by reference.
+
+    Pushed search plies (see `MoveHistory.begin_push`) leave `after` empty.
     """
 
     before: dict[Coord, Piece | None] = field(default_factory=dict)
@@ -66,22 +81,64 @@ class MoveHistory:
     - `state_stack` is a lazy view that materializes states on demand
       so existing consumers (e.g. fingerprinting) keep working without
       paying the steady-state memory cost of full snapshots.
+    - `_checkpoints`: full grids taken every `checkpoint_interval`
+      recorded moves, keyed by absolute state index. Past
+      `max_checkpoints` they are thinned: every other one is dropped and
+      the spacing doubles, so they stay spread over the whole game.
+      Materializing a state replays forward from the nearest checkpoint
+      at or below it, or backwards from the live board when that is
+      closer, so random access costs O(cells + spacing), where the
+      spacing is `checkpoint_interval` until the game outgrows
+      `checkpoint_interval * max_checkpoints` moves.
+    - `_position_keys`: one position key per state (baseline first),
+      tallied in `_key_counts` so `repetition_count()` is O(1). Keys
+      default to `board.position_hash`; `Game` restamps each one with its
+      turn-aware `position_hash` via `stamp_position()`.
 
     Recording is driven by `Board._set_at`, which calls
     `record_cell_change` whenever recording is active. Recording is
     activated by `begin_recording()` (called by `MoveManager.apply_move`)
     and finalized by `record_move()`.
+
+    Search plies take a lighter path: after `begin_push()`, the next
+    recorded move keeps only its `before` cells, skips redo, checkpoint and
+    `max_history` bookkeeping, and is reverted by `pop_move()`. Pushed
+    plies still appear in `move_stack`, `num_moves` and `state_stack`.
     """
 
-    def __init__(self, board: "Board", max_history: int | None = None) -> None:
+    def __init__(
+        self,
+        board: "Board",
+        max_history: int | None = None,
+        checkpoint_interval: int | None = 32,
+        max_checkpoints: int = 64,
+    ) -> None:
+        if checkpoint_interval is not None and checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be positive or None")
+        if max_checkpoints < 0:
+            raise ValueError("max_checkpoints must be non-negative")
         self.board = board
-        self.move_stack: list[Move] = []
+        # Deques so `max_history` trimming pops the oldest entry in O(1).
+        self.move_stack: deque[Move] = deque()
         self.redo_stack: list[Move] = []
         self._baseline_state: Grid = []
-        self._deltas: list[MoveDelta] = []
+        self._deltas: deque[MoveDelta] = deque()
         self._redo_deltas: list[MoveDelta] = []
         self._recording: dict[Coord, Piece | None] | None = None
         self._max_history = max_history
+        self.checkpoint_interval = checkpoint_interval
+        self.max_checkpoints = max_checkpoints
+        self._checkpoints: dict[int, Grid] = {}
+        # Multiplier on `checkpoint_interval`, doubled by each thinning.
+        self._checkpoint_spread = 1
+        # Deltas folded into the baseline so far; absolute state index k
+        # is local index k - _folded.
+        self._folded = 0
+        self._position_keys: deque[int] = deque()
+        self._redo_position_keys: list[int] = []
+        self._key_counts: Counter[int] = Counter()
+        self._push_next = False
+        self._pushed = 0
 
     @property
     def num_moves(self) -> int:
@@ -102,16 +159,52 @@ class MoveHistory:
     def max_history(self) -> int | None:
         return self._max_history
 
+    @property
+    def position_key(self) -> int | None:
+        """
+        Key of the current position, or None before the history is seeded.
+        """
+        return self._position_keys[-1] if self._position_keys else None
+
+    def repetition_count(self, key: int | None = None) -> int:
+        """
+        How many retained states (baseline included) share `key`.
+
+        Defaults to the current position's key, so a result of 3 means the
+        current position has now occurred three times.
+        """
+        if key is None:
+            key = self.position_key
+            if key is None:
+                return 0
+        return self._key_counts[key]
+
+    def stamp_position(self, key: int) -> None:
+        """
+        Replace the current state's position key.
+
+        `MoveHistory` only sees the board, so callers that know more about
+        the position (e.g. `Game` and its side to move) restamp the latest
+        state once their own state has caught up.
+        """
+        if self._position_keys:
+            self._drop_position_key(self._position_keys.pop())
+        self._push_position_key(key)
+
     def set_max_history(self, max_history: int | None) -> None:
         """
         Cap how many move deltas are retained.
 
         When the cap is exceeded, oldest deltas are folded into the
         baseline so undo depth shrinks but state-stack indices past the
-        bound shift forward. Use None to disable the cap.
+        bound shift forward. Use None to disable the cap. Raises
+        `MoveHistoryError` while pushed moves are outstanding, since folding
+        their deltas would leave nothing for `pop_move` to revert.
         """
         if max_history is not None and max_history < 0:
             raise ValueError("max_history must be non-negative or None")
+        if self._pushed:
+            raise MoveHistoryError("Pop pushed moves before changing max_history.")
         self._max_history = max_history
         self._enforce_max_history()
 
@@ -122,6 +215,14 @@ class MoveHistory:
         self._deltas.clear()
         self._redo_deltas.clear()
         self._recording = None
+        self._push_next = False
+        self._pushed = 0
+        self._checkpoints.clear()
+        self._checkpoint_spread = 1
+        self._folded = 0
+        self._position_keys.clear()
+        self._redo_position_keys.clear()
+        self._key_counts.clear()
 
     def seed_current_state(self) -> None:
         """
@@ -133,13 +234,48 @@ class MoveHistory:
         self.move_stack.clear()
         self.redo_stack.clear()
         self._recording = None
+        self._push_next = False
+        self._pushed = 0
+        self._checkpoints.clear()
+        self._checkpoint_spread = 1
+        self._folded = 0
+        self._position_keys.clear()
+        self._redo_position_keys.clear()
+        self._key_counts.clear()
+        self._push_position_key(self.board.position_hash)
+
+    @property
+    def num_pushed(self) -> int:
+        """
+        Number of pushed search plies not yet popped.
+        """
+        return self._pushed
 
     def begin_recording(self) -> None:
         """
         Start capturing cell-level changes for the next recorded move.
         """
+        if self._pushed and not self._push_next:
+            raise MoveHistoryError("Pop pushed moves before recording new moves.")
         self._recording = {}
 
+    def begin_push(self) -> None:
+        """
+        Record the next move as a pushed search ply, to be reverted with
+        `pop_move()` (see `Game.push`).
+        """
+        self._push_next = True
+
+    def abort_push(self) -> None:
+        """
+        Disarm a `begin_push()` whose move failed to apply, putting back any
+        cells it had already changed.
+        """
+        self._push_next = False
+        recording, self._recording = self._recording, None
+        for position, piece in (recording or {}).items():
+            self.board._write_cell(position, piece)
+
     def record_cell_change(self, position: Coord, before_piece: Piece | None) -> None:
         """
         Note the pre-mutation value of a cell during an active recording.
@@ -150,70 +286,176 @@ class MoveHistory:
         if self._recording is None:
             return
         if position not in self._recording:
-            self._recording[position] = copy(before_piece) if before_piece else None
+            self._recording[position] = _detach(before_piece)
 
     def record_move(self, move: Move) -> None:
         before = self._recording or {}
         self._recording = None
 
+        if self._push_next:
+            self._push_next = False
+            for position in before:
+                self.board.rehash_cell(position)
+            self._deltas.append(MoveDelta(before=before))
+            self.move_stack.append(move)
+            self._push_position_key(self.board.position_hash)
+            self._pushed += 1
+            return
+
         after: dict[Coord, Piece | None] = {}
         for position in before:
-            current = self.board.board[position.r][position.c]
-            after[position] = copy(current) if current else None
+            self.board.rehash_cell(position)
+            current = self.board.storage.get(position)
+            after[position] = _detach(current)
 
+        if self._redo_deltas:
+            self._drop_checkpoints_from(self._folded + len(self._deltas) + 1)
         self._deltas.append(MoveDelta(before=before, after=after))
         self.move_stack.append(move)
+        self._push_position_key(self.board.position_hash)
+        self._maybe_checkpoint()
         self._redo_deltas.clear()
         self.redo_stack.clear()
+        self._redo_position_keys.clear()
         self._enforce_max_history()
 
+    def pop_move(self) -> Move:
+        """
+        Revert the most recent pushed ply and return its move.
+        """
+        if not self._pushed:
+            raise MoveHistoryError("No pushed moves to pop.")
+        self._pushed -= 1
+        delta = self._deltas.pop()
+        move = self.move_stack.pop()
+        self._drop_position_key(self._position_keys.pop())
+        # The before pieces were copied when recorded and nothing else
+        # holds this delta, so they can go straight back on the board.
+        for position, piece in delta.before.items():
+            self.board._write_cell(position, piece)
+        return move
+
     def undo_move(self) -> None:
+        if self._pushed:
+            raise MoveHistoryError("Pop pushed moves before undoing.")
         if not self._deltas or not self.move_stack:
             raise MoveHistoryError("No moves to undo.")
         delta = self._deltas.pop()
         move = self.move_stack.pop()
         for position, piece in delta.before.items():
-            self.board.board[position.r][position.c] = copy(piece) if piece else None
+            self.board._write_cell(position, _detach(piece))
         self._redo_deltas.append(delta)
         self.redo_stack.append(move)
+        if self._position_keys:
+            key = self._position_keys.pop()
+            self._drop_position_key(key)
+            self._redo_position_keys.append(key)
 
     def redo_move(self) -> None:
+        if self._pushed:
+            raise MoveHistoryError("Pop pushed moves before redoing.")
         if not self._redo_deltas or not self.redo_stack:
             raise MoveHistoryError("No moves to redo.")
         delta = self._redo_deltas.pop()
         move = self.redo_stack.pop()
         for position, piece in delta.after.items():
-            self.board.board[position.r][position.c] = copy(piece) if piece else None
+            self.board._write_cell(position, _detach(piece))
         self._deltas.append(delta)
         self.move_stack.append(move)
+        if self._redo_position_keys:
+            self._push_position_key(self._redo_position_keys.pop())
+        else:
+            self._push_position_key(self.board.position_hash)
+
+    def _maybe_checkpoint(self) -> None:
+        interval = self.checkpoint_interval
+        if interval is None or self.max_checkpoints == 0:
+            return
+        spacing = interval * self._checkpoint_spread
+        index = self._folded + len(self._deltas)
+        if index % spacing:
+            return
+        self._checkpoints[index] = self._snapshot_grid(self.board.board)
+        while len(self._checkpoints) > self.max_checkpoints:
+            # Keep every other checkpoint rather than the newest ones, so
+            # early states stay as cheap to reach as late ones.
+            spacing *= 2
+            self._checkpoint_spread *= 2
+            for stale in [key for key in self._checkpoints if key % spacing]:
+                del self._checkpoints[stale]
+
+    def _drop_checkpoints_from(self, index: int) -> None:
+        # Checkpoints past `index` belong to an undone line of play.
+        for stale in [key for key in self._checkpoints if key >= index]:
+            del self._checkpoints[stale]
+
+    def _push_position_key(self, key: int) -> None:
+        self._position_keys.append(key)
+        self._key_counts[key] += 1
+
+    def _drop_position_key(self, key: int) -> None:
+        count = self._key_counts[key] - 1
+        if count:
+            self._key_counts[key] = count
+        else:
+            del self._key_counts[key]
 
     def _enforce_max_history(self) -> None:
         if self._max_history is None:
             return
         while len(self._deltas) > self._max_history:
-            oldest_delta = self._deltas.pop(0)
+            oldest_delta = self._deltas.popleft()
             if self.move_stack:
-                self.move_stack.pop(0)
+                self.move_stack.popleft()
+            # The oldest delta's after-state becomes the new baseline, so
+            # the old baseline's key drops out of the tally.
+            if len(self._position_keys) > 1:
+                self._drop_position_key(self._position_keys.popleft())
             for position, piece in oldest_delta.after.items():
-                self._baseline_state[position.r][position.c] = (
-                    copy(piece) if piece else None
-                )
+                self._baseline_state[position.r][position.c] = _detach(piece)
+            self._folded += 1
+            while self._checkpoints and next(iter(self._checkpoints)) <= self._folded:
+                del self._checkpoints[next(iter(self._checkpoints))]
 
     def _materialize_state(self, index: int) -> Grid:
-        state: Grid = [list(row) for row in self._baseline_state]
-        for i in range(index):
+        base_index, base = 0, self._baseline_state
+        absolute = self._folded + index
+        for checkpoint_index, grid in reversed(self._checkpoints.items()):
+            if checkpoint_index <= absolute:
+                base_index, base = checkpoint_index - self._folded, grid
+                break
+
+        current = len(self._deltas)
+        # Pushed plies carry no `after` cells, so states past the committed
+        # moves can only be rebuilt backwards from the board.
+        pushed_state = index > current - self._pushed
+        if self._recording is None and (
+            pushed_state or current - index < index - base_index
+        ):
+            # Closer to the live board: undo the newest deltas on a copy.
+            state = self._snapshot_grid(self.board.board)
+            for i in range(current - 1, index - 1, -1):
+                for position, piece in self._deltas[i].before.items():
+                    state[position.r][position.c] = piece
+            return state
+
+        state = [list(row) for row in base]
+        for i in range(base_index, index):
             for position, piece in self._deltas[i].after.items():
                 state[position.r][position.c] = piece
         return state
 
     def _iter_states(self) -> Iterator[Grid]:
+        committed = len(self._deltas) - self._pushed
         state: Grid = [list(row) for row in self._baseline_state]
         yield [list(row) for row in state]
-        for delta in self._deltas:
+        for delta in islice(self._deltas, committed):
             for position, piece in delta.after.items():
                 state[position.r][position.c] = piece
             yield [list(row) for row in state]
+        for i in range(committed + 1, len(self._deltas) + 1):
+            yield self._materialize_state(i)
 
     @staticmethod
     def _snapshot_grid(grid: Grid) -> Grid:
-        return [[copy(piece) if piece else None for piece in row] for row in grid]
+        return [[_detach(piece) for piece in row] for row in grid]
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Iterator, cast
 
 from cynmeith.core.move_effects import MoveEffect
 from cynmeith.core.piece import Piece
@@ -66,12 +66,22 @@ class MoveManager:
         if move_actor:
             self.board._apply_move(move, piece)
 
-        effects = self._build_effects(move)
-        for effect in effects:
+        for effect in self._build_effects(move):
             effect.apply(self.board, move, piece)
 
         self.board.history.record_move(move)
 
+    def expand_request(self, move: Move) -> Iterator[Move]:
+        """
+        Yield the complete move requests a bare start/end request stands for.
+
+        Move generation (`Game.legal_moves` and friends) passes every
+        candidate through here, so a rule that needs an extra choice to be
+        applied, such as a promotion piece, can spell out one request per
+        choice. By default the request is yielded unchanged.
+        """
+        yield move
+
     def get_actor_piece(self, move: Move) -> Piece | None:
         """
         Resolve the piece used by turn/resource/phase systems for this move.
@@ -93,12 +103,10 @@ class MoveManager:
             return move.extra_info
         return {}
 
-    def _build_effects(self, move: Move) -> list[MoveEffect]:
-        if move.extra_info:
-            effects = move.extra_info.get(MoveKeys.EFFECTS)
-            if isinstance(effects, list):
-                return [effect for effect in effects if isinstance(effect, MoveEffect)]
-        return []
+    def _build_effects(self, move: Move) -> tuple[MoveEffect, ...]:
+        # Cached on the move, so resolution, simulation and application
+        # share one tuple.
+        return move.effects
 
     def get_validated_moves(self, piece: Piece) -> list[Coord]:
         """
@@ -107,11 +115,17 @@ class MoveManager:
         Note: This relies on resolve_move to filter out moves that might be
         physically possible but contextually illegal (e.g. moving into check).
         """
+        return list(self.iter_validated_moves(piece))
+
+    def iter_validated_moves(self, piece: Piece) -> Iterator[Coord]:
+        """
+        Lazily yield the valid destinations for a piece.
+
+        Each candidate is resolved only when the consumer asks for it, so
+        callers that stop at the first hit skip the rest of the work.
+        """
         # Cache position to avoid repeated property access in loop
         start_pos = piece.position
-        # Pre-creating a Move template can be slightly faster if resolve_move is called frequently
-        return [
-            coord
-            for coord in piece.iter_move_candidates(self.board)
-            if self.resolve_move(Move(start_pos, coord)) is not None
-        ]
+        for coord in piece.iter_move_candidates(self.board):
+            if self.resolve_move(Move(start_pos, coord)) is not None:
+                yield coord
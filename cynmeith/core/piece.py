@@ -1,15 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Iterable
+from copy import copy
+from typing import TYPE_CHECKING, ClassVar, Hashable, Iterable
 
 from cynmeith.utils.aliases import Side2
 from cynmeith.utils.coord import Coord
 
 if TYPE_CHECKING:
+    from cynmeith.core.attacks import AttackPattern
     from cynmeith.core.board import Board
 
 
 class Piece(ABC):
     symbol = ""
+    attack_patterns: ClassVar[tuple["AttackPattern", ...] | None] = None
+    """
+    How this piece attacks, for reverse attack detection (see
+    `cynmeith.core.attacks`). None means "unknown": attack checks fall back
+    to `is_valid_move` for pieces of this type.
+    """
+    immutable: ClassVar[bool] = False
+    """
+    Opt in when pieces of this type change only through `move()`. The board
+    then never mutates a placed piece: a move places `moved()` instead, so
+    history and simulations share piece references rather than copying
+    them on every read and write.
+    """
 
     def __init__(self, side: Side2, position: Coord):
         self.side: Side2 = side  # "True" for white, "False" for black
@@ -27,6 +42,17 @@ class Piece(ABC):
         else:
             return self.symbol.lower()
 
+    def hash_state(self) -> Hashable:
+        """
+        Piece-local state that distinguishes otherwise identical positions,
+        folded into the board's Zobrist hash.
+
+        Override when the piece carries state that affects its future moves
+        (e.g. castling rights via `has_moved`). Return a value with a stable
+        `repr`: None, bools, ints, strings, or tuples of those.
+        """
+        return None
+
     def move(self, new_position: Coord) -> None:
         """
         Move the piece to a new position.
@@ -35,6 +61,15 @@ class Piece(ABC):
         """
         self.position = new_position
 
+    def moved(self, new_position: Coord) -> "Piece":
+        """
+        Return a copy of this piece after `move(new_position)`, leaving this
+        piece untouched.
+        """
+        piece = copy(self)
+        piece.move(new_position)
+        return piece
+
     @abstractmethod
     def is_valid_move(self, new_position: Coord, board: "Board") -> bool:
         pass
@@ -57,4 +57,6 @@ class PieceFactory:
 
 
 class PieceFactoryLike(Protocol):
+    piece_classes: dict[PieceSymbol, PieceClass]
+
     def create_piece(self, piece_symbol: str, position: Coord) -> Piece | None: ...
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from cynmeith.core.board import BoardLike, BoardSimulation
@@ -11,6 +12,7 @@ from cynmeith.utils.aliases import Move, MoveKeys, Side2
 from cynmeith.utils.coord import Coord
 
 if TYPE_CHECKING:
+    from cynmeith.core.board import Board
     from cynmeith.core.game import Game
 
 
@@ -26,11 +28,8 @@ class RoyalRuleset(ABC):
         return piece is not None and piece.symbol.upper() == self.royal_symbol
 
     def royal_position(self, board: BoardLike, side: Side2) -> Coord | None:
-        for position, piece in board.iter_enumerate():
-            if piece is None:
-                continue
-            if piece.side == side and self.is_royal_piece(piece):
-                return position
+        for position in board.iter_positions_by_type(self.royal_symbol, side):
+            return position
         return None
 
     def is_royal_in_check(self, board: BoardLike, side: Side2) -> bool:
@@ -42,26 +41,93 @@ class RoyalRuleset(ABC):
     def side_has_legal_move(self, game: "Game", side: Side2) -> bool:
         if game.current_side is not None and game.current_side != side:
             return False
-        for piece in game.board.iter_pieces():
-            if piece is None or piece.side != side:
+        return game.has_any_legal_move(side)
+
+    def is_square_attacked(
+        self, board: BoardLike, target: Coord, by_side: Side2
+    ) -> bool:
+        """
+        Check whether any piece of `by_side` attacks `target`.
+
+        Piece types that declare `attack_patterns` are found by scanning
+        outward from `target`; the rest fall back to asking each of their
+        pieces `is_valid_move(target)`. Types with no piece of `by_side` on
+        the board are skipped.
+        """
+        for symbol, piece_class in board.factory.piece_classes.items():
+            symbol = symbol.upper()
+            positions = board.iter_positions_by_type(symbol, by_side)
+            patterns = piece_class.attack_patterns
+            if patterns is None:
+                for position in positions:
+                    piece = board._get_raw(position)
+                    if piece is not None and piece.is_valid_move(
+                        target, board  # type: ignore[arg-type]
+                    ):
+                        return True
+                continue
+            if next(iter(positions), None) is None:
                 continue
-            for coord in game.board.get_valid_moves(piece) or []:
-                if game.can_move(piece.position, coord):
+            for pattern in patterns:
+                if pattern.attacks(board, target, by_side, symbol):
                     return True
         return False
 
-    @abstractmethod
-    def is_square_attacked(
+    def attack_dependencies(
         self, board: BoardLike, target: Coord, by_side: Side2
-    ) -> bool:
-        pass
+    ) -> frozenset[Coord] | None:
+        """
+        Squares a single defending move must touch to change whether
+        `by_side` attacks `target`: checkers, blocking squares, and pinned
+        pieces (see `AttackPattern.iter_dependencies`).
+
+        Returns None when a piece type of `by_side` on the board declares no
+        `attack_patterns`, since its attacks cannot be analysed.
+        """
+        dependencies: set[Coord] = set()
+        for symbol, piece_class in board.factory.piece_classes.items():
+            symbol = symbol.upper()
+            if next(iter(board.iter_positions_by_type(symbol, by_side)), None) is None:
+                continue
+            patterns = piece_class.attack_patterns
+            if patterns is None:
+                return None
+            for pattern in patterns:
+                dependencies.update(
+                    pattern.iter_dependencies(board, target, by_side, symbol)
+                )
+        return frozenset(dependencies)
+
+
+@dataclass(frozen=True)
+class RoyalSafety:
+    """
+    Per-position summary of a side's royal piece, used to filter moves
+    without simulating them.
+    """
+
+    in_check: bool
+    dependencies: frozenset[Coord] | None
 
 
 class RoyalSafetyMoveManager(MoveManager, ABC):
     """
     Move manager helper that rejects moves exposing the moving side's royal piece.
+
+    With `pin_filter` on (the default), checkers and pinned pieces are
+    computed once per position. A plain move (no effects, not by the royal
+    piece) that touches none of those squares keeps the current check
+    status, so it is accepted or rejected without a simulation. Every other
+    move is simulated on a pooled `BoardSimulation` from `Board.simulate()`.
     """
 
+    pin_filter = True
+
+    def __init__(self, board: "Board") -> None:
+        super().__init__(board)
+        self._safety_hash: int | None = None
+        self._safety: dict[Side2, RoyalSafety] = {}
+
     @property
     @abstractmethod
     def royal_rules(self) -> RoyalRuleset:
@@ -76,11 +142,56 @@ class RoyalSafetyMoveManager(MoveManager, ABC):
         )
 
     def _is_royal_safe_after_move(self, move: Move, side: Side2) -> bool:
-        simulated_board = self._simulate_resolved_board(move)
-        return not self.royal_rules.is_royal_in_check(simulated_board, side)
-
-    def _simulate_resolved_board(self, move: Move) -> BoardSimulation:
-        simulated_board = BoardSimulation(self.board)
+        if self.pin_filter and self._is_plain_move(move):
+            safety = self._royal_safety(side)
+            dependencies = safety.dependencies
+            if (
+                dependencies is not None
+                and move.start not in dependencies
+                and move.end not in dependencies
+            ):
+                return not safety.in_check
+        with self.board.simulate() as simulated_board:
+            self._simulate_resolved_board(simulated_board, move)
+            return not self.royal_rules.is_royal_in_check(simulated_board, side)
+
+    def _is_plain_move(self, move: Move) -> bool:
+        """
+        Whether `move` only relocates a non-royal actor, with no effects.
+        """
+        if move.extra_info and (
+            not move.extra_info.get(MoveKeys.MOVE_ACTOR, True)
+            or self._build_effects(move)
+        ):
+            return False
+        return not self.royal_rules.is_royal_piece(self.board.at(move.start))
+
+    def _royal_safety(self, side: Side2) -> RoyalSafety:
+        """
+        Check status and attack dependencies of `side`'s royal piece, cached
+        until the board's position hash changes.
+        """
+        position_hash = self.board.position_hash
+        if self._safety_hash != position_hash:
+            self._safety_hash = position_hash
+            self._safety.clear()
+        safety = self._safety.get(side)
+        if safety is None:
+            rules = self.royal_rules
+            royal = rules.royal_position(self.board, side)
+            if royal is None:
+                safety = RoyalSafety(False, frozenset())
+            else:
+                safety = RoyalSafety(
+                    rules.is_square_attacked(self.board, royal, not side),
+                    rules.attack_dependencies(self.board, royal, not side),
+                )
+            self._safety[side] = safety
+        return safety
+
+    def _simulate_resolved_board(
+        self, simulated_board: BoardSimulation, move: Move
+    ) -> None:
         simulated_piece = simulated_board.at(move.start)
         if simulated_piece is None:
             raise ValueError(f"No simulated piece at {move.start}")
@@ -94,8 +205,6 @@ class RoyalSafetyMoveManager(MoveManager, ABC):
         for effect in self._build_effects(move):
             effect.apply(simulated_board, move, simulated_piece)
 
-        return simulated_board
-
 
 class RoyalCheckmateCondition(WinCondition):
     """
@@ -116,7 +225,7 @@ class RoyalCheckmateCondition(WinCondition):
         side = game.current_side
         if side is None:
             return None
-        if not self.royal_rules.is_royal_in_check(game.board, side):
+        if not game.evaluation_context.in_check(self.royal_rules, side):
             return None
         if self.royal_rules.side_has_legal_move(game, side):
             return None
@@ -146,7 +255,7 @@ class RoyalStalemateCondition(WinCondition):
         side = game.current_side
         if side is None:
             return None
-        if self.royal_rules.is_royal_in_check(game.board, side):
+        if game.evaluation_context.in_check(self.royal_rules, side):
             return None
         if self.royal_rules.side_has_legal_move(game, side):
             return None
@@ -0,0 +1,47 @@
+"""
+Zobrist keys for incremental position hashing.
+
+A position hash is the XOR of one 64-bit key per occupied cell, so a
+single cell write updates it in O(1): XOR out the cell's old key, XOR in
+the new one. `Board` maintains `position_hash` this way.
+"""
+
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import Hashable
+
+
+class ZobristTable:
+    """
+    Lazily generated 64-bit keys, one per feature tuple.
+
+    A feature is any tuple of primitives, e.g. `(cell_index, symbol, side,
+    piece_state)`. Keys are derived from the feature's `repr` and the
+    table's `seed` rather than drawn from a shared random stream, so the
+    same feature maps to the same key on every board and in every process.
+    Features must therefore have a stable `repr` (ints, strings, bools,
+    None and tuples of those).
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        self.seed = seed
+        self._salt = seed.to_bytes(8, "little", signed=True)
+        self._keys: dict[Hashable, int] = {}
+
+    def key(self, *feature: Hashable) -> int:
+        """
+        Return the key for `feature`, generating it on first use.
+        """
+        key = self._keys.get(feature)
+        if key is None:
+            digest = blake2b(repr(feature).encode(), digest_size=8, key=self._salt)
+            key = int.from_bytes(digest.digest(), "little")
+            self._keys[feature] = key
+        return key
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+DEFAULT_ZOBRIST_TABLE = ZobristTable()
@@ -0,0 +1,41 @@
+"""
+Game-tree search over `Game`: engines that pick a move for the side to
+move using `Game.legal_moves` and `Game.push` / `Game.pop`.
+"""
+
+from cynmeith.search.alphabeta import AlphaBetaSearch, SearchResult, move_key
+from cynmeith.search.evaluation import (
+    WIN_SCORE,
+    Evaluator,
+    outcome_score,
+    score_evaluator,
+)
+from cynmeith.search.limits import SearchLimits, SearchStopped
+from cynmeith.search.mcts import MonteCarloTreeSearch, rollout
+from cynmeith.search.playout import (
+    PlayoutResult,
+    PlayoutStats,
+    RandomPlayout,
+    random_playout,
+)
+from cynmeith.search.transposition import TableEntry, TranspositionTable
+
+__all__ = [
+    "AlphaBetaSearch",
+    "Evaluator",
+    "MonteCarloTreeSearch",
+    "PlayoutResult",
+    "PlayoutStats",
+    "RandomPlayout",
+    "SearchLimits",
+    "SearchResult",
+    "SearchStopped",
+    "TableEntry",
+    "TranspositionTable",
+    "WIN_SCORE",
+    "move_key",
+    "outcome_score",
+    "random_playout",
+    "rollout",
+    "score_evaluator",
+]
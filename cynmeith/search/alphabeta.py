@@ -0,0 +1,373 @@
+"""
+Negamax alpha-beta search over `Game.push` / `Game.pop`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Hashable
+
+from cynmeith.core.move_codec import move_choice
+from cynmeith.core.move_effects import RemovePieceEffect
+from cynmeith.search.evaluation import (
+    WIN_SCORE,
+    Evaluator,
+    outcome_score,
+    piece_value,
+    score_evaluator,
+)
+from cynmeith.search.limits import MAX_DEPTH, SearchLimits, SearchStopped
+from cynmeith.search.transposition import EXACT, LOWER, UPPER, TranspositionTable
+from cynmeith.utils.aliases import Move
+
+if TYPE_CHECKING:
+    from cynmeith.core.game import Game
+
+_INFINITY = 1 << 62
+_KILLERS_PER_PLY = 2
+# Scores at least this large are wins or losses, stored in the table relative
+# to the node rather than the root so they stay valid at any ply.
+_MATE_BOUND = WIN_SCORE // 2
+
+MoveKey = tuple[Hashable, ...]
+
+
+def move_key(move: Move) -> MoveKey:
+    """
+    Identify a move across separately generated `Move` objects: its cells,
+    type and `move_choice` (the scalar `extra_info`, e.g. a promotion).
+    """
+    return (move.start, move.end, move.move_type, move_choice(move.extra_info))
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """
+    Outcome of a search: the best move found (None when the side to move
+    has none), its score for that side, the depth of the last completed
+    iteration, the nodes visited and the expected line of play. `stopped`
+    is set when a budget or `stop()` ended the search early.
+    """
+
+    move: Move | None
+    score: int
+    depth: int
+    nodes: int
+    principal_variation: tuple[Move, ...] = ()
+    stopped: bool = False
+
+
+class AlphaBetaSearch:
+    """
+    Negamax alpha-beta search with iterative deepening.
+
+    Works on any `Game` whose turn policy names the side to move. Turns of
+    several actions (a side moving again) keep the score's sign instead of
+    negating it. Moves come from `Game.legal_moves` and are tried in order:
+    the previous iteration's principal variation, captures by victim value
+    (least valuable attacker first), killer moves, then the rest.
+
+    Leaves are scored by `evaluator(game, side)`, by default
+    `score_evaluator`; finished games score through `outcome_score`.
+
+    Results are cached in a `TranspositionTable` of `table_entries` slots
+    keyed by `Game.state_hash`, kept across searches; its best moves are
+    tried right after the principal variation. `table_entries=0` disables
+    it. The key does not cover move history, so games whose outcome depends
+    on repetition or move counts may see those detected late.
+
+    Searches can be bounded by time and nodes, and cancelled with `stop()`
+    from another thread or by cancelling `search_async`.
+    """
+
+    def __init__(
+        self, evaluator: Evaluator = score_evaluator, table_entries: int = 1 << 16
+    ) -> None:
+        self.evaluator = evaluator
+        self.table = TranspositionTable(table_entries) if table_entries else None
+        self.nodes = 0
+        self._killers: dict[int, list[MoveKey]] = {}
+        self._pv_hint: tuple[Move, ...] = ()
+        self._root_best: tuple[int, list[Move]] | None = None
+        self._limits = SearchLimits()
+        self._stop_event = threading.Event()
+
+    def search(
+        self,
+        game: Game,
+        depth: int | None = None,
+        *,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+        stop_event: threading.Event | None = None,
+    ) -> SearchResult:
+        """
+        Search `game` one ply deeper at a time, up to `depth` plies (or
+        `MAX_DEPTH` without one), and return the last finished iteration's
+        result. The game is left as it was.
+
+        `time_limit` (seconds) and `node_limit` end the search early, as do
+        `stop()` and setting `stop_event`; the running iteration is then
+        abandoned. When not even the first iteration finished, the result
+        holds the best root move found so far, or failing that the first
+        ordered legal move.
+
+        Each search gets its own stop token: `stop_event` if given, else a
+        fresh one. A caller that may cancel before the search starts (e.g.
+        from another thread) should create the event and pass it in; one
+        that is already set stops the search at its first node.
+        """
+        side = game.current_side
+        if side is None:
+            raise ValueError("Search needs a turn policy with a side to move.")
+        if depth is None:
+            if time_limit is None and node_limit is None:
+                raise ValueError("Search needs a depth, time_limit or node_limit.")
+            depth = MAX_DEPTH
+        if depth < 1:
+            raise ValueError("Search depth must be at least 1.")
+
+        if stop_event is None:
+            stop_event = threading.Event()
+        self._stop_event = stop_event
+        self._limits = SearchLimits(time_limit, node_limit, stop_event)
+        self.nodes = 0
+        self._killers.clear()
+        self._pv_hint = ()
+        if self.table is not None:
+            self.table.new_search()
+        result = SearchResult(None, self.evaluator(game, side), 0, 0)
+        for iteration in range(1, depth + 1):
+            self._root_best = None
+            try:
+                score, line = self._negamax(game, iteration, -_INFINITY, _INFINITY, 0)
+            except SearchStopped:
+                return self._stopped_result(game, result)
+            self._pv_hint = tuple(line)
+            result = SearchResult(
+                line[0] if line else None, score, iteration, self.nodes, tuple(line)
+            )
+            if not line:
+                break
+        return result
+
+    async def search_async(
+        self,
+        game: Game,
+        depth: int | None = None,
+        *,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+    ) -> SearchResult:
+        """
+        Run `search` in the event loop's default executor. Cancelling the
+        awaiting task stops the search and waits for the game to be restored
+        before the cancellation propagates. The search's stop token is armed
+        before it is submitted, so a cancellation (or `stop()`) that lands
+        while the executor is still busy makes it return at once. Do not
+        touch `game` meanwhile.
+        """
+        stop_event = threading.Event()
+        self._stop_event = stop_event
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            None,
+            lambda: self.search(
+                game,
+                depth,
+                time_limit=time_limit,
+                node_limit=node_limit,
+                stop_event=stop_event,
+            ),
+        )
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            stop_event.set()
+            await asyncio.wait([future])
+            raise
+
+    def stop(self) -> None:
+        """
+        Ask the running search (or the one `search_async` has queued) to
+        stop. Safe to call from any thread; the search returns its last
+        finished iteration soon after. To cancel a search that may not have
+        started yet, pass `search` a `stop_event` and set that instead.
+        """
+        self._stop_event.set()
+
+    def _stopped_result(self, game: Game, result: SearchResult) -> SearchResult:
+        if result.move is None and self._root_best is not None:
+            score, line = self._root_best
+            result = SearchResult(line[0], score, 0, 0, tuple(line))
+        elif result.move is None and result.depth == 0:
+            moves = self._ordered_moves(game, 0)
+            if moves:
+                result = SearchResult(moves[0], result.score, 0, 0, (moves[0],))
+        return SearchResult(
+            result.move,
+            result.score,
+            result.depth,
+            self.nodes,
+            result.principal_variation,
+            stopped=True,
+        )
+
+    def _negamax(
+        self, game: Game, depth: int, alpha: int, beta: int, ply: int
+    ) -> tuple[int, list[Move]]:
+        """
+        Score the position for the side to move, with the line that gets it.
+        """
+        if self.nodes >= self._limits.next_check:
+            self._limits.check(self.nodes)
+        self.nodes += 1
+        side = game.current_side
+        assert side is not None
+        outcome = game.outcome
+        if outcome is not None:
+            return outcome_score(outcome, side, ply), []
+        if depth == 0:
+            return self.evaluator(game, side), []
+
+        table, key, table_move = self.table, 0, None
+        if table is not None:
+            key = game.state_hash
+            entry = table.probe(key)
+            if entry is not None:
+                table_move = entry.move_code
+                if ply > 0 and entry.depth >= depth:
+                    score = _score_from_table(entry.score, ply)
+                    if entry.bound == EXACT:
+                        return score, self._table_line(game, table_move)
+                    if entry.bound == LOWER:
+                        alpha = max(alpha, score)
+                    else:
+                        beta = min(beta, score)
+                    if alpha >= beta:
+                        return score, []
+
+        moves = self._ordered_moves(game, ply, table_move)
+        if not moves:
+            return self.evaluator(game, side), []
+
+        original_alpha = alpha
+        best_score, best_line = -_INFINITY, []
+        for move in moves:
+            game.push(move, validate=False, evaluate=True)
+            try:
+                if game.current_side == side:
+                    score, line = self._negamax(game, depth - 1, alpha, beta, ply + 1)
+                else:
+                    score, line = self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+                    score = -score
+            finally:
+                game.pop()
+            if score > best_score:
+                best_score, best_line = score, [move, *line]
+                if ply == 0:
+                    self._root_best = best_score, best_line
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                if not self._is_capture(game, move):
+                    self._add_killer(ply, move_key(move))
+                break
+
+        if table is not None:
+            if best_score <= original_alpha:
+                bound = UPPER
+            elif best_score >= beta:
+                bound = LOWER
+            else:
+                bound = EXACT
+            table.store(
+                key,
+                depth,
+                _score_to_table(best_score, ply),
+                bound,
+                game.move_codec.encode(best_line[0]),
+            )
+        return best_score, best_line
+
+    @staticmethod
+    def _table_line(game: Game, move_code: int | None) -> list[Move]:
+        """
+        The line for a table cutoff: the stored best move, decoded from its
+        packed code without generating the position's moves. It is the bare
+        request, with its choice but without effects, which is all move
+        ordering needs.
+        """
+        if move_code is None:
+            return []
+        return [game.move_codec.decode(move_code)]
+
+    def _ordered_moves(
+        self, game: Game, ply: int, table_move: int | None = None
+    ) -> list[Move]:
+        moves = game.legal_moves()
+        if len(moves) < 2:
+            return moves
+        hint = move_key(self._pv_hint[ply]) if ply < len(self._pv_hint) else None
+        encode = game.move_codec.encode
+        killers = self._killers.get(ply, ())
+        value = piece_value(game)
+        board = game.board
+
+        def priority(move: Move) -> int:
+            key = move_key(move)
+            if key == hint:
+                return _INFINITY
+            if table_move is not None and encode(move) == table_move:
+                return _INFINITY - 1
+            victims = [board._get_raw(move.end)] if board.is_in_bounds(move.end) else []
+            for effect in move.effects:
+                if isinstance(effect, RemovePieceEffect):
+                    victims.append(board._get_raw(effect.position))
+            gain = sum(value(victim.symbol) for victim in victims if victim is not None)
+            if gain:
+                attacker = (
+                    board._get_raw(move.start)
+                    if board.is_in_bounds(move.start)
+                    else None
+                )
+                cost = value(attacker.symbol) if attacker is not None else 0
+                return 1_000 + 16 * gain - cost
+            if key in killers:
+                return 500
+            return 0
+
+        moves.sort(key=priority, reverse=True)
+        return moves
+
+    @staticmethod
+    def _is_capture(game: Game, move: Move) -> bool:
+        board = game.board
+        if board.is_in_bounds(move.end) and board._get_raw(move.end) is not None:
+            return True
+        return any(isinstance(effect, RemovePieceEffect) for effect in move.effects)
+
+    def _add_killer(self, ply: int, key: MoveKey) -> None:
+        killers = self._killers.setdefault(ply, [])
+        if key in killers:
+            return
+        killers.insert(0, key)
+        del killers[_KILLERS_PER_PLY:]
+
+
+def _score_to_table(score: int, ply: int) -> int:
+    if score >= _MATE_BOUND:
+        return score + ply
+    if score <= -_MATE_BOUND:
+        return score - ply
+    return score
+
+
+def _score_from_table(score: int, ply: int) -> int:
+    if score >= _MATE_BOUND:
+        return score - ply
+    if score <= -_MATE_BOUND:
+        return score + ply
+    return score
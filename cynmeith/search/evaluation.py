@@ -0,0 +1,57 @@
+"""
+Static evaluation shared by the search engines.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from cynmeith.core.game_systems import GameOutcome, MaterialScoreSystem
+from cynmeith.utils.aliases import PieceSymbol, Side2
+
+if TYPE_CHECKING:
+    from cynmeith.core.game import Game
+
+
+Evaluator = Callable[["Game", Side2], int]
+"""Score of a non-terminal position from `side`'s point of view."""
+
+WIN_SCORE = 1_000_000
+"""Score of a won position; wins found sooner score slightly higher."""
+
+
+def score_evaluator(game: Game, side: Side2) -> int:
+    """
+    Default evaluator: `side`'s score minus its opponent's from the game's
+    `ScoringSystem`, or the piece-count difference when it has none.
+    """
+    scores = game.get_scores()
+    if scores is None:
+        board = game.board
+        return board.count_pieces(side) - board.count_pieces(not side)
+    return scores.get(side, 0) - scores.get(not side, 0)
+
+
+def outcome_score(outcome: GameOutcome, side: Side2, ply: int = 0) -> int:
+    """
+    Score of a finished game for `side`, `ply` moves below the search root.
+
+    Draws (no winner) score 0. Wins and losses score `WIN_SCORE` less the
+    ply, so a search prefers quicker wins and slower losses.
+    """
+    if outcome.winner is None:
+        return 0
+    score = WIN_SCORE - ply
+    return score if outcome.winner == side else -score
+
+
+def piece_value(game: Game) -> Callable[[PieceSymbol], int]:
+    """
+    Piece values for move ordering: the game's `MaterialScoreSystem` values
+    when it has one, otherwise 1 for every piece.
+    """
+    scoring = game.scoring_system
+    if isinstance(scoring, MaterialScoreSystem):
+        values, default = scoring.piece_values, scoring.default_value
+        return lambda symbol: values.get(symbol.upper(), default)
+    return lambda symbol: 1
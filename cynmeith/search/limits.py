@@ -0,0 +1,74 @@
+"""
+Time, node and cancellation budgets for the search engines.
+"""
+
+from __future__ import annotations
+
+import threading
+from time import monotonic
+
+MAX_DEPTH = 64
+"""Deepest iteration a search runs to when it is given no depth."""
+
+CHECK_INTERVAL = 64
+"""Nodes between two clock and cancellation checks."""
+
+
+class SearchStopped(Exception):
+    """
+    Raised inside a search when its budget runs out or it is cancelled.
+    Engines catch it and return the result of their last finished iteration.
+    """
+
+
+class SearchLimits:
+    """
+    Budget of one search: `time_limit` seconds from construction (on the
+    `time.monotonic` clock), at most `node_limit` nodes, and a `stop_event`
+    another thread can set to cancel it.
+
+    Call `check(nodes)` before visiting each node, with the nodes visited so
+    far. It is cheap: it only reads the clock and the event once `nodes`
+    reaches `next_check`, every `check_interval` nodes, and raises
+    `SearchStopped` when the budget is spent. Engines whose nodes are slow
+    (e.g. one rollout each) pass a smaller `check_interval`.
+    """
+
+    def __init__(
+        self,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+        stop_event: threading.Event | None = None,
+        check_interval: int = CHECK_INTERVAL,
+    ) -> None:
+        if time_limit is not None and time_limit < 0:
+            raise ValueError("Search time limit cannot be negative.")
+        if node_limit is not None and node_limit < 1:
+            raise ValueError("Search node limit must be at least 1.")
+        self.deadline = None if time_limit is None else monotonic() + time_limit
+        self.node_limit = node_limit
+        self.stop_event = stop_event
+        self.check_interval = max(1, check_interval)
+        # The first node checks, so a spent budget stops the search at once.
+        self.next_check = 0
+
+    def check(self, nodes: int) -> None:
+        """
+        Raise `SearchStopped` if the search should end after `nodes` nodes
+        rather than visit another.
+        """
+        if nodes < self.next_check:
+            return
+        if self.node_limit is not None and nodes >= self.node_limit:
+            raise SearchStopped("node limit reached")
+        if self.deadline is not None and monotonic() >= self.deadline:
+            raise SearchStopped("time limit reached")
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchStopped("search cancelled")
+        self._advance(nodes)
+
+    def _advance(self, nodes: int) -> None:
+        next_check = nodes + self.check_interval
+        if self.node_limit is not None:
+            next_check = min(next_check, self.node_limit)
+        self.next_check = next_check
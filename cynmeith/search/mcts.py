@@ -0,0 +1,437 @@
+"""
+Monte Carlo tree search over `Game.push` / `Game.pop`, with rollouts run
+in-process or in a `ProcessPoolExecutor`.
+"""
+
+from __future__ import annotations
+
+import math
+import pickle
+import random
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from cynmeith.core.game_systems import GameOutcome
+from cynmeith.search.alphabeta import MoveKey, SearchResult, move_key
+from cynmeith.search.evaluation import Evaluator, score_evaluator
+from cynmeith.search.limits import SearchLimits, SearchStopped
+from cynmeith.search.playout import random_playout
+from cynmeith.utils.aliases import Move, Side2
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from cynmeith.core.game import Game
+
+# How many plies below the previous root `search` looks for the new position
+# when reusing the tree (Exist turns are up to two actions per side).
+_REUSE_DEPTH = 4
+_SCORE_SCALE = 1000
+
+
+class _Node:
+    """
+    One tree node: the position reached by `move`, played by `mover`.
+    `wins` counts rollouts won by `mover` (draws count half).
+    """
+
+    __slots__ = (
+        "move",
+        "mover",
+        "parent",
+        "children",
+        "untried",
+        "visits",
+        "wins",
+        "key",
+        "outcome",
+        "generation",
+    )
+
+    def __init__(
+        self,
+        move: Move | None,
+        mover: Side2 | None,
+        parent: _Node | None,
+        key: int,
+        outcome: GameOutcome | None,
+        generation: int,
+    ) -> None:
+        self.move = move
+        self.mover = mover
+        self.parent = parent
+        self.children: list[_Node] = []
+        self.untried: list[Move] | None = None
+        self.visits = 0
+        self.wins = 0.0
+        self.key = key
+        self.outcome = outcome
+        self.generation = generation
+
+
+def rollout(
+    game: Game,
+    rng: random.Random,
+    max_plies: int,
+    evaluator: Evaluator = score_evaluator,
+) -> Side2 | None:
+    """
+    Play a `random_playout` from the current position and return the winner
+    (None for a draw). The game is left as it was.
+
+    A playout still running after `max_plies` plies, or stuck without a
+    move, is adjudicated by `evaluator` for the side to move: positive
+    wins, negative loses, zero draws.
+    """
+    result = random_playout(game, rng, max_plies, evaluator)
+    if result.outcome is not None:
+        return result.outcome.winner
+    side, score = result.side, result.score
+    if side is None or not score:
+        return None
+    return side if score > 0 else not side
+
+
+# Per-process cache of the last root position a worker unpickled.
+_worker_root: tuple[bytes, Game] | None = None
+
+
+def _rollout_task(
+    root: bytes,
+    path: tuple[MoveKey, ...],
+    max_plies: int,
+    evaluator: Evaluator,
+    seed: int,
+) -> Side2 | None:
+    """
+    Worker entry point: replay `path` from the pickled root game, then run
+    one `rollout` there.
+    """
+    global _worker_root
+    if _worker_root is None or _worker_root[0] != root:
+        _worker_root = root, pickle.loads(root)
+    game = _worker_root[1]
+    pushed = 0
+    try:
+        for key in path:
+            move = next(move for move in game.legal_moves() if move_key(move) == key)
+            game.push(move, validate=False, evaluate=True)
+            pushed += 1
+        return rollout(game, random.Random(seed), max_plies, evaluator)
+    finally:
+        for _ in range(pushed):
+            game.pop()
+
+
+class MonteCarloTreeSearch:
+    """
+    Monte Carlo tree search with UCT selection.
+
+    Each iteration walks the tree from the root, picking the child with the
+    best `wins / visits + exploration * sqrt(ln(parent visits) / visits)`,
+    adds one untried move, runs a random `rollout` from there (adjudicated
+    by `evaluator` after `rollout_plies`), and credits every node on the
+    path whose mover won. Rewards are kept per mover rather than negated,
+    so turns of several actions need no special handling.
+
+    The tree is kept between searches. `search` reuses the subtree of the
+    previous root whose position (by `Game.state_hash`) is the game's
+    current one, up to four plies down, so the statistics gathered for the
+    replies to the last move carry over.
+
+    With `workers > 0` rollouts run in a `ProcessPoolExecutor` of that
+    many processes. Each round then selects `workers` leaves, using a
+    virtual loss so they differ, and runs their rollouts in parallel. The
+    game and `evaluator` must be picklable: each task carries the pickled
+    root game (a worker unpickles it once per search) and the leaf's moves
+    to replay before its rollout. Call `close()`, or use the engine as a
+    context manager, to shut the pool down.
+    """
+
+    def __init__(
+        self,
+        exploration: float = math.sqrt(2),
+        rollout_plies: int = 200,
+        workers: int = 0,
+        evaluator: Evaluator = score_evaluator,
+        seed: int | None = None,
+    ) -> None:
+        if workers < 0:
+            raise ValueError("MCTS workers cannot be negative.")
+        self.exploration = exploration
+        self.rollout_plies = rollout_plies
+        self.workers = workers
+        self.evaluator = evaluator
+        self.nodes = 0
+        self._rng = random.Random(seed)
+        self._root: _Node | None = None
+        self._generation = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._stop_event = threading.Event()
+
+    def __enter__(self) -> MonteCarloTreeSearch:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool, if one was started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def stop(self) -> None:
+        """
+        Ask the running search to stop after its current round. Safe to call
+        from any thread. To cancel a search that may not have started yet,
+        pass `search` a `stop_event` and set that instead.
+        """
+        self._stop_event.set()
+
+    @property
+    def root_visits(self) -> int:
+        """
+        Rollouts recorded at the current root, including those kept from
+        earlier searches.
+        """
+        return self._root.visits if self._root is not None else 0
+
+    def reset(self) -> None:
+        """
+        Drop the search tree, so the next search starts from scratch.
+        """
+        self._root = None
+
+    def search(
+        self,
+        game: Game,
+        iterations: int | None = None,
+        *,
+        time_limit: float | None = None,
+        stop_event: threading.Event | None = None,
+    ) -> SearchResult:
+        """
+        Run `iterations` rollouts (or until `time_limit` seconds, `stop()` or
+        `stop_event` is set) and return the most visited root move. The game
+        is left as it was. Each search gets its own stop token, as in
+        `AlphaBetaSearch.search`.
+
+        In the result, `score` is that move's mean reward scaled to -1000
+        (always lost) .. 1000 (always won), `nodes` the rollouts run by this
+        search, and `principal_variation` the most visited line, whose
+        length is `depth`.
+        """
+        side = game.current_side
+        if side is None:
+            raise ValueError("Search needs a turn policy with a side to move.")
+        if iterations is None and time_limit is None:
+            raise ValueError("Search needs iterations or a time_limit.")
+
+        if stop_event is None:
+            stop_event = threading.Event()
+        self._stop_event = stop_event
+        limits = SearchLimits(time_limit, iterations, stop_event, 1)
+        self._generation += 1
+        root = self._reuse_root(game)
+        self.nodes = 0
+        blob = pickle.dumps(game) if self.workers else b""
+        stopped = False
+        try:
+            while True:
+                limits.check(self.nodes)
+                if root.outcome is not None:
+                    break
+                if not self.workers:
+                    self._iterate(game, root)
+                    continue
+                batch = self.workers
+                if iterations is not None:
+                    batch = min(batch, iterations - self.nodes)
+                self._parallel_round(game, root, blob, batch)
+        except SearchStopped:
+            stopped = iterations is None or self.nodes < iterations
+        return self._result(root, stopped)
+
+    def _reuse_root(self, game: Game) -> _Node:
+        key = game.state_hash
+        found = None
+        if self._root is not None:
+            frontier = deque([(self._root, 0)])
+            while frontier:
+                node, depth = frontier.popleft()
+                if node.key == key:
+                    found = node
+                    break
+                if depth < _REUSE_DEPTH:
+                    frontier.extend((child, depth + 1) for child in node.children)
+        if found is None:
+            found = _Node(None, None, None, key, game.outcome, self._generation)
+        found.parent = None
+        found.move = None
+        self._root = found
+        return found
+
+    def _iterate(self, game: Game, root: _Node) -> None:
+        node, pushed = self._select(game, root)
+        try:
+            if node.outcome is not None:
+                winner = node.outcome.winner
+            else:
+                winner = rollout(game, self._rng, self.rollout_plies, self.evaluator)
+        finally:
+            for _ in range(pushed):
+                game.pop()
+        self._backpropagate(node, winner)
+        self.nodes += 1
+
+    def _parallel_round(self, game: Game, root: _Node, blob: bytes, batch: int) -> None:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        leaves: list[tuple[_Node, Future[Side2 | None] | None]] = []
+        for _ in range(batch):
+            node, pushed = self._select(game, root)
+            path = [move_key(game.pop()) for _ in range(pushed)]
+            path.reverse()
+            # Virtual loss: count the pending rollout as a loss for every
+            # mover on the path, steering the next selection elsewhere.
+            self._add_visit(node)
+            future = None
+            if node.outcome is None:
+                future = self._executor.submit(
+                    _rollout_task,
+                    blob,
+                    tuple(path),
+                    self.rollout_plies,
+                    self.evaluator,
+                    self._rng.getrandbits(64),
+                )
+            leaves.append((node, future))
+        for node, future in leaves:
+            if future is None:
+                assert node.outcome is not None
+                winner = node.outcome.winner
+            else:
+                winner = future.result()
+            self._add_visit(node, -1)
+            self._backpropagate(node, winner)
+            self.nodes += 1
+
+    def _select(self, game: Game, root: _Node) -> tuple[_Node, int]:
+        """
+        Descend from `root`, pushing each chosen move, and expand one child.
+        Returns the node reached and how many moves were pushed.
+        """
+        node, pushed = root, 0
+        try:
+            while node.outcome is None:
+                if node.untried is None or node.generation != self._generation:
+                    self._refresh(game, node)
+                assert node.untried is not None
+                if node.untried:
+                    move = node.untried.pop(self._rng.randrange(len(node.untried)))
+                    mover = game.current_side
+                    game.push(move, validate=False, evaluate=True)
+                    pushed += 1
+                    child = _Node(
+                        move,
+                        mover,
+                        node,
+                        game.state_hash,
+                        game.outcome,
+                        self._generation,
+                    )
+                    node.children.append(child)
+                    return child, pushed
+                if not node.children:
+                    break
+                node = self._best_child(node)
+                assert node.move is not None
+                game.push(node.move, validate=False, evaluate=True)
+                pushed += 1
+        except BaseException:
+            for _ in range(pushed):
+                game.pop()
+            raise
+        return node, pushed
+
+    def _refresh(self, game: Game, node: _Node) -> None:
+        """
+        Generate `node`'s moves, or on a node kept from an earlier search
+        swap its stored moves for freshly resolved ones: their `extra_info`
+        may name pieces from an earlier state of the game.
+        """
+        moves = {move_key(move): move for move in game.legal_moves()}
+        if node.untried is None:
+            node.untried = list(moves.values())
+        else:
+            children = []
+            for child in node.children:
+                assert child.move is not None
+                fresh = moves.pop(move_key(child.move), None)
+                if fresh is not None:
+                    child.move = fresh
+                    children.append(child)
+            node.children = children
+            untried = {move_key(move) for move in node.untried}
+            node.untried = [move for key, move in moves.items() if key in untried]
+        node.generation = self._generation
+
+    def _best_child(self, node: _Node) -> _Node:
+        log_visits = math.log(max(node.visits, 1))
+        exploration = self.exploration
+
+        def uct(child: _Node) -> float:
+            if child.visits == 0:
+                return math.inf
+            return child.wins / child.visits + exploration * math.sqrt(
+                log_visits / child.visits
+            )
+
+        return max(node.children, key=uct)
+
+    @staticmethod
+    def _add_visit(node: _Node | None, count: int = 1) -> None:
+        while node is not None:
+            node.visits += count
+            node = node.parent
+
+    @staticmethod
+    def _backpropagate(node: _Node | None, winner: Side2 | None) -> None:
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.mover:
+                node.wins += 1.0
+            node = node.parent
+
+    def _result(self, root: _Node, stopped: bool) -> SearchResult:
+        line: list[Move] = []
+        score = 0
+        node = root
+        while node.children:
+            node = max(node.children, key=lambda child: child.visits)
+            if node.visits == 0:
+                break
+            assert node.move is not None
+            if not line:
+                score = round(_SCORE_SCALE * (2 * node.wins / node.visits - 1))
+            line.append(node.move)
+        return SearchResult(
+            line[0] if line else None,
+            score,
+            len(line),
+            self.nodes,
+            tuple(line),
+            stopped,
+        )
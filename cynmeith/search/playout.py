@@ -0,0 +1,124 @@
+"""
+Fast uniformly random playouts, for Monte Carlo statistics and fuzzing.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from cynmeith.core.game_systems import GameOutcome
+from cynmeith.search.evaluation import Evaluator
+from cynmeith.utils.aliases import Side2
+
+if TYPE_CHECKING:
+    from cynmeith.core.game import Game
+
+
+@dataclass(frozen=True)
+class PlayoutResult:
+    """
+    How one playout ended: its `outcome` (None when it hit the ply limit or
+    the side to move had no move but no win condition fired), the plies
+    played, the side to move at the end, and that side's `evaluator` score
+    when the playout ended unfinished and an evaluator was given.
+    """
+
+    outcome: GameOutcome | None
+    plies: int
+    side: Side2 | None
+    score: int | None = None
+
+
+def random_playout(
+    game: Game,
+    rng: random.Random,
+    max_plies: int,
+    evaluator: Evaluator | None = None,
+) -> PlayoutResult:
+    """
+    Play uniformly random legal moves from the current position until the
+    game ends or `max_plies` plies, then take them all back.
+
+    Each ply draws its move with `Game.random_legal_move`, which resolves
+    only as many candidates as it needs, and pushes it without evaluating.
+    The win conditions run once the next move has been drawn, so those
+    asking whether the side to move can move reuse that answer.
+    """
+    plies = 0
+    outcome = game.outcome
+    try:
+        move = game.random_legal_move(rng) if outcome is None else None
+        while move is not None and plies < max_plies:
+            game.push(move, validate=False, evaluate=False)
+            plies += 1
+            move = game.random_legal_move(rng)
+            outcome = game.evaluate_outcome()
+            if outcome is not None:
+                break
+        side = game.current_side
+        score = None
+        if outcome is None and evaluator is not None and side is not None:
+            score = evaluator(game, side)
+        return PlayoutResult(outcome, plies, side, score)
+    finally:
+        for _ in range(plies):
+            game.pop()
+
+
+@dataclass
+class PlayoutStats:
+    """
+    Totals over a batch of playouts. `unfinished` counts playouts that
+    ended without an outcome.
+    """
+
+    playouts: int = 0
+    plies: int = 0
+    seconds: float = 0.0
+    wins: dict[Side2, int] = field(default_factory=lambda: {True: 0, False: 0})
+    draws: int = 0
+    unfinished: int = 0
+
+    @property
+    def plies_per_second(self) -> float:
+        return self.plies / self.seconds if self.seconds else 0.0
+
+
+class RandomPlayout:
+    """
+    Runs batches of `random_playout`s of at most `max_plies` plies, seeded
+    by `seed`, and reports their results and speed.
+    """
+
+    def __init__(self, max_plies: int = 200, seed: int | None = None) -> None:
+        self.max_plies = max_plies
+        self.rng = random.Random(seed)
+
+    def play(self, game: Game) -> PlayoutResult:
+        """
+        Run one playout from the current position. The game is left as it
+        was.
+        """
+        return random_playout(game, self.rng, self.max_plies)
+
+    def run(self, game: Game, playouts: int) -> PlayoutStats:
+        """
+        Run `playouts` playouts from the current position and total them.
+        """
+        stats = PlayoutStats()
+        started = perf_counter()
+        for _ in range(playouts):
+            result = random_playout(game, self.rng, self.max_plies)
+            stats.playouts += 1
+            stats.plies += result.plies
+            if result.outcome is None:
+                stats.unfinished += 1
+            elif result.outcome.winner is None:
+                stats.draws += 1
+            else:
+                stats.wins[result.outcome.winner] += 1
+        stats.seconds = perf_counter() - started
+        return stats
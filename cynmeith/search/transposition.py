@@ -0,0 +1,146 @@
+"""
+Fixed-size transposition table for the search engines.
+
+Entries live in preallocated `array`s, so the table's memory is set when it
+is built and never grows. Buckets hold two slots: the first keeps the
+deepest result seen for its bucket in the current search, the second always
+takes the newest store.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+
+EXACT = 0
+"""The stored score is the node's exact value."""
+LOWER = 1
+"""The search failed high: the node's value is at least the stored score."""
+UPPER = 2
+"""The search failed low: the node's value is at most the stored score."""
+
+_EMPTY = -1
+_KEY_MASK = (1 << 64) - 1
+
+
+@dataclass(frozen=True)
+class TableEntry:
+    """
+    One stored search result: the remaining depth it was searched to, its
+    score, which bound the score is (`EXACT`, `LOWER` or `UPPER`) and the
+    packed code of the best move found, if any.
+    """
+
+    depth: int
+    score: int
+    bound: int
+    move_code: int | None
+
+
+class TranspositionTable:
+    """
+    Maps 64-bit position keys (`Game.state_hash`) to search results.
+
+    `entries` is rounded up to a power of two and split into two-slot
+    buckets. `store` writes the first slot when it is empty, holds the same
+    key, holds a result from an earlier search (see `new_search`) or holds a
+    result no deeper than the new one; otherwise the second slot is
+    overwritten. `probe` checks both slots.
+
+    `hits`, `misses`, `stores` and `replacements` (stores that evicted a
+    different position) count since the table was built or last cleared.
+    """
+
+    def __init__(self, entries: int = 1 << 16) -> None:
+        if entries < 2:
+            raise ValueError("A transposition table needs at least 2 entries.")
+        self.size = 1 << (entries - 1).bit_length()
+        self._bucket_mask = (self.size >> 1) - 1
+        self._keys = array("Q", bytes(8 * self.size))
+        self._depths = array("h", [_EMPTY]) * self.size
+        self._scores = array("q", bytes(8 * self.size))
+        self._bounds = array("B", bytes(self.size))
+        # Move codes are stored plus one, so 0 means "no move".
+        self._moves = array("Q", bytes(8 * self.size))
+        self._generations = array("B", bytes(self.size))
+        self._generation = 0
+        self._filled = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replacements = 0
+
+    @property
+    def hit_rate(self) -> float:
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def new_search(self) -> None:
+        """
+        Mark the start of a new search: entries stored before it stay
+        readable but give up their depth-preferred slots to new results.
+        """
+        self._generation = (self._generation + 1) & 0xFF
+
+    def clear(self) -> None:
+        """
+        Empty the table and reset its counters.
+        """
+        for index in range(self.size):
+            self._depths[index] = _EMPTY
+        self._filled = 0
+        self.hits = self.misses = self.stores = self.replacements = 0
+
+    def probe(self, key: int) -> TableEntry | None:
+        """
+        Return the entry stored for `key`, or None.
+        """
+        key &= _KEY_MASK
+        index = (key & self._bucket_mask) << 1
+        keys, depths = self._keys, self._depths
+        for slot in (index, index + 1):
+            if keys[slot] == key and depths[slot] != _EMPTY:
+                self.hits += 1
+                move = self._moves[slot]
+                return TableEntry(
+                    depths[slot],
+                    self._scores[slot],
+                    self._bounds[slot],
+                    move - 1 if move else None,
+                )
+        self.misses += 1
+        return None
+
+    def store(
+        self, key: int, depth: int, score: int, bound: int, move_code: int | None
+    ) -> None:
+        """
+        Record a search result for `key`, per the bucket's replacement policy.
+        """
+        key &= _KEY_MASK
+        slot = (key & self._bucket_mask) << 1
+        keys, depths = self._keys, self._depths
+        if not (
+            depths[slot] == _EMPTY
+            or keys[slot] == key
+            or self._generations[slot] != self._generation
+            or depths[slot] <= depth
+        ):
+            slot += 1
+        if depths[slot] == _EMPTY:
+            self._filled += 1
+        elif keys[slot] != key:
+            self.replacements += 1
+        elif move_code is None:
+            # Keep the best move of a shallower result for the same position.
+            move_code = self._moves[slot] - 1 if self._moves[slot] else None
+        keys[slot] = key
+        depths[slot] = depth
+        self._scores[slot] = score
+        self._bounds[slot] = bound
+        self._moves[slot] = 0 if move_code is None else move_code + 1
+        self._generations[slot] = self._generation
+        self.stores += 1
+
+    def __len__(self) -> int:
+        return self._filled
@@ -5,11 +5,13 @@ Contains type aliases and dataclasses for the game.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, TypeAlias
 
 from cynmeith.utils.coord import Coord
 
 if TYPE_CHECKING:
+    from cynmeith.core.move_effects import MoveEffect
     from cynmeith.core.piece import Piece
 
 Side2: TypeAlias = bool
@@ -34,7 +36,7 @@ class MoveKeys:
     but engine-handled keys are centralized here to avoid stray magic strings.
     """
 
-    EFFECTS = "effects"  # list[MoveEffect] applied after the actor move
+    EFFECTS = "effects"  # tuple (or list) of MoveEffect applied after the actor move
     MOVE_ACTOR = "move_actor"  # bool: whether the actor piece itself moves
     ACTOR_PIECE = "actor_piece"  # Piece used by turn/phase/resource systems
 
@@ -58,6 +60,26 @@ class Move:
     def __bool__(self) -> bool:
         return bool(self.start) and bool(self.end)
 
+    @cached_property
+    def effects(self) -> tuple[MoveEffect, ...]:
+        """
+        The `MoveEffect`s in `extra_info[MoveKeys.EFFECTS]` as a tuple, built
+        on first access and then shared by every simulation, application and
+        history entry that uses this move. Other objects in the list are
+        ignored.
+        """
+        # Imported here: move_effects itself imports from cynmeith.utils.
+        from cynmeith.core.move_effects import MoveEffect
+
+        effects = self.extra_info.get(MoveKeys.EFFECTS) if self.extra_info else None
+        if not isinstance(effects, (tuple, list)):
+            return ()
+        if isinstance(effects, tuple) and all(
+            isinstance(effect, MoveEffect) for effect in effects
+        ):
+            return effects
+        return tuple(effect for effect in effects if isinstance(effect, MoveEffect))
+
 
 Ending: TypeAlias = str
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from math import trunc
 from typing import TYPE_CHECKING, Callable
 
@@ -8,46 +8,86 @@ if TYPE_CHECKING:
     from cynmeith.utils import Side2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Coord:
     """
     Represents a 2D coordinate.
+
+    Instances are slotted and cache their hash, so they are cheap to keep
+    in sets and dict keys. Hot loops should prefer the interned instances
+    handed out by `Board` (`coord`, `offset`, the iterators) and the shared
+    direction vectors below over building new coordinates.
     """
 
     r: int
     c: int
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.r, self.c)))
+
+    def __hash__(self) -> int:
+        return self._hash
 
     @staticmethod
     def null() -> Coord:
-        return Coord(-1, -1)
+        return _NULL
 
     @staticmethod
     def up() -> Coord:
         """
         Get the unit vector pointing up.
         """
-        return Coord(-1, 0)
+        return _UP
 
     @staticmethod
     def down() -> Coord:
         """
         Get the unit vector pointing down.
         """
-        return Coord(1, 0)
+        return _DOWN
 
     @staticmethod
     def left() -> Coord:
         """
         Get the unit vector pointing left.
         """
-        return Coord(0, -1)
+        return _LEFT
 
     @staticmethod
     def right() -> Coord:
         """
         Get the unit vector pointing right.
         """
-        return Coord(0, 1)
+        return _RIGHT
+
+    @staticmethod
+    def orthogonals() -> tuple[Coord, ...]:
+        """
+        Get the four orthogonal unit vectors (up, down, left, right).
+        """
+        return _ORTHOGONALS
+
+    @staticmethod
+    def diagonals() -> tuple[Coord, ...]:
+        """
+        Get the four diagonal unit vectors.
+        """
+        return _DIAGONALS
+
+    @staticmethod
+    def omnidirectionals() -> tuple[Coord, ...]:
+        """
+        Get the eight orthogonal and diagonal unit vectors.
+        """
+        return _OMNIDIRECTIONALS
+
+    @staticmethod
+    def lshapes() -> tuple[Coord, ...]:
+        """
+        Get the eight L-shaped (Knight) offsets.
+        """
+        return _LSHAPES
 
     @staticmethod
     def from_str(coord_str: str, delimiter: str = ":") -> Coord:
@@ -282,3 +322,23 @@ class Coord:
         dr = other.r - self.r
         dc = other.c - self.c
         return Coord(dr // abs(dr) if dr else 0, dc // abs(dc) if dc else 0)
+
+
+_NULL = Coord(-1, -1)
+_UP = Coord(-1, 0)
+_DOWN = Coord(1, 0)
+_LEFT = Coord(0, -1)
+_RIGHT = Coord(0, 1)
+_ORTHOGONALS = (_UP, _DOWN, _LEFT, _RIGHT)
+_DIAGONALS = (Coord(-1, -1), Coord(-1, 1), Coord(1, -1), Coord(1, 1))
+_OMNIDIRECTIONALS = _ORTHOGONALS + _DIAGONALS
+_LSHAPES = (
+    Coord(-2, -1),
+    Coord(-2, 1),
+    Coord(-1, -2),
+    Coord(-1, 2),
+    Coord(1, -2),
+    Coord(1, 2),
+    Coord(2, -1),
+    Coord(2, 1),
+)
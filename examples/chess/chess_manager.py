@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from cynmeith import MoveManager, RoyalSafetyMoveManager
 from cynmeith.core.move_effects import EffectPresets, PromotePieceEffect
 from cynmeith.core.piece import Piece
@@ -8,6 +10,8 @@ from .pawn import Pawn
 from .rook import Rook
 from .royal_rules import CHESS_ROYAL_RULES
 
+PROMOTION_CHOICES = ("Q", "R", "B", "N")
+
 
 class ChessManager(RoyalSafetyMoveManager):
     @property
@@ -53,6 +57,20 @@ class ChessManager(RoyalSafetyMoveManager):
 
         return move
 
+    def expand_request(self, move: Move) -> Iterator[Move]:
+        piece = self.board.at(move.start)
+        if (
+            isinstance(piece, Pawn)
+            and self._is_promotion_rank(piece, move.end)
+            and "promotion" not in self._build_extra_info(move)
+        ):
+            for symbol in PROMOTION_CHOICES:
+                extra = dict(self._build_extra_info(move))
+                extra["promotion"] = symbol
+                yield Move(move.start, move.end, move.move_type, extra)
+        else:
+            yield move
+
     def apply_move(self, move: Move, piece: Piece) -> None:
         if isinstance(piece, Pawn) and self._is_promotion_rank(piece, move.end):
             extra = self._build_extra_info(move)
@@ -60,14 +78,9 @@ class ChessManager(RoyalSafetyMoveManager):
             if not isinstance(promotion_symbol, str) or not promotion_symbol.strip():
                 raise InvalidMoveError("Promotion piece must be specified.")
 
-            merged = dict(extra)
-            merged_effects = []
-            effects = merged.get(MoveKeys.EFFECTS)
-            if isinstance(effects, list):
-                merged_effects.extend(effects)
-            merged_effects.append(PromotePieceEffect(promotion_symbol))
-            merged[MoveKeys.EFFECTS] = merged_effects
-            move = Move(move.start, move.end, move.move_type, merged)
+            move = self._with_effects(
+                move, (PromotePieceEffect(promotion_symbol),), extra
+            )
 
         super().apply_move(move, piece)
 
@@ -140,11 +153,7 @@ class ChessManager(RoyalSafetyMoveManager):
             extra,
         )
 
-    def _with_effects(self, move: Move, effects: list, extra: dict = None) -> Move:
+    def _with_effects(self, move: Move, effects: tuple, extra: dict = None) -> Move:
         merged = dict(extra) if extra else {}
-        existing = merged.get(MoveKeys.EFFECTS)
-        if isinstance(existing, list):
-            merged[MoveKeys.EFFECTS] = [*existing, *effects]
-        else:
-            merged[MoveKeys.EFFECTS] = list(effects)
+        merged[MoveKeys.EFFECTS] = (*move.effects, *effects)
         return Move(move.start, move.end, move.move_type, merged)
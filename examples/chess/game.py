@@ -11,10 +11,10 @@ from cynmeith import (
     RoyalStalemateCondition,
     WinCondition,
 )
-from cynmeith.utils import MoveKeys
+from cynmeith.utils import Move
 from examples.ui.spec import BoardTheme, GameSpec
 
-from .chess_manager import ChessManager
+from .chess_manager import PROMOTION_CHOICES, ChessManager
 from .royal_rules import CHESS_ROYAL_RULES
 
 CHESS_MATERIAL_VALUES = {
@@ -49,10 +49,7 @@ class ChessFiftyMoveCondition(WinCondition):
             if state_before[move.end.r][move.end.c] is not None:
                 return None
 
-            if move.extra_info and any(
-                e.__class__.__name__ == "RemovePieceEffect"
-                for e in move.extra_info.get(MoveKeys.EFFECTS, [])
-            ):
+            if any(e.__class__.__name__ == "RemovePieceEffect" for e in move.effects):
                 return None
 
         return GameOutcome(None, "draw", "50-move rule reached.")
@@ -60,35 +57,9 @@ class ChessFiftyMoveCondition(WinCondition):
 
 class ChessThreefoldRepetitionCondition(WinCondition):
     def evaluate(self, game: "Game") -> GameOutcome | None:
-        history = game.board.history
-        if len(history.state_stack) < 9:
-            return None
-
-        def get_fingerprint(grid, side):
-            pieces_data = []
-            for row in grid:
-                for piece in row:
-                    if piece is None:
-                        pieces_data.append(None)
-                    else:
-                        pieces_data.append(
-                            (
-                                piece.symbol,
-                                piece.side,
-                                getattr(piece, "has_moved", None),
-                            )
-                        )
-            return (tuple(pieces_data), side)
-
-        current_fp = get_fingerprint(history.state_stack[-1], game.current_side)
-
-        count = sum(
-            1
-            for i, grid in enumerate(history.state_stack)
-            if get_fingerprint(grid, (i % 2 == 0)) == current_fp
-        )
-
-        if count >= 3:
+        # Game stamps each history entry with its turn-aware position hash,
+        # so this is a counter lookup rather than a scan of past states.
+        if game.board.history.repetition_count() >= 3:
             return GameOutcome(None, "draw", "Threefold repetition.")
         return None
 
@@ -143,6 +114,7 @@ def build_game_spec(config_source: Literal["yaml", "data"] = "yaml") -> GameSpec
             turn_policy=QuotaTurnPolicy(moves_per_turn=1),
             scoring_system=_build_scoring_system(),
             win_conditions=_build_win_conditions(),
+            bitboards=True,
         ),
         theme=BoardTheme(
             light_color="#f7f1e3",
@@ -156,6 +128,6 @@ def build_game_spec(config_source: Literal["yaml", "data"] = "yaml") -> GameSpec
             "Chess standard turns with material scoring. "
             f"Checkmate wins and stalemate draws. Config: {config_source}."
         ),
-        promotion_choices=("Q", "R", "B", "N"),
+        promotion_choices=PROMOTION_CHOICES,
         promotion_prompt="Choose promotion piece",
     )
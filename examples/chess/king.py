@@ -1,8 +1,13 @@
-from cynmeith import Board, Piece
+from cynmeith import Board, Leaper, Piece
 from cynmeith.utils import Coord
 
+CASTLING_DELTAS = (Coord(0, -2), Coord(0, 2))
+
 
 class King(Piece):
+    immutable = True
+    attack_patterns = (Leaper(Coord.omnidirectionals()),)
+
     def __init__(self, side, position: Coord):
         super().__init__(side, position)
         self.has_moved = False
@@ -11,19 +16,13 @@ class King(Piece):
         return self.position.is_adjacent(new_position)
 
     def iter_move_candidates(self, board: Board):
-        deltas = tuple(
-            Coord(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc
-        )
-        for delta in deltas:
-            position = self.position + delta
-            if board.is_in_bounds(position):
-                yield position
+        yield from board.leaps(self.position, Coord.omnidirectionals())
 
         if not self.has_moved:
-            for dc in (-2, 2):
-                pos = Coord(self.position.r, self.position.c + dc)
-                if board.is_in_bounds(pos):
-                    yield pos
+            yield from board.leaps(self.position, CASTLING_DELTAS)
+
+    def hash_state(self) -> bool:
+        return self.has_moved
 
     def move(self, new_position: Coord) -> None:
         self.position = new_position
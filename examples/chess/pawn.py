@@ -1,8 +1,16 @@
-from cynmeith import Board, Piece
+from cynmeith import Board, Leaper, Piece
 from cynmeith.utils import Coord
 
+CAPTURE_OFFSETS = {
+    True: (Coord(1, -1), Coord(1, 1)),
+    False: (Coord(-1, -1), Coord(-1, 1)),
+}
+
 
 class Pawn(Piece):
+    immutable = True
+    attack_patterns = (Leaper(CAPTURE_OFFSETS),)
+
     def __init__(self, side, position: Coord):
         super().__init__(side, position)
         if side:
@@ -32,23 +40,19 @@ class Pawn(Piece):
 
     def iter_move_candidates(self, board: Board):
         direction = Coord.down() if self.side else Coord.up()
-        one_step = self.position + direction
-        if board.is_in_bounds(one_step):
+        one_step = board.offset(self.position, direction)
+        if one_step is not None:
             yield one_step
 
-        if self.distance > 1:
-            two_step = one_step + direction
-            if board.is_in_bounds(two_step):
-                yield two_step
-
-        diagonal_offsets = (
-            Coord(direction.r, -1),
-            Coord(direction.r, 1),
-        )
-        for offset in diagonal_offsets:
-            position = self.position + offset
-            if board.is_in_bounds(position):
-                yield position
+            if self.distance > 1:
+                two_step = board.offset(one_step, direction)
+                if two_step is not None:
+                    yield two_step
+
+        yield from board.leaps(self.position, CAPTURE_OFFSETS[self.side])
+
+    def hash_state(self):
+        return self.distance
 
     def move(self, new_position: Coord):
         self.position = new_position
@@ -1,8 +1,11 @@
-from cynmeith import Board, Piece
+from cynmeith import Board, Piece, Slider
 from cynmeith.utils import Coord
 
 
 class Rook(Piece):
+    immutable = True
+    attack_patterns = (Slider(Coord.orthogonals()),)
+
     def __init__(self, side, position: Coord):
         super().__init__(side, position)
         self.has_moved = False
@@ -11,14 +14,15 @@ class Rook(Piece):
         return board.is_empty_line(self.position, new_position, Coord.is_orthogonal)
 
     def iter_move_candidates(self, board: Board):
-        for direction in (Coord.up(), Coord.down(), Coord.left(), Coord.right()):
-            for position in board.iter_positions_towards(
-                self.position + direction, direction
-            ):
+        for direction in Coord.orthogonals():
+            for position in board.ray(self.position, direction):
                 yield position
                 if board.at(position) is not None:
                     break
 
+    def hash_state(self) -> bool:
+        return self.has_moved
+
     def move(self, new_position: Coord) -> None:
         self.position = new_position
         self.has_moved = True
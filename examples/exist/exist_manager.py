@@ -73,35 +73,37 @@ class ExistManager(MoveManager):
         # Reject any placement whose destination would form a line of exactly
         # two pieces of the same side along any row, column, or diagonal.
         for direction in _LINE_DIRECTIONS:
+            if self.board.count_pieces_through(move.end, direction) != 2:
+                continue
             pieces_along = list(self.board.iter_pieces_through(move.end, direction))
             if len(pieces_along) == 2 and pieces_along[0].side == pieces_along[1].side:
                 return None
 
-        simulation = BoardSimulation(self.board)
-        placed_piece = simulation.factory.create_piece(
-            "X" if side else "x",
-            move.end,
-        )
-        if placed_piece is None:
-            return None
-        simulation._set_at(move.end, placed_piece)
+        with self.board.simulate() as simulation:
+            placed_piece = simulation.factory.create_piece(
+                "X" if side else "x",
+                move.end,
+            )
+            if placed_piece is None:
+                return None
+            simulation._set_at(move.end, placed_piece)
 
-        captured_positions = self._find_tile_captures(simulation, side)
-        if captured_positions:
-            self._remove_positions(simulation, captured_positions)
+            captured_positions = self._find_tile_captures(simulation, side)
+            if captured_positions:
+                self._remove_positions(simulation, captured_positions)
 
-        # All global restrictions are checked only on the post-capture board.
-        if not self._board_obeys_restrictions(simulation):
-            return None
+            # All global restrictions are checked only on the post-capture board.
+            if not self._board_obeys_restrictions(simulation):
+                return None
 
         extra = self._build_extra_info(move)
         extra[MoveKeys.MOVE_ACTOR] = False
         extra[MoveKeys.ACTOR_PIECE] = self._create_actor_piece(side)
 
-        effects = [
+        effects = (
             *EffectPresets.drop("X", side=side, position=move.end),
             *EffectPresets.captures(*captured_positions),
-        ]
+        )
         extra[MoveKeys.EFFECTS] = effects
         return Move(move.start, move.end, "PLACE", extra)
 
@@ -136,26 +138,26 @@ class ExistManager(MoveManager):
             piece.side,
         )
 
-        simulation = BoardSimulation(self.board)
-        actor = simulation.at(move.start)
-        if actor is None:
-            return None
-        simulation._apply_move(move, actor)
-
-        captured_positions = self._merge_unique_positions(
-            line_captures,
-            self._find_tile_captures(simulation, piece.side),
-        )
-        if captured_positions:
-            self._remove_positions(simulation, captured_positions)
-
-        # Reject moves that leave move.end on a line containing exactly
-        # two same-side pieces, ignoring the moved piece itself.
-        if self._destination_in_same_side_line(simulation, move.end):
-            return None
+        with self.board.simulate() as simulation:
+            actor = simulation.at(move.start)
+            if actor is None:
+                return None
+            simulation._apply_move(move, actor)
+
+            captured_positions = self._merge_unique_positions(
+                line_captures,
+                self._find_tile_captures(simulation, piece.side),
+            )
+            if captured_positions:
+                self._remove_positions(simulation, captured_positions)
+
+            # Reject moves that leave move.end on a line containing exactly
+            # two same-side pieces, ignoring the moved piece itself.
+            if self._destination_in_same_side_line(simulation, move.end):
+                return None
 
-        if not self._board_obeys_restrictions(simulation):
-            return None
+            if not self._board_obeys_restrictions(simulation):
+                return None
 
         extra = self._build_extra_info(move)
         extra[MoveKeys.EFFECTS] = EffectPresets.captures(*captured_positions)
@@ -228,9 +230,7 @@ class ExistManager(MoveManager):
         whose "self + adjacent pieces" occupancy exceeds 3.
         """
         captured: list[Coord] = []
-        for position, piece in board.iter_enumerate():
-            if piece is None or piece.side == moving_side:
-                continue
+        for position in board.iter_positions_by_side(not moving_side):
             if self._count_tile_occupancy(board, position) > 3:
                 captured.append(position)
         return captured
@@ -249,7 +249,10 @@ class ExistManager(MoveManager):
         filtering `position == target` makes the rule "are there two
         same-side pieces *other than me* on a line through here?"
         """
+        occupied_target = 0 if board.is_empty(target) else 1
         for direction in _LINE_DIRECTIONS:
+            if board.count_pieces_through(target, direction) - occupied_target != 2:
+                continue
             others = [
                 piece
                 for position, piece in board.iter_enumerate_through(target, direction)
@@ -288,13 +291,9 @@ class ExistManager(MoveManager):
     def _count_tile_occupancy(board: BoardSimulation, position: Coord) -> int:
         """Count the piece itself plus all occupied adjacent squares."""
         count = 1
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                if dr == 0 and dc == 0:
-                    continue
-                neighbor = position + Coord(dr, dc)
-                if board.is_in_bounds(neighbor) and board.at(neighbor) is not None:
-                    count += 1
+        for neighbor in board.leaps(position, Coord.omnidirectionals()):
+            if board.at(neighbor) is not None:
+                count += 1
         return count
 
     @staticmethod
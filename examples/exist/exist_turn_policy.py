@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
-from cynmeith.utils.aliases import Move, MoveKeys, Side2
+from cynmeith.utils.aliases import Move, Side2
 
 if TYPE_CHECKING:
     from cynmeith import Game
@@ -114,6 +114,15 @@ class ExistTurnPolicy:
     def current_side(self) -> Side2:
         return self._state.side
 
+    def hash_state(self) -> tuple[Side2, int, TurnKind, str | None]:
+        # Everything except turn_index, which only ever grows.
+        return (
+            self._state.side,
+            self._state.actions_this_turn,
+            self._state.turn_kind,
+            self._state.last_action_type,
+        )
+
     def get_turn_info(self) -> dict[str, Any]:
         if self._state.actions_this_turn == 0:
             turn_type = "New Turn"
@@ -155,11 +164,6 @@ class ExistTurnPolicy:
 
     @staticmethod
     def _move_has_captures(move: Move) -> bool:
-        if not isinstance(move.extra_info, dict):
-            return False
-        effects = move.extra_info.get(MoveKeys.EFFECTS)
-        if not isinstance(effects, list):
-            return False
         return any(
-            effect.__class__.__name__ == "RemovePieceEffect" for effect in effects
+            effect.__class__.__name__ == "RemovePieceEffect" for effect in move.effects
         )
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from cynmeith import Config, Game, GameOutcome, WinCondition
 from cynmeith.core.game import GameStateSnapshot
 from cynmeith.core.move_effects import RemovePieceEffect
 from cynmeith.utils import Coord
-from cynmeith.utils.aliases import InvalidMoveError, Move, MoveHistoryError, MoveKeys
+from cynmeith.utils.aliases import InvalidMoveError, Move, MoveHistoryError
 
 from .exist_manager import ExistManager
 from .exist_turn_policy import ExistTurnPolicy
@@ -26,7 +27,7 @@ class ExistGame(Game):
 
     def __init__(self, max_history: int | None = None) -> None:
         self.reserves = ReserveManager()
-        self._reserve_snapshots: list[dict[bool, int]] = []
+        self._reserve_snapshots: deque[dict[bool, int]] = deque()
         self._redo_reserve_snapshots: list[dict[bool, int]] = []
         super().__init__(
             _build_exist_config(),
@@ -34,6 +35,7 @@ class ExistGame(Game):
             turn_policy=ExistTurnPolicy(),
             win_conditions=_build_win_conditions(),
             max_history=max_history,
+            bitboards=True,
         )
 
     def can_move(
@@ -62,6 +64,7 @@ class ExistGame(Game):
         move_type: str = "",
         extra_info: dict[str, Any] | None = None,
     ) -> None:
+        self._ensure_no_pushed_moves()
         if self.is_over:
             raise InvalidMoveError("Game is already over.")
 
@@ -84,10 +87,8 @@ class ExistGame(Game):
             raise InvalidMoveError("Move is not allowed by the active turn policy.")
 
         self.board.manager.apply_move(resolved_move, piece)
-        # Reserve bookkeeping is game-level state, so it happens here rather
-        # than inside the generic board/move-manager pipeline.
-        self._apply_reserve_updates(piece.side, resolved_move)
-        self.turn_policy.after_move(self, piece, resolved_move)
+        self._advance_game_systems(piece, resolved_move)
+        self.board.history.stamp_position(self.position_hash)
         self._outcome = self._evaluate_outcome()
         self._state_snapshots.append(self._capture_state_snapshot())
         self._redo_state_snapshots.clear()
@@ -95,15 +96,61 @@ class ExistGame(Game):
         self._redo_reserve_snapshots.clear()
         self._trim_state_snapshots()
 
+    def push(self, move: Move, validate: bool = True, evaluate: bool = False) -> None:
+        if validate:
+            normalized_type = self._normalize_action_type(move.move_type)
+            if normalized_type == "PLACE" and not self.reserves.has_pieces(
+                self.current_side
+            ):
+                raise InvalidMoveError("No reserve pieces available to place.")
+            move = Move(
+                move.start,
+                move.end,
+                normalized_type,
+                self._augment_extra_info(normalized_type, move.extra_info),
+            )
+        super().push(move, validate, evaluate)
+
+    def _iter_move_requests(self, side: bool) -> Iterator[Move]:
+        for request in super()._iter_move_requests(side):
+            yield Move(request.start, request.end, "MOVE")
+        if self.reserves.has_pieces(side):
+            for position in self.board.iter_positions():
+                if self.board.is_empty(position):
+                    yield Move(Coord.null(), position, "PLACE", {"side": side})
+        yield Move(Coord.null(), Coord.null(), "END_TURN", {"side": side})
+
+    def _advance_game_systems(self, piece, move: Move) -> None:
+        # Reserve bookkeeping is game-level state, so it happens here rather
+        # than inside the generic board/move-manager pipeline.
+        self._apply_reserve_updates(piece.side, move)
+        super()._advance_game_systems(piece, move)
+
+    @property
+    def state_hash(self) -> int:
+        # Reserve counts decide whether PLACE is legal, so searches must not
+        # share table entries across them.
+        reserves = self.reserves
+        return super().state_hash ^ self.board.zobrist.key(
+            "reserves", reserves.get_count(True), reserves.get_count(False)
+        )
+
+    def _capture_push_token(self) -> tuple[Any, ...]:
+        return (*super()._capture_push_token(), self.reserves.snapshot())
+
+    def _restore_push_token(self, token: tuple[Any, ...]) -> None:
+        super()._restore_push_token(token[:-1])
+        self.reserves.restore(token[-1])
+
     def _trim_state_snapshots(self) -> None:
         super()._trim_state_snapshots()
         if self._max_history is None:
             return
-        excess = len(self._reserve_snapshots) - (self._max_history + 1)
-        if excess > 0:
-            del self._reserve_snapshots[1 : 1 + excess]
+        while len(self._reserve_snapshots) > self._max_history + 1:
+            self._reserve_snapshots.popleft()
 
     def undo_move(self) -> None:
+        self._ensure_no_pushed_moves()
         if len(self._state_snapshots) < 2:
             raise MoveHistoryError("No game state to undo.")
         self.board.history.undo_move()
@@ -115,6 +162,7 @@ class ExistGame(Game):
         self.reserves.restore(self._reserve_snapshots[-1])
 
     def redo_move(self) -> None:
+        self._ensure_no_pushed_moves()
         if not self._redo_state_snapshots:
             raise MoveHistoryError("No game state to redo.")
         self.board.history.redo_move()
@@ -136,25 +184,18 @@ class ExistGame(Game):
 
     def _reset_game_systems(self) -> None:
         super()._reset_game_systems()
-        self.reserves.reset()
-
-    def _reseed_state(self) -> None:
-        super()._reseed_state()
-        # Manual board edits rebuild reserves from current on-board piece counts.
+        # Manual board edits rebuild reserves from current on-board piece
+        # counts. This runs before the base reseed evaluates the outcome, so
+        # the win conditions see the synced reserves.
         counts = {
-            True: sum(
-                1
-                for piece in self.board.iter_pieces()
-                if piece is not None and piece.side
-            ),
-            False: sum(
-                1
-                for piece in self.board.iter_pieces()
-                if piece is not None and piece.side is False
-            ),
+            True: self.board.count_pieces(True),
+            False: self.board.count_pieces(False),
         }
         self.reserves.sync_from_board_counts(counts)
-        self._reserve_snapshots = [self.reserves.snapshot()]
+
+    def _reseed_state(self) -> None:
+        super()._reseed_state()
+        self._reserve_snapshots = deque([self.reserves.snapshot()])
         self._redo_reserve_snapshots.clear()
 
     def _capture_state_snapshot(self) -> GameStateSnapshot:
@@ -166,13 +207,9 @@ class ExistGame(Game):
         if action_type == "PLACE":
             self.reserves.spend_piece(moving_side)
 
-        capture_count = 0
-        if isinstance(move.extra_info, dict):
-            effects = move.extra_info.get(MoveKeys.EFFECTS)
-            if isinstance(effects, list):
-                capture_count = sum(
-                    1 for effect in effects if isinstance(effect, RemovePieceEffect)
-                )
+        capture_count = sum(
+            1 for effect in move.effects if isinstance(effect, RemovePieceEffect)
+        )
         if capture_count:
             self.reserves.gain_pieces(moving_side, capture_count)
 
@@ -212,17 +249,10 @@ class ExistStalemateCondition(WinCondition):
         if current_side is None:
             return None
 
-        if game.reserves.has_pieces(current_side):
-            for position in game.board.iter_positions():
-                if game.can_move(Coord.null(), position, "PLACE"):
-                    return None
-
-        for piece in game.board.iter_pieces():
-            if piece is None or piece.side != current_side:
-                continue
-            for destination in piece.iter_move_candidates(game.board):
-                if game.can_move(piece.position, destination, "MOVE"):
-                    return None
+        # END_TURN is never legal before the turn's first action, so any
+        # legal action here is a PLACE or MOVE.
+        if game.evaluation_context.has_legal_move(current_side):
+            return None
 
         return GameOutcome(not current_side, "win", "No legal actions available.")
 
@@ -236,7 +266,7 @@ class ExistAllPiecesCondition(WinCondition):
         if game.turn_policy.snapshot().actions_this_turn != 0:
             return None
 
-        piece_count = sum(1 for _ in game.board.iter_pieces())
+        piece_count = game.evaluation_context.piece_count()
         if piece_count == 16:
             return GameOutcome(None, "draw", "All 16 pieces are on the board.")
         return None
@@ -10,6 +10,7 @@ class ExistPiece(Piece):
     """
 
     symbol = "X"
+    immutable = True
 
     def is_valid_move(self, new_position: Coord, board: Board) -> bool:
         """
@@ -28,10 +29,6 @@ class ExistPiece(Piece):
         """
         Generate all 8 adjacent squares.
         """
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                if dr == 0 and dc == 0:
-                    continue
-                position = self.position + Coord(dr, dc)
-                if board.is_in_bounds(position) and board.is_empty(position):
-                    yield position
+        for position in board.leaps(self.position, Coord.omnidirectionals()):
+            if board.is_empty(position):
+                yield position
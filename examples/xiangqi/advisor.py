@@ -1,10 +1,18 @@
-from cynmeith import Board, Piece
+from cynmeith import Board, Leaper, Piece
 from cynmeith.utils import Coord
 
 from .rules import in_palace
 
 
 class Advisor(Piece):
+    immutable = True
+    attack_patterns = (
+        Leaper(
+            Coord.diagonals(),
+            when=lambda piece, target: in_palace(target, piece.side),
+        ),
+    )
+
     def is_valid_move(self, new_position: Coord, board: Board) -> bool:
         if not in_palace(new_position, self.side):
             return False
@@ -14,13 +22,4 @@ class Advisor(Piece):
         )
 
     def iter_move_candidates(self, board: Board):
-        deltas = (
-            Coord(-1, -1),
-            Coord(-1, 1),
-            Coord(1, -1),
-            Coord(1, 1),
-        )
-        for delta in deltas:
-            position = self.position + delta
-            if board.is_in_bounds(position):
-                yield position
+        yield from board.leaps(self.position, Coord.diagonals())
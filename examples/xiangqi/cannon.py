@@ -1,10 +1,13 @@
-from cynmeith import Board, Piece
+from cynmeith import Board, Piece, ScreenedSlider
 from cynmeith.utils import Coord
 
 from .rules import pieces_between
 
 
 class Cannon(Piece):
+    immutable = True
+    attack_patterns = (ScreenedSlider(Coord.orthogonals()),)
+
     def is_valid_move(self, new_position: Coord, board: Board) -> bool:
         if not self.position.is_orthogonal(new_position):
             return False
@@ -16,7 +19,5 @@ class Cannon(Piece):
         return between == 1
 
     def iter_move_candidates(self, board: Board):
-        for direction in (Coord.up(), Coord.down(), Coord.left(), Coord.right()):
-            yield from board.iter_positions_towards(
-                self.position + direction, direction
-            )
+        for direction in Coord.orthogonals():
+            yield from board.ray(self.position, direction)
@@ -1,18 +1,19 @@
-from cynmeith import Board, Piece
+from cynmeith import Board, Piece, Slider
 from cynmeith.utils import Coord
 
 
 class Chariot(Piece):
+    immutable = True
+    attack_patterns = (Slider(Coord.orthogonals()),)
+
     def is_valid_move(self, new_position: Coord, board: Board) -> bool:
         return self.position.is_orthogonal(new_position) and board.is_empty_line(
             self.position, new_position, Coord.is_orthogonal
         )
 
     def iter_move_candidates(self, board: Board):
-        for direction in (Coord.up(), Coord.down(), Coord.left(), Coord.right()):
-            for position in board.iter_positions_towards(
-                self.position + direction, direction
-            ):
+        for direction in Coord.orthogonals():
+            for position in board.ray(self.position, direction):
                 yield position
                 if board.at(position) is not None:
                     break
@@ -1,8 +1,25 @@
-from cynmeith import Board, Piece
+from cynmeith import BlockedLeaper, Board, Piece
 from cynmeith.utils import Coord
 
+from .rules import crossed_river
+
+ELEPHANT_DELTAS = (
+    Coord(-2, -2),
+    Coord(-2, 2),
+    Coord(2, -2),
+    Coord(2, 2),
+)
+
 
 class Elephant(Piece):
+    immutable = True
+    attack_patterns = (
+        BlockedLeaper(
+            ((delta, delta // 2) for delta in ELEPHANT_DELTAS),
+            when=lambda piece, target: not crossed_river(target, piece.side),
+        ),
+    )
+
     def is_valid_move(self, new_position: Coord, board: Board) -> bool:
         if not self.position.is_diagonal(new_position):
             return False
@@ -21,13 +38,4 @@ class Elephant(Piece):
         return board.is_empty(middle)
 
     def iter_move_candidates(self, board: Board):
-        deltas = (
-            Coord(-2, -2),
-            Coord(-2, 2),
-            Coord(2, -2),
-            Coord(2, 2),
-        )
-        for delta in deltas:
-            position = self.position + delta
-            if board.is_in_bounds(position):
-                yield position
+        yield from board.leaps(self.position, ELEPHANT_DELTAS)
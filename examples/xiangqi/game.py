@@ -90,6 +90,7 @@ def build_game_spec(config_source: Literal["yaml", "data"] = "yaml") -> GameSpec
             turn_policy=QuotaTurnPolicy(moves_per_turn=1),
             scoring_system=_build_scoring_system(),
             win_conditions=_build_win_conditions(),
+            bitboards=True,
         ),
         theme=BoardTheme(
             light_color="#f5deb3",
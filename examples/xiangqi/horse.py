@@ -1,8 +1,18 @@
-from cynmeith import Board, Piece
+from cynmeith import BlockedLeaper, Board, Piece
 from cynmeith.utils import Coord
 
+# (offset, leg): the horse is blocked by a piece on the orthogonal step
+# next to it, on the long side of the L.
+HORSE_MOVES = tuple(
+    (delta, Coord(delta.r // 2, 0) if abs(delta.r) == 2 else Coord(0, delta.c // 2))
+    for delta in Coord.lshapes()
+)
+
 
 class Horse(Piece):
+    immutable = True
+    attack_patterns = (BlockedLeaper(HORSE_MOVES),)
+
     def is_valid_move(self, new_position: Coord, board: Board) -> bool:
         if not Coord.is_lshape(self.position, new_position):
             return False
@@ -17,17 +27,4 @@ class Horse(Piece):
         return board.is_empty(leg)
 
     def iter_move_candidates(self, board: Board):
-        deltas = (
-            Coord(-2, -1),
-            Coord(-2, 1),
-            Coord(-1, -2),
-            Coord(-1, 2),
-            Coord(1, -2),
-            Coord(1, 2),
-            Coord(2, -1),
-            Coord(2, 1),
-        )
-        for delta in deltas:
-            position = self.position + delta
-            if board.is_in_bounds(position):
-                yield position
+        yield from board.leaps(self.position, Coord.lshapes())
@@ -1,10 +1,22 @@
-from cynmeith import Board, Piece
+from cynmeith import Board, Leaper, Piece
 from cynmeith.utils import Coord
 
 from .rules import crossed_river
 
+SOLDIER_FORWARD = {True: (Coord.down(),), False: (Coord.up(),)}
+SOLDIER_SIDEWAYS = (Coord.left(), Coord.right())
+
 
 class Soldier(Piece):
+    immutable = True
+    attack_patterns = (
+        Leaper(SOLDIER_FORWARD),
+        Leaper(
+            SOLDIER_SIDEWAYS,
+            when=lambda piece, target: crossed_river(piece.position, piece.side),
+        ),
+    )
+
     def is_valid_move(self, new_position: Coord, board: Board) -> bool:
         if not board.is_in_bounds(new_position):
             return False
@@ -26,10 +38,6 @@ class Soldier(Piece):
         return False
 
     def iter_move_candidates(self, board: Board):
-        deltas = [Coord(1, 0) if self.side else Coord(-1, 0)]
+        yield from board.leaps(self.position, SOLDIER_FORWARD[self.side])
         if crossed_river(self.position, self.side):
-            deltas.extend([Coord(0, -1), Coord(0, 1)])
-        for delta in deltas:
-            position = self.position + delta
-            if board.is_in_bounds(position):
-                yield position
+            yield from board.leaps(self.position, SOLDIER_SIDEWAYS)
@@ -1,7 +1,7 @@
 import pytest
 
-from cynmeith import Board, Config, MoveManager
-from cynmeith.utils import Coord, InvalidMoveError, PieceError
+from cynmeith import Board, BoardSimulation, Config, FlatStorage, MoveManager
+from cynmeith.utils import Coord, InvalidMoveError, Move, MoveHistoryError, PieceError
 
 
 class RejectAllMoveManager(MoveManager):
@@ -125,6 +125,439 @@ def test_move_history_undo_redo(board):
     assert board.at(end).get_symbol_with_side() == "P"
 
 
+def test_coord_table_and_offset_return_interned_coords(board):
+    """
+    Test that coord and offset hand out the board's shared Coord instances.
+    """
+    assert board.coord(2, 3) is board.coord(2, 3)
+    assert board.coord(2, 3) == Coord(2, 3)
+    assert list(board.iter_positions())[10] is board.coord(1, 2)
+    assert board.offset(Coord(2, 3), Coord(1, -1)) is board.coord(3, 2)
+    assert board.offset(Coord(0, 0), Coord.up()) is None
+    assert board.offset(Coord(7, 7), Coord(0, 1)) is None
+    with pytest.raises(ValueError):
+        board.coord(8, 0)
+
+
+def test_geometry_tables_are_shared_and_match_stepping(board):
+    """
+    Test that rays and leaper targets come from one shared per-size table.
+    """
+    other = Board(board.config)
+    assert other.geometry is board.geometry
+    assert BoardSimulation(board).geometry is board.geometry
+
+    assert board.ray(Coord(5, 2), Coord.up()) == (
+        Coord(4, 2),
+        Coord(3, 2),
+        Coord(2, 2),
+        Coord(1, 2),
+        Coord(0, 2),
+    )
+    assert board.ray(Coord(5, 2), Coord.up())[0] is board.coord(4, 2)
+    assert board.ray(Coord(0, 0), Coord(-1, 1)) == ()
+    assert board.ray(Coord(0, 0), Coord(2, 1)) == (
+        Coord(2, 1),
+        Coord(4, 2),
+        Coord(6, 3),
+    )
+
+    assert set(board.leaps(Coord(0, 0), Coord.lshapes())) == {Coord(1, 2), Coord(2, 1)}
+    for position in board.iter_positions():
+        expected = [
+            target
+            for delta in Coord.lshapes()
+            if (target := board.offset(position, delta)) is not None
+        ]
+        assert list(board.leaps(position, Coord.lshapes())) == expected
+        # A fresh, equal offsets tuple maps to the same table.
+        assert board.leaps(position, tuple(list(Coord.lshapes()))) == tuple(expected)
+
+
+def _scanned_index(board):
+    by_side = {True: set(), False: set()}
+    by_type = {}
+    for position, piece in board.iter_enumerate():
+        by_side[piece.side].add(position)
+        by_type.setdefault((piece.symbol.upper(), piece.side), set()).add(position)
+    return by_side, by_type
+
+
+def _assert_index_matches_scan(board):
+    by_side, by_type = _scanned_index(board)
+    for side in (True, False):
+        assert set(board.iter_positions_by_side(side)) == by_side[side]
+        assert board.count_pieces(side) == len(by_side[side])
+    for (symbol, side), positions in by_type.items():
+        assert set(board.iter_positions_by_type(symbol, side)) == positions
+        assert board.count_pieces(side, symbol.lower()) == len(positions)
+    assert board.count_pieces() == sum(len(p) for p in by_side.values())
+
+
+def test_piece_index_tracks_moves_undo_redo_and_edits(board):
+    """
+    Test that the side/type piece index stays in step with the cells.
+    """
+    _assert_index_matches_scan(board)
+    assert board.count_pieces(True, "P") == 8
+
+    board.move(Coord(1, 4), Coord(3, 4))
+    board.move(Coord(6, 3), Coord(4, 3))
+    board.move(Coord(3, 4), Coord(4, 3))
+    _assert_index_matches_scan(board)
+    assert board.count_pieces(False, "P") == 7
+
+    board.history.undo_move()
+    _assert_index_matches_scan(board)
+    assert board.count_pieces(False, "P") == 8
+    board.history.redo_move()
+    _assert_index_matches_scan(board)
+
+    board.set_at(Coord(4, 4), board.factory.create_piece("q", Coord(4, 4)))
+    _assert_index_matches_scan(board)
+    assert board.count_pieces(False, "Q") == 2
+    assert Coord(4, 4) in set(board.iter_positions_by_type("q"))
+
+    board.clear()
+    assert board.count_pieces() == 0
+    assert list(board.iter_pieces_by_side(True)) == []
+
+
+def test_iter_pieces_by_side_and_type_keep_scan_order_and_exact_symbols(board):
+    """
+    Test that the index-backed piece iterators match a row-major scan.
+    """
+    board.move(Coord(1, 4), Coord(3, 4))
+    board.move(Coord(6, 3), Coord(4, 3))
+    board.move(Coord(3, 4), Coord(4, 3))
+    board.history.undo_move()
+    board.history.redo_move()
+
+    pieces = [piece for piece in board.iter_pieces() if piece is not None]
+    for side in (True, False):
+        assert list(board.iter_pieces_by_side(side)) == [
+            piece for piece in pieces if piece.side == side
+        ]
+    assert list(board.iter_pieces_by_type("P")) == [
+        piece for piece in pieces if piece.symbol == "P"
+    ]
+    assert list(board.iter_pieces_by_type("P", False)) == [
+        piece for piece in pieces if piece.symbol == "P" and not piece.side
+    ]
+    assert list(board.iter_pieces_by_type("p")) == []
+
+
+def test_simulation_piece_index_reflects_overlay(board):
+    """
+    Test that BoardSimulation adjusts the underlying index by its overlay.
+    """
+    sim = BoardSimulation(board)
+    king = sim.at(Coord(0, 4))
+    sim._set_at(Coord(0, 4), None)
+    sim._set_at(Coord(3, 3), king)
+    sim._set_at(Coord(6, 0), None)
+
+    assert Coord(3, 3) in set(sim.iter_positions_by_type("K", True))
+    assert Coord(0, 4) not in set(sim.iter_positions_by_side(True))
+    assert sim.count_pieces(False) == board.count_pieces(False) - 1
+    assert sim.count_pieces() == board.count_pieces() - 1
+    assert board.at(Coord(0, 4)) is not None
+
+
+def test_simulate_pools_and_resets_simulations(board, monkeypatch):
+    """
+    Test that Board.simulate() reuses a cleared simulation and recycles its
+    piece copies without touching the real board.
+    """
+    monkeypatch.setattr(type(board.at(Coord(0, 1))), "immutable", False)
+    with board.simulate() as sim:
+        knight = sim.at(Coord(0, 1))
+        sim._apply_move(Move(Coord(0, 1), Coord(2, 2)), knight)
+        sim._set_at(Coord(6, 0), None)
+        moved = sim.at(Coord(2, 2))
+        with board.simulate() as inner:
+            assert inner is not sim
+            assert inner.at(Coord(2, 2)) is None
+        assert sim.position_hash != board.position_hash
+
+    with board.simulate() as reused:
+        assert reused is sim
+        assert reused.position_hash == board.position_hash
+        assert reused.count_pieces() == board.count_pieces()
+        assert reused.at(Coord(2, 2)) is None
+        other_knight = reused.at(Coord(0, 6))
+        assert other_knight is not board.at(Coord(0, 6))
+        assert other_knight.position == Coord(0, 6)
+        assert other_knight in (knight, moved)
+
+    assert board.at(Coord(0, 1)).position == Coord(0, 1)
+    assert board.at(Coord(2, 2)) is None
+
+
+def test_immutable_pieces_are_shared_by_history_and_simulation(board):
+    """
+    Test that moving an immutable piece places a new instance, leaving the
+    old one intact for history and simulations to share.
+    """
+    pawn = board.at(Coord(1, 4))
+    assert pawn.immutable
+    board.move(Coord(1, 4), Coord(3, 4))
+    moved = board.at(Coord(3, 4))
+    assert moved is not pawn
+    assert (pawn.position, pawn.distance) == (Coord(1, 4), 2)
+    assert (moved.position, moved.distance) == (Coord(3, 4), 1)
+
+    board.history.undo_move()
+    assert board.at(Coord(1, 4)) is pawn
+    board.history.redo_move()
+    assert board.at(Coord(3, 4)) is moved
+
+    with board.simulate() as sim:
+        knight = sim.at(Coord(0, 1))
+        assert knight is board.at(Coord(0, 1))
+        sim._apply_move(Move(Coord(0, 1), Coord(2, 2)), knight)
+        assert sim.at(Coord(2, 2)).position == Coord(2, 2)
+    assert knight.position == Coord(0, 1)
+
+
+def _scanned_line_counts(board, position):
+    return {
+        name: sum(1 for _ in board.iter_pieces_through(position, direction))
+        for name, direction in (
+            ("row", Coord(0, 1)),
+            ("column", Coord(1, 0)),
+            ("diagonal1", Coord(1, 1)),
+            ("diagonal2", Coord(1, -1)),
+        )
+    }
+
+
+def test_line_counters_track_writes_undo_and_clear(board):
+    """
+    Test that the row/column/diagonal occupancy counters match a scan.
+    """
+
+    def assert_counts_match(target):
+        for position in target.iter_positions():
+            assert target.count_pieces_from(position) == _scanned_line_counts(
+                target, position
+            )
+
+    assert_counts_match(board)
+    assert board.count_pieces_through(Coord(0, 3), Coord(0, -1)) == 8
+    assert board.count_pieces_through(Coord(4, 4), Coord(-1, -1)) == 4
+
+    board.move(Coord(1, 4), Coord(3, 4))
+    board.move(Coord(6, 3), Coord(4, 3))
+    board.move(Coord(3, 4), Coord(4, 3))
+    assert_counts_match(board)
+    board.history.undo_move()
+    assert_counts_match(board)
+
+    sim = BoardSimulation(board)
+    sim._set_at(Coord(0, 0), None)
+    sim._set_at(Coord(3, 5), sim.at(Coord(7, 1)))
+    sim._set_at(Coord(3, 6), sim.at(Coord(3, 5)))
+    assert_counts_match(sim)
+    assert sim.count_pieces_line(Coord(3, 0), Coord(3, 7)) == 3
+    assert board.count_pieces_line(Coord(3, 0), Coord(3, 7)) == 1
+
+    board.clear()
+    assert board.count_pieces_from(Coord(2, 5)) == {
+        "row": 0,
+        "column": 0,
+        "diagonal1": 0,
+        "diagonal2": 0,
+    }
+
+
+def _assert_bitboards_match(target, reference):
+    positions = list(target.iter_positions())
+    for position in positions:
+        assert target.is_empty(position) == reference.is_empty(position)
+        assert target.side_at(position) == reference.side_at(position)
+    for start in positions:
+        for end in positions:
+            if not start.is_omnidirectional(end):
+                continue
+            assert target.is_empty_line(start, end) == reference.is_empty_line(
+                start, end
+            )
+            assert target.count_pieces_line(start, end) == reference.count_pieces_line(
+                start, end
+            )
+
+
+def test_bitboards_mirror_writes_history_and_simulation(board):
+    """
+    Test that the optional bitboard mirror answers occupancy queries exactly
+    like the per-cell scans, through moves, undo/redo, edits and clear.
+    """
+    fast = Board(board.config, bitboards=True)
+    assert board.bitboards is None
+    for target in (fast, board):
+        target.move(Coord(1, 4), Coord(3, 4))
+        target.move(Coord(6, 3), Coord(4, 3))
+        target.move(Coord(3, 4), Coord(4, 3))
+        target.history.undo_move()
+        target.history.redo_move()
+        target.set_at(Coord(5, 5), target.factory.create_piece("q", Coord(5, 5)))
+    _assert_bitboards_match(fast, board)
+    mask = fast.bitboards
+    assert mask.occupied.bit_count() == sum(1 for _ in fast.iter_enumerate())
+    assert mask.sides[False].bit_count() == fast.count_pieces(False)
+    assert mask.type_mask("p", True).bit_count() == fast.count_pieces(True, "P")
+
+    fast_sim, sim = BoardSimulation(fast), BoardSimulation(board)
+    for target in (fast_sim, sim):
+        target._set_at(Coord(0, 0), None)
+        target._set_at(Coord(3, 6), target.at(Coord(7, 1)))
+    _assert_bitboards_match(fast_sim, sim)
+
+    fast.clear()
+    assert fast.bitboards.occupied == 0
+    assert fast.is_empty_line(Coord(0, 0), Coord(7, 7))
+
+
+def test_position_hash_is_incremental_and_restored_by_history(board):
+    """
+    Test that position_hash follows moves, undo/redo and transpositions.
+    """
+    initial = board.position_hash
+    assert initial != 0
+
+    board.move(Coord(0, 1), Coord(2, 2))
+    after_first = board.position_hash
+    assert after_first != initial
+
+    board.history.undo_move()
+    assert board.position_hash == initial
+    board.history.redo_move()
+    assert board.position_hash == after_first
+
+    board.move(Coord(2, 2), Coord(0, 1))
+    assert board.position_hash == initial
+
+    sim = BoardSimulation(board)
+    sim._apply_move(Move(Coord(0, 1), Coord(2, 2)), sim.at(Coord(0, 1)))
+    assert sim.position_hash == after_first
+    assert board.position_hash == initial
+
+    board.clear()
+    assert board.position_hash == 0
+
+
+def test_move_history_counts_position_repetitions(board):
+    """
+    Test repetition_count through record, undo/redo and max_history folding.
+    """
+    history = board.history
+    shuffle = [(Coord(0, 1), Coord(2, 2)), (Coord(2, 2), Coord(0, 1))]
+    assert history.repetition_count() == 1
+
+    for start, end in shuffle * 2:
+        board.move(start, end)
+    assert history.repetition_count() == 3
+    assert history.repetition_count(history.position_key) == 3
+
+    history.undo_move()
+    assert history.repetition_count() == 2
+    history.undo_move()
+    assert history.repetition_count() == 2
+    history.redo_move()
+    history.redo_move()
+    assert history.repetition_count() == 3
+
+    history.stamp_position(12345)
+    assert history.repetition_count() == 1
+    assert history.repetition_count(board.position_hash) == 2
+
+    history.set_max_history(1)
+    assert history.repetition_count(board.position_hash) == 0
+    assert history.num_moves == 1
+
+
+def test_state_stack_random_access_uses_checkpoints_and_reverse_replay(board):
+    """
+    Test that checkpointed and reverse-replayed states match a full replay.
+    """
+    history = board.history
+    history.checkpoint_interval = 4
+    history.max_checkpoints = 3
+    shuffle = [
+        (Coord(0, 1), Coord(2, 2)),
+        (Coord(7, 1), Coord(5, 2)),
+        (Coord(2, 2), Coord(0, 1)),
+        (Coord(5, 2), Coord(7, 1)),
+        (Coord(1, 0), Coord(2, 0)),
+    ]
+
+    def assert_matches_full_replay():
+        expected = [
+            [[repr(piece) for piece in row] for row in state]
+            for state in history._iter_states()
+        ]
+        assert len(history.state_stack) == len(expected)
+        for index in (*range(len(expected)), -1, -2):
+            state = history.state_stack[index]
+            assert [[repr(piece) for piece in row] for row in state] == expected[index]
+
+    for start, end in shuffle[:4] * 4 + shuffle[4:]:
+        board.move(start, end)
+    # The fourth checkpoint thins them to every eighth state.
+    assert list(history._checkpoints) == [8, 16]
+    assert_matches_full_replay()
+
+    for _ in range(6):
+        history.undo_move()
+    assert_matches_full_replay()
+    history.redo_move()
+    assert_matches_full_replay()
+
+    board.move(Coord(1, 7), Coord(2, 7))
+    assert max(history._checkpoints) <= history.num_moves
+    assert_matches_full_replay()
+
+    history.set_max_history(5)
+    assert all(index > history._folded for index in history._checkpoints)
+    assert_matches_full_replay()
+
+
+def test_checkpoints_stay_spread_over_a_long_game(board):
+    """
+    Test that thinning keeps checkpoints evenly spaced from the start of
+    the game instead of dropping the oldest.
+    """
+    history = board.history
+    history.checkpoint_interval = 2
+    history.max_checkpoints = 4
+    shuffle = [
+        (Coord(0, 1), Coord(2, 2)),
+        (Coord(7, 1), Coord(5, 2)),
+        (Coord(2, 2), Coord(0, 1)),
+        (Coord(5, 2), Coord(7, 1)),
+    ]
+
+    for start, end in shuffle * 25:
+        board.move(start, end)
+
+    checkpoints = list(history._checkpoints)
+    assert checkpoints == [32, 64, 96]
+    assert len(checkpoints) <= history.max_checkpoints
+    for index in (1, 33, 50, 97):
+        state = history.state_stack[index]
+        expected = history._iter_states()
+        for _ in range(index):
+            next(expected)
+        assert [[repr(piece) for piece in row] for row in state] == [
+            [repr(piece) for piece in row] for row in next(expected)
+        ]
+
+    history.clear()
+    history.seed_current_state()
+    assert history._checkpoint_spread == 1
+
+
 def test_is_empty_line(board):
     """
     Test the is_empty_line method.
@@ -213,3 +646,57 @@ def test_max_history_caps_undo_depth_and_folds_oldest_into_baseline(board):
     board.history.undo_move()
     with pytest.raises(Exception):
         board.history.undo_move()
+
+
+def test_set_max_history_refuses_to_fold_pushed_moves(board):
+    board.history.begin_push()
+    board.move(Coord(1, 0), Coord(2, 0))
+
+    with pytest.raises(MoveHistoryError):
+        board.history.set_max_history(0)
+
+    board.history.pop_move()
+    assert board.at(Coord(1, 0)) is not None
+    board.history.set_max_history(0)
+
+
+def test_flat_storage_matches_grid_storage():
+    """
+    The flat backend must be a drop-in replacement: placement, moves,
+    undo/redo and the lazy state stack all behave as with nested lists.
+    """
+    config = Config("examples/chess/testchess.yaml")
+    grid_board = Board(config)
+    flat_board = Board(config, storage=FlatStorage)
+
+    assert str(flat_board) == str(grid_board)
+    assert [(p, repr(x)) for p, x in flat_board.iter_enumerate()] == [
+        (p, repr(x)) for p, x in grid_board.iter_enumerate()
+    ]
+
+    for board in (grid_board, flat_board):
+        board.move(Coord(1, 4), Coord(3, 4))
+        board.move(Coord(6, 3), Coord(4, 3))
+        board.move(Coord(3, 4), Coord(4, 3))
+
+    assert str(flat_board) == str(grid_board)
+    assert flat_board.at(Coord(4, 3)).get_symbol_with_side() == "P"
+    assert flat_board.board[4][3] is flat_board.at(Coord(4, 3))
+    assert len(list(flat_board.iter_pieces())) == 31
+
+    flat_board.history.undo_move()
+    assert flat_board.at(Coord(4, 3)).get_symbol_with_side() == "p"
+    assert flat_board.at(Coord(3, 4)).get_symbol_with_side() == "P"
+    flat_board.history.redo_move()
+    assert str(flat_board) == str(grid_board)
+
+    flat_states = [
+        [[repr(p) for p in row] for row in s] for s in flat_board.history.state_stack
+    ]
+    grid_states = [
+        [[repr(p) for p in row] for row in s] for s in grid_board.history.state_stack
+    ]
+    assert flat_states == grid_states
+
+    flat_board.clear()
+    assert list(flat_board.iter_pieces()) == []
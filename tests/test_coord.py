@@ -97,3 +97,24 @@ def test_direction_unit():
     assert Coord(2, 2).direction_unit(Coord(5, 5)) == Coord(1, 1)
     assert Coord(4, 4).direction_unit(Coord(4, 1)) == Coord(0, -1)
     assert Coord(3, 3).direction_unit(Coord(3, 3)) == Coord(0, 0)
+
+
+def test_direction_helpers_are_shared():
+    """Direction helpers return shared instances instead of new objects."""
+    assert Coord.up() is Coord.up()
+    assert Coord.null() is Coord.null()
+    assert Coord.orthogonals() == (Coord(-1, 0), Coord(1, 0), Coord(0, -1), Coord(0, 1))
+    assert len(Coord.diagonals()) == 4
+    assert len(Coord.omnidirectionals()) == 8
+    assert set(Coord.omnidirectionals()) == set(Coord.orthogonals()) | set(
+        Coord.diagonals()
+    )
+    assert len(set(Coord.lshapes())) == 8
+    assert all({abs(d.r), abs(d.c)} == {1, 2} for d in Coord.lshapes())
+
+
+def test_coord_hash_matches_tuple():
+    """Cached hashes keep Coord usable as a dict key alongside equal coords."""
+    assert hash(Coord(3, 4)) == hash(Coord(3, 4))
+    assert {Coord(3, 4): 1}[Coord(3, 4)] == 1
+    assert not hasattr(Coord(1, 1), "__dict__")
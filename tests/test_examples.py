@@ -1,5 +1,9 @@
+import random
+
+import pytest
+
 from cynmeith import Config, Game, GameOutcome, QuotaTurnPolicy
-from cynmeith.utils import Coord
+from cynmeith.utils import Coord, Move, MoveHistoryError
 from examples.chess.chess_manager import ChessManager
 from examples.chess.game import (
     _build_chess_config_data,
@@ -57,6 +61,139 @@ def test_chess_example_detects_fools_mate_as_checkmate() -> None:
     assert game.is_over
 
 
+def _game_state(game) -> tuple:
+    history = game.board.history
+    return (
+        repr(game.board),
+        game.board.position_hash,
+        game.position_hash,
+        game.current_side,
+        game.outcome,
+        history.num_moves,
+        list(history.move_stack),
+        list(history.redo_stack),
+        history.repetition_count(),
+        [[repr(piece) for piece in row] for row in history.state_stack[-1]],
+    )
+
+
+def test_chess_example_push_pop_restores_identical_state() -> None:
+    game = build_chess_spec("data").create_game()
+    game.move(Coord(1, 4), Coord(3, 4))
+    game.move(Coord(6, 0), Coord(5, 0))
+    game.undo_move()
+    before = _game_state(game)
+
+    line = [
+        Move(Coord(6, 3), Coord(4, 3)),
+        Move(Coord(3, 4), Coord(4, 3)),  # capture
+        Move(Coord(6, 4), Coord(4, 4)),
+        Move(Coord(4, 3), Coord(5, 4)),  # en passant
+        Move(Coord(7, 5), Coord(3, 1)),
+        Move(Coord(0, 6), Coord(2, 5)),
+        Move(Coord(7, 6), Coord(5, 5)),
+        Move(Coord(0, 5), Coord(3, 2)),
+        Move(Coord(7, 4), Coord(7, 6)),  # castling
+    ]
+    for move in line:
+        game.push(move)
+    assert game.num_pushed == len(line)
+    assert game.board.history.num_moves == 1 + len(line)
+    assert game.board.at(Coord(4, 4)) is None
+    assert game.board.at(Coord(7, 5)).symbol == "R"
+    with pytest.raises(MoveHistoryError):
+        game.move(Coord(1, 0), Coord(2, 0))
+    with pytest.raises(MoveHistoryError):
+        game.undo_move()
+
+    popped = [game.pop() for _ in line]
+    assert [(move.start, move.end) for move in reversed(popped)] == [
+        (move.start, move.end) for move in line
+    ]
+    assert _game_state(game) == before
+    with pytest.raises(MoveHistoryError):
+        game.pop()
+
+    game.redo_move()
+    assert game.board.at(Coord(5, 0)) is not None
+
+
+def test_chess_example_push_can_evaluate_and_skip_validation() -> None:
+    game = build_chess_spec("data").create_game()
+    game.move(Coord(1, 5), Coord(2, 5))
+    game.move(Coord(6, 4), Coord(4, 4))
+    before = _game_state(game)
+
+    resolved = game.board.manager.resolve_move(Move(Coord(1, 6), Coord(3, 6)))
+    game.push(resolved, validate=False)
+    assert game.outcome is None
+    game.push(Move(Coord(7, 3), Coord(3, 7)), evaluate=True)
+    assert game.outcome == GameOutcome(False, "win", "Checkmate.")
+
+    game.pop()
+    game.pop()
+    assert _game_state(game) == before
+
+
+def test_chess_example_legal_moves_returns_resolved_moves_for_side() -> None:
+    game = build_chess_spec("data").create_game()
+
+    moves = game.legal_moves()
+    assert len(moves) == 20
+    by_start: dict[Coord, list[Coord]] = {}
+    for move in moves:
+        by_start.setdefault(move.start, []).append(move.end)
+    for start, ends in by_start.items():
+        assert set(ends) == set(game.get_valid_moves(game.board.at(start)) or [])
+    assert game.legal_moves(False) == []
+
+    double_step = next(m for m in moves if m.end == Coord(3, 4))
+    game.push(double_step, validate=False)
+    assert game.board.at(Coord(3, 4)) is not None
+    game.pop()
+
+    game.move(Coord(1, 5), Coord(2, 5))
+    game.move(Coord(6, 4), Coord(4, 4))
+    game.move(Coord(1, 6), Coord(3, 6))
+    game.move(Coord(7, 3), Coord(3, 7))
+    assert game.legal_moves() == []
+
+
+def test_chess_example_has_any_legal_move_stops_early_and_memoizes() -> None:
+    game = build_chess_spec("data").create_game()
+    manager = game.board.manager
+    resolve_move = manager.resolve_move
+    calls = []
+
+    def counting_resolve(move):
+        calls.append(move)
+        return resolve_move(move)
+
+    manager.resolve_move = counting_resolve
+    assert game.has_any_legal_move()
+    first_search = len(calls)
+    assert 0 < first_search < 20
+    assert game.has_any_legal_move()
+    assert len(calls) == first_search
+
+    game.move(Coord(1, 4), Coord(3, 4))
+    assert game.has_any_legal_move()
+    assert len(calls) > first_search
+
+
+def test_chess_example_reset_after_checkmate_starts_a_fresh_game() -> None:
+    game = build_chess_spec("data").create_game()
+    game.move(Coord(1, 5), Coord(2, 5))
+    game.move(Coord(6, 4), Coord(4, 4))
+    game.move(Coord(1, 6), Coord(3, 6))
+    game.move(Coord(7, 3), Coord(3, 7))
+    assert game.is_over
+
+    game.reset()
+    assert game.outcome is None
+    assert len(game.legal_moves()) == 20
+
+
 def test_chess_example_stalemate_is_a_draw() -> None:
     game = Game(
         Config.from_data(_build_chess_config_data()),
@@ -77,6 +214,63 @@ def test_chess_example_stalemate_is_a_draw() -> None:
     assert game.is_over
 
 
+def test_chess_example_position_hash_tracks_turn_and_piece_state() -> None:
+    game = build_chess_spec("data").create_game()
+    initial = game.position_hash
+
+    game.move(Coord(0, 6), Coord(2, 5))
+    assert game.position_hash != initial
+    game.move(Coord(7, 6), Coord(5, 5))
+    game.move(Coord(2, 5), Coord(0, 6))
+    game.move(Coord(5, 5), Coord(7, 6))
+    assert game.position_hash == initial
+
+    # Same squares, but the king has lost its castling rights.
+    game.move(Coord(1, 4), Coord(2, 4))
+    game.move(Coord(6, 4), Coord(5, 4))
+    board_before_king_walk = game.board.position_hash
+    game.move(Coord(0, 4), Coord(1, 4))
+    game.move(Coord(7, 6), Coord(5, 5))
+    game.move(Coord(1, 4), Coord(0, 4))
+    game.move(Coord(5, 5), Coord(7, 6))
+    after_king_walk = game.position_hash
+    assert game.board.position_hash != board_before_king_walk
+
+    for _ in range(4):
+        game.undo_move()
+    assert game.board.position_hash == board_before_king_walk
+    for _ in range(4):
+        game.redo_move()
+    assert game.position_hash == after_king_walk
+
+
+def test_chess_example_detects_threefold_repetition() -> None:
+    game = build_chess_spec("data").create_game()
+    shuffle = [
+        (Coord(0, 6), Coord(2, 5)),
+        (Coord(7, 6), Coord(5, 5)),
+        (Coord(2, 5), Coord(0, 6)),
+        (Coord(5, 5), Coord(7, 6)),
+    ]
+
+    for start, end in shuffle:
+        game.move(start, end)
+    assert game.board.history.repetition_count() == 2
+    assert game.outcome is None
+
+    for start, end in shuffle[:3]:
+        game.move(start, end)
+    assert game.outcome is None
+    game.move(*shuffle[3])
+    assert game.outcome == GameOutcome(None, "draw", "Threefold repetition.")
+
+    game.undo_move()
+    assert game.outcome is None
+    assert game.board.history.repetition_count() == 2
+    game.redo_move()
+    assert game.board.history.repetition_count() == 3
+
+
 def test_xiangqi_example_rejects_moves_that_leave_general_in_check() -> None:
     game = build_xiangqi_spec("data").create_game()
     game.board.clear()
@@ -130,3 +324,105 @@ def test_xiangqi_example_stalemate_is_a_loss_for_the_side_to_move() -> None:
     game.board.set_at(Coord(5, 4), blocker)
 
     assert game.outcome == GameOutcome(True, "win", "No legal moves.")
+
+
+def _forward_attacked(board, target: Coord, by_side: bool) -> bool:
+    # The per-piece scan the reverse attack patterns replaced.
+    for piece in board.iter_pieces_by_side(by_side):
+        symbol = piece.symbol.upper()
+        if symbol == "G":
+            if piece.position.manhattan_to(target) == 1:
+                return True
+            if piece.position.c == target.c and board.is_empty_line(
+                piece.position, target, Coord.is_vertical
+            ):
+                return True
+        elif piece.is_valid_move(target, board):
+            return True
+    return False
+
+
+@pytest.mark.parametrize(
+    ("build_spec", "royal_symbol"),
+    [(build_chess_spec, "K"), (build_xiangqi_spec, "G")],
+)
+def test_attack_patterns_match_forward_scan_on_captures(
+    build_spec, royal_symbol
+) -> None:
+    rng = random.Random(7)
+    game = build_spec("data").create_game()
+    rules = game.board.manager.royal_rules
+
+    for _ in range(40):
+        board = game.board
+        for position, piece in board.iter_enumerate():
+            if piece is None:
+                continue
+            by_side = not piece.side
+            assert rules.is_square_attacked(
+                board, position, by_side
+            ) == _forward_attacked(board, position, by_side), (position, piece)
+        moves = [
+            move
+            for move in game.legal_moves()
+            if (target := board.at(move.end)) is None
+            or target.symbol.upper() != royal_symbol
+        ]
+        if not moves:
+            break
+        game.push(rng.choice(moves), validate=False)
+
+
+def test_xiangqi_cannon_and_horse_attacks_respect_screens_and_legs() -> None:
+    game = build_xiangqi_spec("data").create_game()
+    board = game.board
+    board.clear()
+    rules = board.manager.royal_rules
+
+    board.set_at(Coord(9, 4), board.factory.create_piece("g", Coord(9, 4)))
+    board.set_at(Coord(5, 4), board.factory.create_piece("C", Coord(5, 4)))
+    assert not rules.is_square_attacked(board, Coord(9, 4), True)
+    board.set_at(Coord(7, 4), board.factory.create_piece("s", Coord(7, 4)))
+    assert rules.is_square_attacked(board, Coord(9, 4), True)
+    board.set_at(Coord(6, 4), board.factory.create_piece("S", Coord(6, 4)))
+    assert not rules.is_square_attacked(board, Coord(9, 4), True)
+
+    board.set_at(Coord(7, 3), board.factory.create_piece("H", Coord(7, 3)))
+    assert rules.is_square_attacked(board, Coord(9, 4), True)
+    board.set_at(Coord(8, 3), board.factory.create_piece("a", Coord(8, 3)))
+    assert not rules.is_square_attacked(board, Coord(9, 4), True)
+
+
+@pytest.mark.parametrize("build_spec", [build_chess_spec, build_xiangqi_spec])
+def test_pin_filter_matches_simulation_for_every_legal_move(build_spec) -> None:
+    rng = random.Random(11)
+    game = build_spec("data").create_game()
+    manager = game.board.manager
+
+    for _ in range(60):
+        filtered = game.legal_moves()
+        manager.pin_filter = False
+        simulated = game.legal_moves()
+        manager.pin_filter = True
+        assert [(m.start, m.end) for m in filtered] == [
+            (m.start, m.end) for m in simulated
+        ]
+        if not filtered:
+            break
+        game.push(rng.choice(filtered), validate=False)
+
+
+def test_chess_pin_filter_keeps_pinned_piece_on_its_line() -> None:
+    game = build_chess_spec("data").create_game()
+    board = game.board
+    board.clear()
+    for symbol, position in (
+        ("K", Coord(0, 4)),
+        ("R", Coord(2, 4)),
+        ("r", Coord(6, 4)),
+        ("k", Coord(7, 0)),
+    ):
+        board.set_at(position, board.factory.create_piece(symbol, position))
+
+    ends = set(game.get_valid_moves(board.at(Coord(2, 4))))
+    assert ends == {Coord(1, 4), Coord(3, 4), Coord(4, 4), Coord(5, 4), Coord(6, 4)}
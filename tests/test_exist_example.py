@@ -1,5 +1,5 @@
-from cynmeith import GameOutcome
-from cynmeith.utils import Coord
+from cynmeith import GameOutcome, MoveList, WinCondition
+from cynmeith.utils import Coord, Move
 from examples.exist.exist_turn_policy import ExistTurnSnapshot
 from examples.exist.game import build_game_spec
 
@@ -23,6 +23,49 @@ def test_exist_place_consumes_reserve_and_requires_end_turn_after_one_action() -
     assert game.current_side is False
 
 
+def test_exist_legal_moves_include_placements_and_end_turn() -> None:
+    game = build_game_spec().create_game()
+
+    moves = game.legal_moves()
+    move_types = {move.move_type for move in moves}
+    assert "PLACE" in move_types
+    placements = [move for move in moves if move.move_type == "PLACE"]
+    assert all(game.board.is_empty(move.end) for move in placements)
+
+    game.move(Coord.null(), Coord(3, 3), "PLACE")
+    moves = game.legal_moves()
+    assert "PLACE" not in {move.move_type for move in moves}
+    assert "END_TURN" in {move.move_type for move in moves}
+    for move in moves:
+        assert game.can_move(move.start, move.end, move.move_type)
+
+
+def test_exist_legal_move_list_round_trips_packed_moves() -> None:
+    game = build_game_spec().create_game()
+
+    moves = game.legal_moves()
+    assert [
+        (move.start, move.end, move.move_type) for move in game.legal_move_list()
+    ] == [(move.start, move.end, move.move_type) for move in moves]
+
+    packed = MoveList(game.move_codec, moves)
+    assert packed.codes.typecode == "I"
+    assert list(packed) == moves
+    assert packed[0].extra_info is moves[0].extra_info
+    assert packed[-1] == moves[-1]
+    assert list(packed[2:5]) == moves[2:5]
+
+    codec = game.move_codec
+    end_turn = Move(Coord.null(), Coord.null(), "END_TURN")
+    code = codec.encode(end_turn)
+    assert codec.decode(code) == end_turn
+    assert codec.flags(code) == 0
+    assert codec.flags(codec.encode(moves[0])) == 1
+    assert codec.end_index(codec.encode(Move(Coord.null(), Coord(1, 2)))) == (
+        1 * game.board.width + 2
+    )
+
+
 def test_exist_tile_capture_adds_captured_piece_to_attackers_reserve() -> None:
     game = build_game_spec().create_game()
     game.board.clear()
@@ -194,3 +237,45 @@ def test_exist_draw_only_triggers_at_turn_boundary() -> None:
         "draw",
         "All 16 pieces are on the board.",
     )
+
+
+def test_exist_push_pop_restores_reserves_and_turn_state() -> None:
+    game = build_game_spec().create_game()
+    before = (repr(game.board), game.position_hash, game.reserves.snapshot())
+
+    game.push(Move(Coord.null(), Coord(3, 3), "place"))
+    assert game.reserves.get_count(True) == 7
+    game.push(Move(Coord.null(), Coord.null(), "END_TURN"))
+    assert game.current_side is False
+    game.push(Move(Coord.null(), Coord(4, 6), "PLACE"))
+    assert game.reserves.get_count(False) == 7
+
+    for _ in range(3):
+        game.pop()
+    assert (repr(game.board), game.position_hash, game.reserves.snapshot()) == before
+    assert game.turn_policy.snapshot().actions_this_turn == 0
+
+
+def test_exist_manual_setup_syncs_reserves_before_evaluating_outcome() -> None:
+    game = build_game_spec().create_game()
+    seen_reserves = []
+
+    class RecordReserves(WinCondition):
+        def evaluate(self, game):
+            seen_reserves.append(game.reserves.get_count(True))
+            game.evaluation_context.has_legal_move(True)
+            return None
+
+    game.win_conditions.insert(0, RecordReserves())
+    game.board.clear()
+    for r, c in [(0, 0), (0, 4), (2, 2), (2, 6), (4, 0), (4, 4), (6, 2), (6, 6)]:
+        position = Coord(r, c)
+        game.board.set_at(position, game.board.factory.create_piece("X", position))
+
+    assert seen_reserves[-1] == 0
+    assert game.reserves.get_count(True) == 0
+
+    # Answers cached for one reserve count are not reused for another.
+    context = game.evaluation_context
+    game.reserves.gain_pieces(True)
+    assert game.evaluation_context is not context
@@ -5,6 +5,8 @@ from cynmeith import (
     FreeTurnPolicy,
     Game,
     GameOutcome,
+    MoveCodec,
+    MoveList,
     PhaseSystem,
     QuotaTurnPolicy,
     ResourceSystem,
@@ -17,6 +19,7 @@ from cynmeith.core.piece import Piece
 from cynmeith.utils import Coord
 from cynmeith.utils.aliases import InvalidMoveError, Move
 from examples.chess.chess_manager import ChessManager
+from examples.chess.game import build_game_spec as build_chess_spec
 from examples.xiangqi.game import build_game_spec as build_xiangqi_spec
 
 
@@ -114,6 +117,65 @@ def test_game_supports_custom_promotion_piece() -> None:
     assert game.board.at(Coord(0, 0)).get_symbol_with_side() == "n"
 
 
+def test_failed_push_leaves_the_game_usable() -> None:
+    game = Game(
+        Config.from_data(make_empty_chess_config_data()),
+        move_manager=ChessManager,
+        turn_policy=QuotaTurnPolicy(),
+    )
+    game.board.set_at(Coord(6, 0), game.board.factory.create_piece("P", Coord(6, 0)))
+    game.board.set_at(Coord(0, 7), game.board.factory.create_piece("K", Coord(0, 7)))
+    before = game.position_hash
+
+    with pytest.raises(InvalidMoveError):
+        game.push(Move(Coord(6, 0), Coord(7, 0)), validate=False)
+
+    assert game.num_pushed == 0
+    assert game.board.history.num_pushed == 0
+    assert game.position_hash == before
+    assert game.current_side is True
+
+    game.push(Move(Coord(0, 7), Coord(1, 7)))
+    assert game.board.history.move_stack[-1].start == Coord(0, 7)
+    game.pop()
+    game.move(Coord(6, 0), Coord(7, 0), extra_info={"promotion": "Q"})
+    game.undo_move()
+    assert game.position_hash == before
+
+
+def test_every_legal_move_can_be_pushed() -> None:
+    game = Game(
+        Config.from_data(make_empty_chess_config_data()),
+        move_manager=ChessManager,
+        turn_policy=QuotaTurnPolicy(),
+    )
+    for symbol, position in (
+        ("P", Coord(6, 0)),
+        ("P", Coord(6, 3)),
+        ("K", Coord(0, 7)),
+        ("r", Coord(7, 4)),
+        ("k", Coord(5, 7)),
+    ):
+        game.board.set_at(position, game.board.factory.create_piece(symbol, position))
+    before = game.position_hash
+
+    moves = game.legal_moves()
+    promotions = [move for move in moves if move.end.r == 7]
+    assert {(move.end, move.extra_info["promotion"]) for move in promotions} == {
+        (end, symbol)
+        for end in (Coord(7, 0), Coord(7, 3), Coord(7, 4))
+        for symbol in "QRBN"
+    }
+    for move in moves:
+        game.push(move, validate=False)
+        game.pop()
+    assert game.position_hash == before
+
+    # A request that already names its choice is left alone.
+    request = Move(Coord(6, 0), Coord(7, 0), extra_info={"promotion": "N"})
+    assert list(game.board.manager.expand_request(request)) == [request]
+
+
 def test_manual_setup_resets_undo_baseline() -> None:
     game = Game(
         Config.from_data(make_empty_chess_config_data()), move_manager=ChessManager
@@ -292,6 +354,9 @@ class SingleChargeResourceSystem(ResourceSystem):
     def restore(self, snapshot: dict[bool, int]) -> None:
         self.charges = dict(snapshot)
 
+    def hash_state(self) -> tuple[int, int]:
+        return self.charges[True], self.charges[False]
+
 
 class PieceCountScoringSystem(ScoringSystem):
     def reset(self) -> None:
@@ -457,6 +522,7 @@ def test_game_resource_system_blocks_spent_side_and_restores_on_undo() -> None:
 
     rook = game.board.factory.create_piece("R", Coord(0, 0))
     game.board.set_at(Coord(0, 0), rook)
+    initial_state_hash = game.state_hash
 
     assert game.can_move(Coord(0, 0), Coord(0, 2))
     game.move(Coord(0, 0), Coord(0, 2))
@@ -464,9 +530,18 @@ def test_game_resource_system_blocks_spent_side_and_restores_on_undo() -> None:
     assert resource_system.charges[True] == 0
     assert not game.can_move(Coord(0, 2), Coord(0, 3))
 
+    # Same position, but the spent charge changes the search key.
+    position_hash = game.position_hash
+    spent_state_hash = game.state_hash
+    resource_system.charges[True] = 1
+    assert game.position_hash == position_hash
+    assert game.state_hash != spent_state_hash
+    resource_system.charges[True] = 0
+
     game.undo_move()
     assert resource_system.charges[True] == 1
     assert game.can_move(Coord(0, 0), Coord(0, 2))
+    assert game.state_hash == initial_state_hash
 
 
 def test_game_scoring_system_reports_scores_from_current_state() -> None:
@@ -555,7 +630,105 @@ def test_game_max_history_caps_state_snapshots_and_history(board=None) -> None:
         game.undo_move()
 
 
+def test_game_max_history_drops_oldest_state_snapshots() -> None:
+    """
+    Trimming must drop the oldest snapshots so the retained turn state
+    still lines up with the board once the seed move is folded away.
+    """
+    game = Game(
+        Config.from_data(make_chess_config_data()),
+        move_manager=ChessManager,
+        turn_policy=QuotaTurnPolicy(),
+        max_history=2,
+    )
+
+    game.move(Coord(1, 0), Coord(2, 0))
+    game.move(Coord(6, 0), Coord(4, 0))
+    game.move(Coord(1, 1), Coord(2, 1))
+
+    game.undo_move()
+    game.undo_move()
+    assert game.board.at(Coord(2, 0)) is not None
+    assert game.board.at(Coord(6, 0)) is not None
+    assert game.current_side is False
+    game.move(Coord(6, 0), Coord(5, 0))
+
+
 def test_xiangqi_example_uses_standard_turn_order() -> None:
     game = build_xiangqi_spec().create_game()
 
     assert game.current_side is True
+
+
+def test_move_codec_rejects_off_board_cells_and_extra_move_types():
+    codec = MoveCodec(8, 8)
+    assert codec.bits <= 32
+    assert codec.decode(codec.encode(Move(Coord(0, 0), Coord(7, 7)))) == Move(
+        Coord(0, 0), Coord(7, 7)
+    )
+    with pytest.raises(ValueError):
+        codec.encode(Move(Coord(0, 0), Coord(8, 0)))
+
+    for index in range(255):
+        codec.move_type_id(f"T{index}")
+    with pytest.raises(ValueError):
+        codec.move_type_id("one too many")
+
+    assert MoveCodec(64, 64).bits > 32
+
+
+def test_move_codec_tells_promotion_choices_apart():
+    game = build_chess_spec("data").create_game()
+    game.board.clear()
+    for position, symbol in {
+        Coord(0, 4): "K",
+        Coord(6, 0): "P",
+        Coord(7, 7): "k",
+    }.items():
+        game.board.set_at(position, game.board.factory.create_piece(symbol, position))
+
+    promotions = [move for move in game.legal_moves() if move.start == Coord(6, 0)]
+    codec = game.move_codec
+    codes = {codec.encode(move) for move in promotions}
+    assert len(codes) == len(promotions) == 4
+    assert codec.bits <= 32
+
+    for move in promotions:
+        decoded = codec.decode(codec.encode(move))
+        assert decoded.extra_info == {"promotion": move.extra_info["promotion"]}
+    packed = MoveList(codec, promotions)
+    assert [move.extra_info["promotion"] for move in packed] == [
+        move.extra_info["promotion"] for move in promotions
+    ]
+
+
+def test_move_effects_are_cached_tuples_shared_through_history():
+    effects = EffectPresets.capture(Coord(6, 0))
+    move = Move(Coord(0, 0), Coord(6, 0), extra_info={"effects": effects})
+    assert move.effects is effects
+    assert Move(Coord(0, 0), Coord(1, 0)).effects == ()
+
+    listed = Move(Coord(0, 0), Coord(6, 0), extra_info={"effects": list(effects)})
+    assert listed.effects == effects
+    assert listed.effects is listed.effects
+
+    # Objects that are not effects are skipped, as before caching.
+    mixed = Move(Coord(0, 0), Coord(6, 0), extra_info={"effects": ["note", *effects]})
+    assert mixed.effects == effects
+
+    game = Game(Config.from_data(make_chess_config_data()), move_manager=ChessManager)
+    for start, end in [
+        (Coord(1, 4), Coord(3, 4)),
+        (Coord(6, 0), Coord(5, 0)),
+        (Coord(3, 4), Coord(4, 4)),
+        (Coord(6, 3), Coord(4, 3)),
+    ]:
+        game.move(start, end)
+    (en_passant,) = [
+        move for move in game.legal_moves() if move.end == Coord(5, 3) and move.effects
+    ]
+    game.push(en_passant, validate=False)
+    assert game.board.at(Coord(4, 3)) is None
+    recorded = game.board.history.move_stack[-1]
+    assert recorded is en_passant
+    assert recorded.effects is en_passant.effects
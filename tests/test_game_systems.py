@@ -2,6 +2,7 @@ from cynmeith import (
     ActionPointSystem,
     Config,
     EliminatePieceCondition,
+    EvaluationContext,
     FreeTurnPolicy,
     Game,
     GameOutcome,
@@ -15,6 +16,7 @@ from cynmeith import (
     StaticPhaseSystem,
     TurnCountPhaseSystem,
     TwoStagePhaseSystem,
+    WinCondition,
 )
 from cynmeith.core.move_effects import EffectPresets
 from cynmeith.core.move_manager import MoveManager
@@ -173,6 +175,45 @@ def test_move_limit_draw_condition_triggers_after_threshold() -> None:
     assert game.outcome == GameOutcome(None, "draw", "Move limit 2 reached.")
 
 
+class SharedCountCondition(WinCondition):
+    def __init__(self, calls: list[int]) -> None:
+        self.calls = calls
+
+    def evaluate(self, game: Game) -> GameOutcome | None:
+        def count_rooks() -> int:
+            self.calls.append(game.board.history.num_moves)
+            return game.board.count_pieces(True, "R")
+
+        game.evaluation_context.cached((SharedCountCondition, "rooks"), count_rooks)
+        return None
+
+
+def test_evaluation_context_is_shared_by_conditions_for_one_ply() -> None:
+    calls: list[int] = []
+    game = Game(
+        Config.from_data(make_chess_config_data()),
+        move_manager=ChessManager,
+        turn_policy=FreeTurnPolicy(),
+        win_conditions=[SharedCountCondition(calls), SharedCountCondition(calls)],
+    )
+    game.board.set_at(Coord(0, 0), game.board.factory.create_piece("R", Coord(0, 0)))
+    calls.clear()
+
+    game.move(Coord(0, 0), Coord(3, 0))
+    assert calls == [1]
+
+    context = game.evaluation_context
+    assert isinstance(context, EvaluationContext)
+    assert context is game.evaluation_context
+    assert context.position_key == game.position_hash
+    assert context.piece_count(True, "r") == 1
+    assert context.piece_count(False) == 0
+
+    game.move(Coord(3, 0), Coord(3, 5))
+    assert calls == [1, 2]
+    assert game.evaluation_context is not context
+
+
 def test_static_phase_system_reports_constant_phase() -> None:
     game = Game(
         Config.from_data(make_chess_config_data()),
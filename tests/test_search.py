@@ -0,0 +1,413 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cynmeith import Game
+from cynmeith.search import (
+    WIN_SCORE,
+    AlphaBetaSearch,
+    MonteCarloTreeSearch,
+    RandomPlayout,
+    TranspositionTable,
+    move_key,
+)
+from cynmeith.search.transposition import EXACT, LOWER, UPPER
+from cynmeith.utils import Coord, Move
+from examples.chess.game import build_game_spec as build_chess_spec
+from examples.exist.game import build_game_spec as build_exist_spec
+from examples.xiangqi.game import build_game_spec as build_xiangqi_spec
+
+
+def _place(game: Game, pieces: dict[Coord, str]) -> None:
+    game.board.clear()
+    for position, symbol in pieces.items():
+        game.board.set_at(position, game.board.factory.create_piece(symbol, position))
+
+
+def _game_state(game: Game) -> tuple:
+    return (
+        game.position_hash,
+        game.board.history.num_moves,
+        game.num_pushed,
+        game.outcome,
+    )
+
+
+def test_alpha_beta_finds_back_rank_mate() -> None:
+    game = build_chess_spec("data").create_game()
+    _place(
+        game,
+        {
+            Coord(0, 0): "R",
+            Coord(0, 4): "K",
+            Coord(7, 6): "k",
+            Coord(6, 5): "p",
+            Coord(6, 6): "p",
+            Coord(6, 7): "p",
+        },
+    )
+    before = _game_state(game)
+
+    result = AlphaBetaSearch().search(game, 2)
+
+    assert result.move == Move(Coord(0, 0), Coord(7, 0))
+    assert result.score == WIN_SCORE - 1
+    assert result.depth == 2
+    assert result.nodes > 0
+    assert result.principal_variation == (result.move,)
+    assert _game_state(game) == before
+
+
+def test_alpha_beta_takes_a_hanging_rook() -> None:
+    game = build_chess_spec("data").create_game()
+    _place(
+        game,
+        {
+            Coord(0, 4): "K",
+            Coord(3, 3): "Q",
+            Coord(7, 4): "k",
+            Coord(5, 3): "r",
+        },
+    )
+
+    result = AlphaBetaSearch().search(game, 2)
+
+    assert result.move == Move(Coord(3, 3), Coord(5, 3))
+    assert result.score == 9
+
+
+def test_alpha_beta_generates_promotion_choices() -> None:
+    game = build_chess_spec("data").create_game()
+    _place(game, {Coord(0, 4): "K", Coord(6, 0): "P", Coord(7, 7): "k"})
+
+    promotions = [move for move in game.legal_moves() if move.start == Coord(6, 0)]
+    assert sorted(move.extra_info["promotion"] for move in promotions) == [
+        "B",
+        "N",
+        "Q",
+        "R",
+    ]
+
+    result = AlphaBetaSearch().search(game, 1)
+    assert result.move.extra_info == {"promotion": "Q"}
+
+
+def test_alpha_beta_table_keeps_an_underpromotion_as_best_move(monkeypatch) -> None:
+    game = build_chess_spec("data").create_game()
+    # c8=N+ forks the king on e7 and the queen on b6.
+    _place(
+        game,
+        {Coord(0, 4): "K", Coord(6, 2): "P", Coord(6, 4): "k", Coord(5, 1): "q"},
+    )
+    search = AlphaBetaSearch()
+
+    result = search.search(game, 3)
+
+    assert result.move.extra_info["promotion"] == "N"
+    entry = search.table.probe(game.state_hash)
+    assert entry.move_code == game.move_codec.encode(result.move)
+    # A table cutoff's line is decoded, not looked up among the legal moves.
+    with monkeypatch.context() as patch:
+        patch.setattr(game, "iter_legal_moves", None)
+        (line_move,) = AlphaBetaSearch._table_line(game, entry.move_code)
+    assert line_move.extra_info["promotion"] == "N"
+    assert move_key(line_move) == move_key(result.move)
+    game.push(line_move)
+    assert game.board.at(Coord(7, 2)).symbol == "N"
+    game.pop()
+
+
+@pytest.mark.parametrize(
+    "build_spec", [build_xiangqi_spec, build_exist_spec], ids=["xiangqi", "exist"]
+)
+def test_alpha_beta_returns_a_legal_move_and_restores_the_game(build_spec) -> None:
+    game = build_spec().create_game()
+    before = _game_state(game)
+
+    result = AlphaBetaSearch().search(game, 2)
+
+    assert result.move is not None
+    assert move_key(result.move) in {move_key(move) for move in game.legal_moves()}
+    assert _game_state(game) == before
+    game.push(result.move, validate=False)
+
+
+def test_alpha_beta_requires_a_side_to_move() -> None:
+    game = Game("examples/chess/testchess.yaml")
+    with pytest.raises(ValueError):
+        AlphaBetaSearch().search(game, 1)
+
+
+def test_transposition_table_replacement_policy_and_stats() -> None:
+    table = TranspositionTable(entries=4)
+    assert table.size == 4
+    assert table.probe(1) is None
+
+    # Keys 1, 3 and 5 share a bucket: the deeper result keeps slot one.
+    table.store(1, 5, 10, EXACT, 7)
+    table.store(3, 2, 20, LOWER, None)
+    table.store(5, 1, 30, UPPER, 9)
+    assert table.probe(1).depth == 5
+    assert table.probe(3) is None
+    entry = table.probe(5)
+    assert (entry.depth, entry.score, entry.bound, entry.move_code) == (1, 30, UPPER, 9)
+    assert len(table) == 2
+    assert (table.stores, table.replacements) == (3, 1)
+
+    # Re-storing a key without a move keeps the earlier best move.
+    table.store(5, 2, 31, EXACT, None)
+    assert table.probe(5).move_code == 9
+
+    # Results from an earlier search give up the depth-preferred slot.
+    table.new_search()
+    table.store(3, 1, 40, EXACT, None)
+    assert table.probe(3).score == 40
+    assert table.probe(1) is None
+    assert table.hits == 4
+    assert table.hit_rate == pytest.approx(4 / 7)
+
+    table.clear()
+    assert len(table) == 0
+    assert table.probe(3) is None
+    assert (table.hits, table.misses, table.stores) == (0, 1, 0)
+
+
+def test_alpha_beta_table_keeps_results_and_saves_nodes_on_repeat() -> None:
+    def place(game: Game) -> None:
+        _place(
+            game,
+            {
+                Coord(0, 4): "K",
+                Coord(3, 3): "Q",
+                Coord(7, 4): "k",
+                Coord(5, 3): "r",
+                Coord(6, 0): "p",
+            },
+        )
+
+    plain_game = build_chess_spec("data").create_game()
+    place(plain_game)
+    plain = AlphaBetaSearch(table_entries=0).search(plain_game, 4)
+
+    game = build_chess_spec("data").create_game()
+    place(game)
+    before = _game_state(game)
+    search = AlphaBetaSearch()
+    first = search.search(game, 4)
+    again = search.search(game, 4)
+
+    assert (first.move, first.score) == (plain.move, plain.score)
+    assert (again.move, again.score) == (plain.move, plain.score)
+    assert first.nodes <= plain.nodes
+    assert again.nodes < first.nodes
+    assert search.table.hits > 0
+    assert _game_state(game) == before
+
+
+def test_alpha_beta_node_and_time_limits_return_a_legal_move() -> None:
+    game = build_xiangqi_spec().create_game()
+    before = _game_state(game)
+    legal = {move_key(move) for move in game.legal_moves()}
+    search = AlphaBetaSearch()
+
+    result = search.search(game, node_limit=300)
+    assert result.stopped
+    assert result.nodes <= 300
+    assert move_key(result.move) in legal
+    assert _game_state(game) == before
+
+    result = search.search(game, time_limit=0)
+    assert result.stopped
+    assert result.depth == 0
+    assert move_key(result.move) in legal
+    assert _game_state(game) == before
+
+    result = search.search(game, 1, node_limit=10_000)
+    assert not result.stopped
+    assert result.depth == 1
+
+    with pytest.raises(ValueError):
+        search.search(game)
+
+
+def test_alpha_beta_stops_from_another_thread() -> None:
+    game = build_xiangqi_spec().create_game()
+    before = _game_state(game)
+    search = AlphaBetaSearch()
+    results = []
+    worker = threading.Thread(
+        target=lambda: results.append(search.search(game, time_limit=60))
+    )
+
+    started = time.monotonic()
+    worker.start()
+    time.sleep(0.2)
+    search.stop()
+    worker.join(timeout=10)
+
+    assert not worker.is_alive()
+    assert time.monotonic() - started < 10
+    assert results[0].stopped
+    assert results[0].move is not None
+    assert _game_state(game) == before
+
+
+def test_alpha_beta_async_search_can_be_cancelled() -> None:
+    game = build_xiangqi_spec().create_game()
+    before = _game_state(game)
+    search = AlphaBetaSearch()
+
+    async def run() -> None:
+        result = await search.search_async(game, 1)
+        assert result.depth == 1 and not result.stopped
+
+        task = asyncio.create_task(search.search_async(game, time_limit=60))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(asyncio.wait_for(run(), timeout=10))
+    assert _game_state(game) == before
+
+
+def test_alpha_beta_async_cancel_before_the_search_starts() -> None:
+    game = build_xiangqi_spec().create_game()
+    before = _game_state(game)
+    search = AlphaBetaSearch()
+    release = threading.Event()
+
+    async def run() -> float:
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1)
+        loop.set_default_executor(executor)
+        # Keep the only worker busy so the search is queued, not running.
+        blocker = loop.run_in_executor(None, release.wait)
+        task = asyncio.create_task(search.search_async(game, time_limit=60))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        release.set()
+        started = time.monotonic()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await blocker
+        return time.monotonic() - started
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=10)) < 5
+    assert _game_state(game) == before
+
+
+def _back_rank_mate_against_a_queen() -> Game:
+    # White is down material, so only the mate wins adjudicated rollouts.
+    game = build_chess_spec("data").create_game()
+    _place(
+        game,
+        {
+            Coord(0, 0): "R",
+            Coord(0, 4): "K",
+            Coord(7, 6): "k",
+            Coord(7, 7): "q",
+            Coord(6, 5): "p",
+            Coord(6, 6): "p",
+            Coord(6, 7): "p",
+        },
+    )
+    return game
+
+
+def test_mcts_finds_mate_and_reuses_its_tree() -> None:
+    game = _back_rank_mate_against_a_queen()
+    before = _game_state(game)
+    search = MonteCarloTreeSearch(rollout_plies=4, seed=3)
+
+    result = search.search(game, 120)
+
+    assert result.move == Move(Coord(0, 0), Coord(7, 0))
+    assert result.score == 1000
+    assert result.nodes == search.root_visits == 120
+    assert not result.stopped
+    assert _game_state(game) == before
+
+    # Every root move was tried, so the tree below any of them carries over.
+    reply = next(move for move in game.legal_moves() if move.end == Coord(1, 0))
+    game.push(reply, validate=False, evaluate=True)
+    search.search(game, 1)
+    assert search.root_visits > 1
+    search.reset()
+    search.search(game, 1)
+    assert search.root_visits == 1
+
+
+def test_mcts_runs_rollouts_in_worker_processes() -> None:
+    game = _back_rank_mate_against_a_queen()
+    before = _game_state(game)
+
+    with MonteCarloTreeSearch(rollout_plies=4, workers=2, seed=3) as search:
+        result = search.search(game, 120)
+
+    assert result.move == Move(Coord(0, 0), Coord(7, 0))
+    assert result.nodes == 120
+    assert _game_state(game) == before
+
+
+def test_mcts_time_limit_and_stop() -> None:
+    game = build_exist_spec().create_game()
+    legal = {move_key(move) for move in game.legal_moves()}
+    search = MonteCarloTreeSearch(rollout_plies=4, seed=1)
+
+    result = search.search(game, time_limit=0.2)
+    assert result.stopped
+    assert result.nodes > 0
+    assert move_key(result.move) in legal
+
+    stop_event = threading.Event()
+    stop_event.set()
+    started = time.monotonic()
+    result = search.search(game, time_limit=60, stop_event=stop_event)
+    assert time.monotonic() - started < 5
+    assert result.stopped
+    assert move_key(result.move) in legal
+
+    with pytest.raises(ValueError):
+        search.search(game)
+
+
+def test_random_legal_move_samples_every_legal_move() -> None:
+    game = build_chess_spec("data").create_game()
+    legal = {move_key(move) for move in game.legal_moves()}
+    rng = random.Random(5)
+
+    drawn = {move_key(game.random_legal_move(rng)) for _ in range(400)}
+
+    assert drawn == legal
+    assert game.has_any_legal_move(True)
+
+    # The black king is boxed in: no move to draw, and the answer is shared.
+    _place(game, {Coord(0, 0): "K", Coord(5, 6): "Q", Coord(7, 7): "k"})
+    assert game.random_legal_move(rng, side=False) is None
+    assert not game.has_any_legal_move(False)
+
+
+def test_random_playouts_finish_games_and_restore_the_game() -> None:
+    game = _back_rank_mate_against_a_queen()
+    before = _game_state(game)
+
+    stats = RandomPlayout(max_plies=1, seed=2).run(game, 200)
+
+    assert stats.playouts == 200
+    assert stats.wins[True] > 0
+    assert stats.wins[True] + stats.unfinished == 200
+    assert stats.plies == 200
+    assert stats.plies_per_second > 0
+    assert _game_state(game) == before
+
+    exist = build_exist_spec().create_game()
+    exist_before = _game_state(exist)
+    result = RandomPlayout(max_plies=30, seed=2).play(exist)
+    assert 0 < result.plies <= 30
+    assert _game_state(exist) == exist_before